@@ -0,0 +1,29 @@
+"""\
+Theme Benchmarks
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This package benchmarks the build performance of this sphinx theme
+using synthetic Sphinx projects, so performance regressions in the
+theme's extensions or directives don't go unnoticed.
+
+The benchmarks are run as follows::
+
+    .. code-block:: bash
+
+        python -m benchmarks run --preset small --preset medium
+        python -m benchmarks compare .cache/benchmarks/results.json
+        python -m benchmarks generate /tmp/corpus --pages 5000 --depth 6
+
+Every build is run with the theme's profiler enabled, so besides the
+wall time of the full build, the results include the time spent in
+each phase of the build, the theme's share of it and the time spent in
+every traced hook, directive and transform. The results are saved as
+JSON and compared against `baseline.json` using relative and absolute
+thresholds.
+
+The builds run fully offline, see `benchmarks.standins`.
+"""
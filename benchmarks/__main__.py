@@ -0,0 +1,543 @@
+"""\
+Benchmark Runner
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module is the command line interface of the benchmarks. It
+generates the synthetic projects, builds them in a fresh process with
+the theme's profiler enabled, saves the results as JSON and compares
+them against a stored baseline.
+
+The baseline is machine dependent. After changing the machine (or the
+benchmarks themselves), record a new one using `--save-baseline`.
+
+The `imports` command guards the startup time of the theme instead. It
+imports the theme in a fresh process using `python -X importtime`, after
+the modules Sphinx imports anyway, and fails if the import takes longer
+than the budget or loads any of the heavy dependencies which the theme
+only needs on first use (like BeautifulSoup).
+
+The `search` command measures the offline search. It builds a project
+with the search index enabled and reports the size of the index, both
+as is and gzipped, the bytes fetched by the first query, and the latency
+of the queries. The queries are answered by a port of the client-side
+script, which loads and parses the files of the index it needs on every
+query, like a visitor's first query.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gzip
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import typing as t
+from itertools import pairwise
+from pathlib import Path
+
+import sphinx
+
+from benchmarks import corpus
+from theme.extensions.profiling import themed
+from theme.extensions.search import shard
+
+
+root: t.Final[Path] = Path(__file__).resolve().parent.parent
+workdir: t.Final[Path] = root / ".cache" / "benchmarks"
+baseline: t.Final[Path] = Path(__file__).resolve().parent / "baseline.json"
+PRELOADED: t.Final[tuple[str, ...]] = (
+    "docutils.parsers.rst",
+    "sphinx.application",
+    "sphinx.writers.html",
+    "sphinx.builders.html",
+)
+HEAVY: t.Final[frozenset[str]] = frozenset(
+    {"PIL", "brotli", "bs4", "pytube", "requests", "soupsieve"}
+)
+WORD: re.Pattern[str] = re.compile(r"\w+")
+
+
+def project(spec: corpus.corpus) -> Path:
+    """Return the source directory of a corpus, generating it once.
+
+    :param spec: Shape of the project.
+    :return: Source directory of the project.
+    """
+    source = workdir / "corpus" / spec.digest()
+    if not (source / ".complete").exists():
+        corpus.generate(spec, source)
+        (source / ".complete").touch()
+    return source
+
+
+def build(
+    source: Path,
+    jobs: int,
+    options: list[str],
+) -> dict[str, float]:
+    """Build a project once and return its metrics.
+
+    The project is built from scratch in a separate process, with an
+    empty build cache, so nothing is reused from an earlier run.
+
+    :param source: Source directory of the project.
+    :param jobs: Number of parallel jobs, passed as `-j`.
+    :param options: Extra theme options, passed as `-A`.
+    :return: Mapping of the metric names and their values in
+        milliseconds.
+    """
+    scratch = workdir / "build"
+    if scratch.exists():
+        shutil.rmtree(scratch)
+    trace = scratch / "trace.json"
+    cmd = [
+        sys.executable,
+        "-m",
+        "sphinx",
+        "-b",
+        "dirhtml",
+        "-q",
+        "-E",
+        "-j",
+        str(jobs),
+        "-A",
+        "profile=1",
+        "-A",
+        f"profile_output={trace}",
+        *(arg for option in options for arg in ("-A", option)),
+        str(source),
+        str(scratch / "html"),
+    ]
+    env = dict(os.environ)
+    env["THEME_CACHE_DIR"] = str(scratch / "cache")
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(root), env.get("PYTHONPATH")))
+    )
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, env=env, cwd=root)  # noqa: S603
+    metrics = {"build": (time.perf_counter() - start) * 1000}
+    with open(trace, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    pid = next(
+        event["pid"]
+        for event in events
+        if event["ph"] == "M" and event["args"]["name"] == "main"
+    )
+    for event in events:
+        if event["ph"] != "X":
+            continue
+        if event["cat"] == "phase":
+            begin, end = event["ts"], event["ts"] + event["dur"]
+            metrics[f"phase.{event['name']}"] = event["dur"] / 1000
+            metrics[f"theme.{event['name']}"] = (
+                themed(events, begin, end, pid) / 1000
+            )
+        else:
+            name = f"span.{event['name']}"
+            metrics[name] = metrics.get(name, 0.0) + event["dur"] / 1000
+    return metrics
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the benchmarks and compare them against the baseline.
+
+    :param args: Parsed command line arguments.
+    :return: Exit status of the command.
+    """
+    scenarios: dict[str, t.Any] = {}
+    for preset in args.preset or ["small"]:
+        spec = corpus.presets[preset]
+        source = project(spec)
+        samples = [
+            build(source, args.jobs, args.option or [])
+            for _ in range(args.repeat)
+        ]
+        metrics = {
+            name: round(
+                statistics.median(sample.get(name, 0.0) for sample in samples),
+                3,
+            )
+            for name in sorted(set().union(*samples))
+        }
+        scenarios[preset] = {
+            "corpus": dataclasses.asdict(spec),
+            "repeat": args.repeat,
+            "jobs": args.jobs,
+            "metrics": metrics,
+        }
+        print(f"{preset}: {metrics['build']:.0f} ms")
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "sphinx": sphinx.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "scenarios": scenarios,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {output}")
+    if args.save_baseline:
+        results["thresholds"] = {"relative": 0.25, "absolute": 100}
+        if args.baseline.exists():
+            stored = json.loads(args.baseline.read_text())
+            results["thresholds"] = stored.get("thresholds", {})
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        return 0
+    args.results = output
+    return compare(args)
+
+
+def importtime() -> tuple[float, list[str]]:
+    """Import the theme once in a fresh process and return its cost.
+
+    The modules imported by Sphinx for every build are imported first,
+    so only the theme's own imports are measured.
+
+    :return: Tuple of the cumulative import time of the theme in
+        milliseconds and the names of the modules it imported.
+    """
+    code = f"import {', '.join(PRELOADED)}; import theme"
+    env = dict(os.environ)
+    # NOTE(xames3): Without the bytecode, every sample would measure the
+    # compilation of the theme's modules instead of their import.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(root), env.get("PYTHONPATH")))
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        env=env,
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    # NOTE(xames3): A module is reported once its own imports are, with
+    # them indented below it, so the modules imported by the theme are
+    # the ones reported since the last top-level module.
+    modules: list[str] = []
+    pending: list[str] = []
+    elapsed = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            pending.append(name.strip())
+        elif name.strip() == "theme":
+            elapsed = int(cumulative) / 1000
+            modules = [*pending, "theme"]
+        else:
+            pending = []
+    return elapsed, modules
+
+
+def imports(args: argparse.Namespace) -> int:
+    """Check the import time of the theme against its budget.
+
+    :param args: Parsed command line arguments.
+    :return: Exit status of the command.
+    """
+    # NOTE(xames3): The first import compiles and caches the bytecode of
+    # the theme's modules, so it's discarded like a warm-up round.
+    importtime()
+    samples = [importtime() for _ in range(args.repeat)]
+    elapsed = statistics.median(sample[0] for sample in samples)
+    loaded = sorted(
+        {
+            module.partition(".")[0]
+            for _, modules in samples
+            for module in modules
+        }
+        & HEAVY
+    )
+    failed = 0
+    if loaded:
+        print(f"Heavy modules imported by the theme: {', '.join(loaded)}")
+        failed = 1
+    regressed = elapsed > args.budget
+    status = "REGRESSED" if regressed else "ok"
+    print(f"theme {elapsed:10.1f} ms (budget {args.budget:.0f} ms) {status}")
+    if regressed:
+        failed = 1
+    if args.verbose:
+        for module in samples[0][1]:
+            print(f"  {module}")
+    return failed
+
+
+def load(directory: Path, name: str) -> t.Any:
+    """Load a file of the search index.
+
+    :param directory: Directory of the search index.
+    :param name: Name of the file, without its extension.
+    :return: The data passed by the file to the client-side search.
+    """
+    text = (directory / f"{name}.js").read_text(encoding="utf-8")
+    return json.loads(text[text.index(",") + 1 : text.rindex(")")])
+
+
+def lookup(directory: Path, text: str, limit: int = 8) -> list[str]:
+    """Answer a query like the client-side search does.
+
+    :param directory: Directory of the search index.
+    :param text: The query.
+    :param limit: Maximum number of the results.
+    :return: URLs of the matching documents, the best ones first.
+    """
+    index = load(directory, "index")
+    prefix = index["prefix"]
+    words = [
+        word
+        for word in WORD.findall(text.lower())
+        if len(word) >= prefix and word not in index["stopwords"]
+    ]
+    names = [shard(word) for word in words]
+    if not words or not set(names) <= set(index["shards"]):
+        return []
+    totals: dict[int, int] | None = None
+    for position, (word, name) in enumerate(zip(words, names, strict=True)):
+        rest = word[prefix:]
+        partial = not text[-1].isspace() and position == len(words) - 1
+        scores: dict[int, int] = {}
+        for suffix, postings in load(directory, name).items():
+            exact = suffix == rest
+            if not exact and not (partial and suffix.startswith(rest)):
+                continue
+            docid = 0
+            for delta, score in zip(postings[::2], postings[1::2], strict=True):
+                docid += delta
+                score *= 2 if exact else 1
+                scores[docid] = max(scores.get(docid, 0), score)
+        totals = (
+            scores
+            if totals is None
+            else {
+                docid: score + scores[docid]
+                for docid, score in totals.items()
+                if docid in scores
+            }
+        )
+    ranked = sorted(
+        (totals or {}).items(), key=lambda item: (-item[1], item[0])
+    )
+    chunk = index["chunk"]
+    documents: dict[int, list[list[str]]] = {}
+    results = []
+    for docid, _ in ranked[:limit]:
+        if docid // chunk not in documents:
+            documents[docid // chunk] = load(
+                directory, f"docs-{docid // chunk}"
+            )
+        results.append(documents[docid // chunk][docid % chunk][0])
+    return results
+
+
+def search(args: argparse.Namespace) -> int:
+    """Measure the size of the search index and the query latency.
+
+    :param args: Parsed command line arguments.
+    :return: `1` if the first query fetches more than the budget,
+        otherwise `0`.
+    """
+    failed = 0
+    for preset in args.preset or ["small"]:
+        source = project(corpus.presets[preset])
+        options = ["search_index=1", *(args.option or [])]
+        metrics = build(source, 1, options)
+        written = metrics.get("span.search.build_finished", 0.0)
+        directory = workdir / "build" / "html" / "_search"
+        sizes = {
+            path.stem: (
+                path.stat().st_size,
+                len(gzip.compress(path.read_bytes(), 9)),
+            )
+            for path in directory.glob("*.js")
+        }
+        shards = sorted(
+            compressed
+            for name, (_, compressed) in sizes.items()
+            if name != "index" and not name.startswith("docs-")
+        )
+        first = sizes["index"][1] + shards[-1] + sizes["docs-0"][1]
+        queries = [
+            *corpus.WORDS,
+            *(word[:3] for word in corpus.WORDS),
+            *(f"{a} {b}" for a, b in pairwise(corpus.WORDS)),
+        ]
+        latencies = []
+        for _ in range(args.repeat):
+            for query in queries:
+                start = time.perf_counter()
+                lookup(directory, query)
+                latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        print(
+            f"{preset}: {len(sizes)} file(s), "
+            f"{sum(raw for raw, _ in sizes.values()) / 1024:.1f} KiB, "
+            f"{sum(gz for _, gz in sizes.values()) / 1024:.1f} KiB gzipped, "
+            f"written in {written:.0f} ms"
+        )
+        print(
+            f"{preset}: shards {statistics.median(shards) / 1024:.1f} KiB "
+            f"median, {shards[-1] / 1024:.1f} KiB largest (gzipped)"
+        )
+        regressed = first / 1024 > args.budget
+        status = "REGRESSED" if regressed else "ok"
+        print(
+            f"{preset}: first query fetches {first / 1024:.1f} KiB "
+            f"(budget {args.budget:.0f} KiB) {status}"
+        )
+        print(
+            f"{preset}: query {statistics.median(latencies):.2f} ms median, "
+            f"{latencies[int(len(latencies) * 0.95)]:.2f} ms p95 "
+            f"over {len(latencies)} queries"
+        )
+        failed |= regressed
+    return int(failed)
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare the results of a run against the baseline.
+
+    A metric regresses if it's slower than the baseline by more than the
+    relative threshold and by more than the absolute threshold (in
+    milliseconds), the latter keeping noise of small metrics out.
+
+    :param args: Parsed command line arguments.
+    :return: `1` if any metric regressed, otherwise `0`.
+    """
+    results = json.loads(Path(args.results).read_text())
+    stored = json.loads(args.baseline.read_text())
+    thresholds = stored.get("thresholds", {})
+    relative = args.relative or thresholds.get("relative", 0.25)
+    absolute = args.absolute or thresholds.get("absolute", 100)
+    regressions = 0
+    for name, scenario in results["scenarios"].items():
+        reference = stored["scenarios"].get(name)
+        if reference is None:
+            print(f"{name}: not in the baseline, skipped")
+            continue
+        if reference["corpus"] != scenario["corpus"]:
+            print(f"{name}: corpus differs from the baseline, skipped")
+            continue
+        for metric, before in sorted(reference["metrics"].items()):
+            after = scenario["metrics"].get(metric)
+            if after is None:
+                continue
+            delta = after - before
+            ratio = after / before if before else float("inf")
+            regressed = delta > absolute and ratio > 1 + relative
+            if regressed or args.verbose:
+                status = "REGRESSED" if regressed else "ok"
+                print(
+                    f"{name:8} {metric:48} {before:10.1f} -> {after:10.1f} "
+                    f"ms ({ratio - 1:+.0%}) {status}"
+                )
+            regressions += regressed
+    print(f"{regressions} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    """Generate a synthetic project.
+
+    :param args: Parsed command line arguments.
+    :return: Exit status of the command.
+    """
+    spec = corpus.presets[args.preset]
+    overrides = {
+        field.name: getattr(args, field.name)
+        for field in dataclasses.fields(spec)
+        if getattr(args, field.name) is not None
+    }
+    spec = dataclasses.replace(spec, **overrides)
+    print(f"Generated {corpus.generate(spec, args.directory)}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line arguments and run the command.
+
+    :param argv: Command line arguments, defaults to `sys.argv`.
+    :return: Exit status of the command.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--baseline", type=Path, default=baseline)
+    commands = parser.add_subparsers(dest="command", required=True)
+    runner = commands.add_parser("run", help="run the benchmarks")
+    runner.add_argument(
+        "--preset", action="append", choices=sorted(corpus.presets)
+    )
+    runner.add_argument("--repeat", type=int, default=3)
+    runner.add_argument("--jobs", type=int, default=1)
+    runner.add_argument(
+        "--option",
+        action="append",
+        metavar="NAME=VALUE",
+        help="theme option passed to sphinx-build as -A",
+    )
+    runner.add_argument("--output", default=workdir / "results.json")
+    runner.add_argument("--save-baseline", action="store_true")
+    runner.add_argument("--relative", type=float)
+    runner.add_argument("--absolute", type=float)
+    runner.add_argument("--verbose", action="store_true")
+    runner.set_defaults(handler=run)
+    comparer = commands.add_parser("compare", help="compare results")
+    comparer.add_argument("results")
+    comparer.add_argument("--relative", type=float)
+    comparer.add_argument("--absolute", type=float)
+    comparer.add_argument("--verbose", action="store_true")
+    comparer.set_defaults(handler=compare)
+    checker = commands.add_parser("imports", help="check the import time")
+    checker.add_argument("--repeat", type=int, default=5)
+    checker.add_argument("--budget", type=float, default=50.0)
+    checker.add_argument("--verbose", action="store_true")
+    checker.set_defaults(handler=imports)
+    searcher = commands.add_parser("search", help="measure the search")
+    searcher.add_argument(
+        "--preset", action="append", choices=sorted(corpus.presets)
+    )
+    searcher.add_argument("--repeat", type=int, default=5)
+    searcher.add_argument("--budget", type=float, default=16.0)
+    searcher.add_argument(
+        "--option",
+        action="append",
+        metavar="NAME=VALUE",
+        help="theme option passed to sphinx-build as -A",
+    )
+    searcher.set_defaults(handler=search)
+    generator = commands.add_parser("generate", help="generate a project")
+    generator.add_argument("directory", type=Path)
+    generator.add_argument(
+        "--preset", default="small", choices=sorted(corpus.presets)
+    )
+    for field in dataclasses.fields(corpus.corpus):
+        generator.add_argument(
+            f"--{field.name}",
+            type=int if field.type in {"int", int} else float,
+        )
+    generator.set_defaults(handler=generate)
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""\
+Synthetic Corpus Generator
+==========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module generates synthetic Sphinx projects for benchmarking this
+sphinx theme. The shape of a project is described by a `corpus`, which
+scales the number of pages (into the thousands), the depth of the
+toctree, the number of headings per page, and the density of external
+links and of the theme's `picture`, `youtube`, `author` and `repository`
+directives.
+
+The generated content is deterministic for a given corpus (including
+its seed), so two runs of the benchmarks always build the exact same
+project. The remote resources referenced by the pages are served by the
+local server of `benchmarks.standins` during the build.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import math
+import pprint
+import random
+import shutil
+import typing as t
+from pathlib import Path
+
+
+if t.TYPE_CHECKING:
+    import os
+
+WORDS: t.Final[tuple[str, ...]] = (
+    "activation",
+    "batch",
+    "container",
+    "derivative",
+    "embedding",
+    "gradient",
+    "kernel",
+    "layer",
+    "matrix",
+    "neuron",
+    "optimiser",
+    "parameter",
+    "quantisation",
+    "regression",
+    "sampling",
+    "tensor",
+    "vector",
+    "weight",
+)
+
+CONF: t.Final[str] = '''\
+"""Configuration of a synthetic benchmark project."""
+
+from benchmarks import standins
+
+project = "Benchmark"
+author = "Benchmark"
+extensions = []
+html_theme = "theme"
+html_title = ""
+html_permalinks_icon = ""
+html_baseurl = "https://bench.invalid/"
+ogp_site_url = html_baseurl
+ogp_social_cards = {{"enable": False}}
+html_context = {context}
+html_context.update(standins.install())
+'''
+
+CONTEXT: t.Final[dict[str, t.Any]] = {
+    "add_copy_to_headerlinks": True,
+    "fa_icons": {
+        "breadcrumb_home": "fa-regular fa-house",
+        "breadcrumb_separator_child": "fa-solid fa-angle-right",
+        "breadcrumb_separator_parent": "fa-solid fa-angles-right",
+        "dark_mode": "fa-solid fa-moon-star",
+        "light_mode": "fa-solid fa-sun-bright",
+        "next_button": "fa-solid fa-arrow-right",
+        "previous_button": "fa-solid fa-arrow-left",
+    },
+    "favicons": {
+        "manifest": "favicons/site.webmanifest",
+        "size_16": "favicons/favicon-16x16.png",
+        "size_32": "favicons/favicon-32x32.png",
+        "size_180": "favicons/apple-touch-icon.png",
+    },
+    "open_links_in_new_tab": True,
+    "project": {
+        "author": "Benchmark",
+        "source": "https://github.com/bench/bench",
+        "email": "bench@bench.invalid",
+    },
+    "secondary_toctree_title": "On this page",
+    "show_breadcrumbs": True,
+    "show_last_updated_on": True,
+    "show_previous_next_pages": True,
+    "show_toctree": True,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class corpus:
+    """Class to represent the shape of a synthetic Sphinx project.
+
+    :param pages: Number of pages, excluding the root document.
+    :param depth: Maximum depth of the toctree.
+    :param headings: Number of sections per page, every other section
+        has a nested subsection.
+    :param links: Number of external links per page.
+    :param pictures: Number of `picture` directives per page.
+    :param youtubes: Number of `youtube` directives per page.
+    :param authors: Fraction of the pages with an `author` directive.
+    :param repositories: Number of `repository` directives per page,
+        referencing a pool of twenty repositories.
+    :param seed: Seed of the generated content.
+    """
+
+    pages: int = 100
+    depth: int = 3
+    headings: int = 6
+    links: int = 5
+    pictures: float = 0.5
+    youtubes: float = 0.2
+    authors: float = 0.5
+    repositories: float = 0.0
+    seed: int = 0
+
+    def digest(self) -> str:
+        """Return a stable digest of the corpus, used for caching it.
+
+        The configuration of the project is a part of the digest, so the
+        cached projects are generated again whenever it changes.
+        """
+        data = json.dumps(dataclasses.asdict(self), sort_keys=True)
+        return hashlib.sha256((CONF + data).encode()).hexdigest()[:16]
+
+    def fanout(self) -> int:
+        """Return the number of children per page of the toctree."""
+        if self.depth <= 1:
+            return max(1, self.pages)
+        return max(2, math.ceil(self.pages ** (1 / self.depth)))
+
+
+presets: dict[str, corpus] = {
+    "small": corpus(pages=50),
+    "medium": corpus(pages=500, depth=4),
+    "large": corpus(pages=2000, depth=4),
+    "deep": corpus(pages=500, depth=8),
+    "media": corpus(pages=200, pictures=3, youtubes=2, authors=1, links=20),
+}
+
+
+def count(rng: random.Random, density: float) -> int:
+    """Return how many times a directive appears on a page.
+
+    :param rng: Random number generator of the corpus.
+    :param density: Mean number of occurrences per page, the fraction
+        is used as a probability of one more occurrence.
+    :return: Number of occurrences.
+    """
+    whole = int(density)
+    return whole + (rng.random() < density - whole)
+
+
+def sentence(rng: random.Random, words: int = 24) -> str:
+    """Return a sentence of random words.
+
+    :param rng: Random number generator of the corpus.
+    :param words: Number of words in the sentence.
+    :return: Sentence ending with a full stop.
+    """
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return f"{text.capitalize()}."
+
+
+def heading(title: str, underline: str) -> str:
+    """Return a reStructuredText section heading.
+
+    :param title: Title of the section.
+    :param underline: Character used for underlining the title.
+    :return: The heading followed by an empty line.
+    """
+    return f"{title}\n{underline * len(title)}\n\n"
+
+
+def images(root: Path) -> None:
+    """Write the images referenced by the `picture` directives.
+
+    The images are large enough for the image processing of the theme
+    to cost something, but compress well to keep the corpus small.
+
+    :param root: Source directory of the project.
+    """
+    from PIL import Image
+
+    target = root / "assets"
+    target.mkdir(parents=True, exist_ok=True)
+    for mode, colour in (("light", (240, 240, 240)), ("dark", (24, 24, 24))):
+        image = Image.new("RGB", (1600, 900), colour)
+        for x in range(0, 1600, 100):
+            image.paste((x % 256, 96, 160), (x, 0, x + 50, 900))
+        image.save(target / f"figure-{mode}.png", optimize=True)
+
+
+def page(spec: corpus, rng: random.Random, index: int) -> str:
+    """Return the content of a page.
+
+    :param spec: Shape of the project.
+    :param rng: Random number generator of the corpus.
+    :param index: Index of the page.
+    :return: reStructuredText source of the page.
+    """
+    parts = [heading(f"Page {index}: {sentence(rng, 3)[:-1]}", "=")]
+    if rng.random() < spec.authors:
+        parts.append(
+            ".. author::\n"
+            "    :name: Benchmark Author\n"
+            "    :about: Synthetic corpus\n"
+            f"    :avatar: https://avatars.githubusercontent.com/u/{index}\n"
+            "    :linkedin: https://linkedin.com/in/bench\n"
+            "    :timestamp: 18 October, 2026\n\n"
+        )
+    links = [
+        f"`{rng.choice(WORDS)} <https://example.com/{index}/{num}>`__"
+        for num in range(spec.links)
+    ]
+    for num in range(spec.headings):
+        parts.append(heading(f"Section {num} {rng.choice(WORDS)}", "-"))
+        text = [sentence(rng) for _ in range(3)]
+        if links:
+            text.append(f"See {links.pop()} for more.")
+        parts.append(" ".join(text) + "\n\n")
+        if num % 2:
+            parts.append(heading(f"Detail {num} {rng.choice(WORDS)}", "~"))
+            parts.append(f"{sentence(rng)}\n\n")
+            parts.append(f".. code-block:: python\n\n    x = {num}\n\n")
+    if links:
+        parts.append(f"Further reading: {', '.join(links)}.\n\n")
+    parts.extend(
+        ".. picture::\n"
+        "    :light: ../assets/figure-light.png\n"
+        "    :dark: ../assets/figure-dark.png\n"
+        f"    :alt: Figure {num}\n\n"
+        f"    Figure {num} of page {index}.\n\n"
+        for num in range(count(rng, spec.pictures))
+    )
+    for num in range(count(rng, spec.youtubes)):
+        vid = f"bench{index:05d}{num:02d}"
+        parts.append(
+            ".. youtube:: https://www.youtube.com/watch?v="
+            f"{vid}\n    :showtitle:\n\n"
+        )
+    # NOTE(xames3): The repositories are only drawn if requested, so
+    # the content of the existing corpora doesn't change.
+    repositories = count(rng, spec.repositories) if spec.repositories else 0
+    for _ in range(repositories):
+        repo = f"bench/repo{rng.randrange(20):02d}"
+        parts.append(f".. repository:: {repo}\n\n")
+    return "".join(parts)
+
+
+def generate(spec: corpus, root: str | os.PathLike[str]) -> Path:
+    """Generate a synthetic Sphinx project.
+
+    The pages form a tree, where every page lists its children in a
+    toctree. The tree is as wide as needed for the pages to fit in the
+    given depth.
+
+    :param spec: Shape of the project.
+    :param root: Directory where the project is generated, any existing
+        content is removed.
+    :return: Source directory of the project.
+    """
+    root = Path(root)
+    if root.exists():
+        shutil.rmtree(root)
+    (root / "pages").mkdir(parents=True)
+    # NOTE(xames3): The generator only needs to be reproducible, the
+    # content isn't used for anything security sensitive.
+    rng = random.Random(spec.seed)  # noqa: S311
+    fanout = spec.fanout()
+    children: dict[int, list[int]] = {}
+    for index in range(1, spec.pages + 1):
+        children.setdefault((index - 1) // fanout, []).append(index)
+    context = pprint.pformat(CONTEXT)
+    (root / "conf.py").write_text(CONF.format(context=context))
+    images(root)
+    for index in range(spec.pages + 1):
+        if index:
+            name = root / "pages" / f"{index:05d}.rst"
+            content = page(spec, rng, index)
+        else:
+            name = root / "index.rst"
+            content = heading("Benchmark", "=") + f"{sentence(rng)}\n\n"
+        toctree = children.get(index, [])
+        if toctree:
+            entries = "".join(f"    /pages/{num:05d}\n" for num in toctree)
+            content += f".. toctree::\n    :maxdepth: 2\n\n{entries}\n"
+        name.write_text(content, encoding="utf-8")
+    return root
@@ -0,0 +1,176 @@
+"""\
+Local Stand-ins
+===============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides local stand-ins for the remote services used by
+the directives of this sphinx theme, so the benchmarks run fully
+offline and are not skewed by the network.
+
+The stand-ins are served by a real HTTP server listening on the
+loopback interface, which is started by the configuration of every
+synthetic project (see `benchmarks.corpus`). The configurable endpoints
+of the theme are pointed at it, so the requests go through the same
+session, connection pool and sockets as in a real build. The server
+answers::
+
+    [1] `/oembed`, YouTube's oEmbed endpoint, with the metadata of the
+        requested video.
+    [2] `/repos/<owner>/<name>`, GitHub's repository API, with the
+        statistics of the repository.
+    [3] `/images/<path>`, any remote image, with a small JPEG image.
+
+The responses carry an `ETag`, and the conditional requests matching it
+are answered with `304 Not Modified`, like GitHub's API does. Any other
+connection to a non-loopback address is refused, so an unexpected
+network access fails the benchmark instead of silently timing the
+network.
+"""
+
+from __future__ import annotations
+
+import io
+import ipaddress
+import json
+import socket
+import threading
+import typing as t
+import urllib.parse as urlparse
+import zlib
+from functools import cache
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+
+installed: bool = False
+server: ThreadingHTTPServer | None = None
+
+
+@cache
+def image() -> bytes:
+    """Return the JPEG image served for every remote image."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (480, 360), (200, 60, 60)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def number(text: str, limit: int = 10_000) -> int:
+    """Return a deterministic number derived from a text.
+
+    :param text: Text to derive the number from.
+    :param limit: Upper bound (exclusive) of the number.
+    :return: The derived number.
+    """
+    return zlib.crc32(text.encode()) % limit
+
+
+def etag(body: bytes) -> str:
+    """Return the entity tag of a response body.
+
+    :param body: The response body.
+    :return: Quoted entity tag derived from the body.
+    """
+    return f'"{zlib.crc32(body):08x}"'
+
+
+def respond(base: str, path: str) -> tuple[int, str, bytes]:
+    """Return the response of a stand-in for a requested path.
+
+    :param base: URL of the server, used for the URLs in the responses.
+    :param path: The requested path, including the query string.
+    :return: Tuple of the status code, content type and body.
+    """
+    parts = urlparse.urlsplit(path)
+    if parts.path.startswith("/images/"):
+        return 200, "image/jpeg", image()
+    if parts.path == "/oembed":
+        target = dict(urlparse.parse_qsl(parts.query)).get("url", "")
+        vid = target.rpartition("v=")[2] or target.rpartition("/")[2]
+        data = {
+            "title": f"Benchmark video {vid}",
+            "author_name": "Benchmark",
+            "thumbnail_url": f"{base}/images/vi/{vid}/hqdefault.jpg",
+        }
+        return 200, "application/json", json.dumps(data).encode()
+    if parts.path.startswith("/repos/"):
+        repo = parts.path.removeprefix("/repos/")
+        data = {
+            "full_name": repo,
+            "stargazers_count": number(repo),
+            "open_issues_count": number(repo, 100),
+            "forks_count": number(repo, 1000),
+        }
+        return 200, "application/json", json.dumps(data).encode()
+    return 404, "text/plain", b"Not served by the benchmark stand-ins"
+
+
+class handler(BaseHTTPRequestHandler):
+    """Class to serve the requests made to the stand-ins."""
+
+    def do_GET(self) -> None:
+        """Serve a request from the stand-ins."""
+        host, port = self.server.server_address[:2]
+        status, kind, body = respond(f"http://{host}:{port}", self.path)
+        tag = etag(body)
+        if self.headers.get("If-None-Match") == tag:
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", kind)
+        self.send_header("ETag", tag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Keep the requests out of the output of the build."""
+
+
+def guard() -> None:
+    """Refuse connections to any address other than the loopback."""
+    connect = socket.socket.connect
+
+    def local(self: socket.socket, address: t.Any) -> None:
+        if self.family in {socket.AF_INET, socket.AF_INET6}:
+            try:
+                loopback = ipaddress.ip_address(address[0]).is_loopback
+            except ValueError:
+                loopback = address[0] == "localhost"
+            if not loopback:
+                msg = f"Network access is disabled for benchmarks: {address}"
+                raise OSError(msg)
+        connect(self, address)
+
+    socket.socket.connect = local  # type: ignore[method-assign]
+
+
+def start() -> str:
+    """Start the server of the stand-ins in a background thread.
+
+    :return: URL of the server.
+    """
+    global server
+    if server is None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def install() -> dict[str, str]:
+    """Start the stand-ins and refuse any other network access.
+
+    :return: Theme options pointing the remote services at the stand-ins,
+        to be merged into the `html_context` of the project.
+    """
+    global installed
+    base = start()
+    if not installed:
+        installed = True
+        guard()
+    return {"oembed_endpoint": f"{base}/oembed", "github_endpoint": base}
@@ -127,12 +127,17 @@ html_context: dict[str, t.Any] = {
         "size_32": "favicons/favicon-32x32.png",
         "size_180": "favicons/apple-touch-icon.png",
     },
+    "localize_images": True,
     "open_links_in_new_tab": True,
+    "postprocess_workers": "auto",
+    "precompress": True,
     "project": {
         "author": author,
         "source": source,
         "email": email,
     },
+    "repository_stats": True,
+    "search_index": True,
     "secondary_toctree_title": "On this page",
     "show_breadcrumbs": True,
     "show_docsearch": True,
@@ -157,6 +162,7 @@ html_context: dict[str, t.Any] = {
             "icon": Markup('<i class="fas far fa-heart"></i>'),
         },
     },
+    "youtube_facade": True,
 }
 html_favicon: t.Final[str] = "_static/favicons/favicon.ico"
 html_static_path: list[str] = ["_static"]
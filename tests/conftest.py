@@ -0,0 +1,126 @@
+"""\
+Test Fixtures
+=============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the fixtures shared by the tests of this sphinx
+theme, most notably a local HTTP server standing in for the remote
+services (like YouTube's oEmbed endpoint and GitHub's API). The theme's
+endpoints are pointed at it, so the requests go over a real socket
+instead of being mocked.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+import urllib.parse as urlparse
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from theme.extensions import remote
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class server:
+    """Class to represent a local HTTP server with canned responses.
+
+    The responses are registered by their path, and every request is
+    recorded along with its headers.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[int, dict[str, str], bytes]] = {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self.handler())
+        host, port = self.httpd.server_address[:2]
+        self.url = f"http://{host}:{port}"
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        """Return the request handler serving the registered routes."""
+        owner = self
+
+        class handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                owner.requests.append((self.path, dict(self.headers)))
+                path = urlparse.urlsplit(self.path).path
+                status, headers, body = owner.routes.get(
+                    path, (404, {}, b"Not found")
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+                """Keep the requests out of the output of the tests."""
+
+        return handler
+
+    def json(
+        self,
+        path: str,
+        data: t.Any,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Register a JSON response.
+
+        :param path: Path of the response.
+        :param data: Data of the response.
+        :param status: Status code of the response, defaults to `200`.
+        :param headers: Additional headers of the response.
+        """
+        self.routes[path] = (
+            status,
+            {"Content-Type": "application/json", **(headers or {})},
+            json.dumps(data).encode(),
+        )
+
+    def paths(self) -> list[str]:
+        """Return the paths of the recorded requests, without queries."""
+        return [urlparse.urlsplit(path).path for path, _ in self.requests]
+
+
+@pytest.fixture
+def httpd() -> Iterator[server]:
+    """Run a local HTTP server for the duration of a test."""
+    instance = server()
+    thread = threading.Thread(
+        target=instance.httpd.serve_forever, kwargs={"poll_interval": 0.01}
+    )
+    thread.start()
+    yield instance
+    instance.httpd.shutdown()
+    instance.httpd.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Return a stand-in of the Sphinx application with its own cache.
+
+    The state of the remote fetches is reset, so every test starts with
+    a reachable network and a fresh session.
+    """
+    monkeypatch.setattr(remote, "unreachable", False)
+    monkeypatch.setattr(remote, "_session", None)
+    monkeypatch.delenv("THEME_OFFLINE", raising=False)
+    context = {"cache_dir": str(tmp_path / "cache"), "remote_workers": 2}
+    return SimpleNamespace(
+        config=SimpleNamespace(html_context=context),
+        outdir=str(tmp_path / "html"),
+    )
@@ -0,0 +1,108 @@
+"""\
+Bundle Minifier Tests
+=====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Round-trip tests of the stylesheet and script minifiers used for the
+theme's asset bundles, see `theme.extensions.bundles`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions.bundles import minify_css
+from theme.extensions.bundles import minify_js
+
+
+STYLESHEET = """\
+/*! Licensed under MIT */
+@import url("base.css");
+
+/* Links */
+a::before {
+  content: "/* not a comment */";
+  background: url( "img/a b.png" ) no-repeat;
+  font-family: 'Open Sans', sans-serif;
+}
+
+.note > p , .tip {
+  margin: 0 auto ;
+  background: url(data:image/png;base64,iVBORw0KGgo=);
+}
+
+a/**/b { color: red; }
+"""
+
+SCRIPT = """\
+/*! Licensed under MIT */
+// Selects the first link.
+const quote = "// not a comment";   /* trailing */
+const block = '/* not a comment */', url = `url(${quote}) // kept`;
+const pattern = /\\/\\*[^/]*\\*\\//g;  const ratio = 4 / 2 / 1;
+function first(links) {
+    return   links[0];
+}
+"""
+
+
+def test_css_keeps_the_strings() -> None:
+    minified = minify_css(STYLESHEET)
+    assert 'content:"/* not a comment */"' in minified
+    assert "font-family:'Open Sans',sans-serif" in minified
+
+
+def test_css_removes_the_comments() -> None:
+    minified = minify_css(STYLESHEET)
+    assert "Links" not in minified
+    assert minified.startswith("/*! Licensed under MIT */\n")
+    assert "a b{color:red}" in minified
+
+
+def test_css_keeps_the_urls() -> None:
+    minified = minify_css(STYLESHEET)
+    assert '@import url("base.css");' in minified
+    assert 'background:url( "img/a b.png" ) no-repeat' in minified
+    assert "url(data:image/png;base64,iVBORw0KGgo=)" in minified
+
+
+def test_css_collapses_the_whitespace() -> None:
+    minified = minify_css(STYLESHEET)
+    assert ".note>p,.tip{margin:0 auto;" in minified
+    assert "  " not in minified
+
+
+def test_js_keeps_the_strings_and_template_literals() -> None:
+    minified = minify_js(SCRIPT)
+    assert 'const quote = "// not a comment";' in minified
+    assert "const block = '/* not a comment */'," in minified
+    assert "`url(${quote}) // kept`" in minified
+
+
+def test_js_removes_the_comments() -> None:
+    minified = minify_js(SCRIPT)
+    assert "Selects" not in minified
+    assert "trailing" not in minified
+    assert minified.startswith("/*! Licensed under MIT */\n")
+
+
+def test_js_keeps_the_regular_expressions_and_divisions() -> None:
+    minified = minify_js(SCRIPT)
+    assert "const pattern = /\\/\\*[^/]*\\*\\//g;" in minified
+    assert "const ratio = 4 / 2 / 1;" in minified
+
+
+def test_js_removes_the_indentation() -> None:
+    assert "\nreturn links[0];\n" in minify_js(SCRIPT)
+
+
+@pytest.mark.parametrize(
+    ("minify", "text"),
+    ((minify_css, STYLESHEET), (minify_js, SCRIPT)),
+)
+def test_minifying_twice_is_stable(minify, text) -> None:
+    once = minify(text)
+    assert minify(once) == once
@@ -0,0 +1,47 @@
+"""\
+Precompressed Output Tests
+==========================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the precompressed siblings of the build's output, see
+`theme.extensions.compress`.
+"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from types import SimpleNamespace
+
+import brotli
+import pytest
+
+from theme.extensions import compress
+
+
+@pytest.fixture
+def page(app, tmp_path):
+    app.builder = SimpleNamespace(format="html")
+    app.doctreedir = str(tmp_path / "doctrees")
+    html = Path(app.outdir, "index.html")
+    html.parent.mkdir(parents=True)
+    html.write_text("<p>Hello, world!</p>\n" * 100, encoding="utf-8")
+    return html
+
+
+@pytest.mark.parametrize("value", (False, 0, "0", "false", "off"))
+def test_disabled_unless_the_option_is_set(app, page, value) -> None:
+    app.config.html_context["precompress"] = value
+    compress.build_finished(app, None)
+    assert sorted(page.parent.iterdir()) == [page]
+
+
+def test_writes_the_gzip_and_brotli_siblings(app, page) -> None:
+    app.config.html_context["precompress"] = "true"
+    compress.build_finished(app, None)
+    data = page.read_bytes()
+    assert gzip.decompress(Path(f"{page}.gz").read_bytes()) == data
+    assert brotli.decompress(Path(f"{page}.br").read_bytes()) == data
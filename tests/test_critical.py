@@ -0,0 +1,122 @@
+"""\
+Critical CSS Tests
+==================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the extraction of the critical CSS, see
+`theme.extensions.critical`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions.critical import cap
+from theme.extensions.critical import extract
+from theme.extensions.critical import matches
+from theme.extensions.critical import rank
+from theme.extensions.critical import scanned
+
+
+@pytest.fixture
+def found() -> scanned:
+    return scanned(
+        [],
+        {"site-header", "site-header__icon-link", "toctree-l1", "current"},
+        {"left-sidebar"},
+        {"a", "body", "html", "li", "ul"},
+    )
+
+
+@pytest.mark.parametrize(
+    "selector",
+    (
+        ".site-header",
+        "#left-sidebar ul>li.toctree-l1",
+        "html[data-theme=dark] .site-header__icon-link",
+        "a::after",
+        ".toctree-l1:not(.current)",
+        "body",
+    ),
+)
+def test_matches_the_scanned_names(selector, found) -> None:
+    assert matches(selector, found)
+
+
+@pytest.mark.parametrize(
+    "selector",
+    (
+        ".site-footer",
+        "#right-sidebar",
+        "table td",
+        ".site-header:hover",
+        "a:focus-visible",
+        "::selection",
+    ),
+)
+def test_does_not_match_the_other_names(selector, found) -> None:
+    assert not matches(selector, found)
+
+
+def test_extract_keeps_the_matching_selectors(found) -> None:
+    css = ".site-header,.site-footer{color:red}.site-footer{color:blue}"
+    assert extract(css, found) == ".site-header{color:red}"
+
+
+def test_extract_keeps_the_nested_rules(found) -> None:
+    css = (
+        "@media (max-width:768px){.site-header{display:none}"
+        "table{width:100%}}@media print{table{width:100%}}"
+    )
+    expected = "@media (max-width:768px){.site-header{display:none}}"
+    assert extract(css, found) == expected
+
+
+def test_extract_skips_the_font_faces_and_relative_urls(found) -> None:
+    css = (
+        '@font-face{font-family:x;src:url("x.woff2")}'
+        '.site-header{background:url("img/a.png")}'
+        ".site-header__icon-link{background:url(data:image/png;base64,A)}"
+    )
+    expected = (
+        ".site-header__icon-link{background:url(data:image/png;base64,A)}"
+    )
+    assert extract(css, found) == expected
+
+
+def test_extract_keeps_the_strings(found) -> None:
+    css = '.site-header::before{content:"}{"}'
+    assert extract(css, found) == css
+
+
+def test_cap_keeps_whole_rules_in_order() -> None:
+    css = "a{color:red}b{color:blue}i{color:green}"
+    assert cap(css, 25) == "a{color:red}b{color:blue}"
+    assert cap(css, 24) == "a{color:red}"
+    assert cap(css, 26) == "a{color:red}b{color:blue}"
+    assert cap("a{color:#fff000}b{x:1}", 12) == "b{x:1}"
+    assert cap(css, 1024) == css
+
+
+@pytest.mark.parametrize(
+    ("prelude", "body", "expected"),
+    (
+        (":root", "--x:1", 0),
+        ('html[data-theme="dark"] body', "color:red", 0),
+        (".site-header__title", "color:red", 1),
+        ("#left-sidebar li.toctree-l1", "color:red", 1),
+        (".site-page__content", "color:red", 2),
+        ("@media (min-width:768px)", ".site-page{x:1}.site-sidebar{x:1}", 1),
+    ),
+)
+def test_rank_prefers_the_base_and_chrome_rules(prelude, body, expected):
+    assert rank(prelude, body) == expected
+
+
+def test_cap_keeps_the_best_ranked_rules_first() -> None:
+    css = ".site-page{color:red}:root{--x:1}.site-header{color:blue}"
+    assert cap(css, 40) == ":root{--x:1}.site-header{color:blue}"
+    assert cap(css, 20) == ":root{--x:1}"
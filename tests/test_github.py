@@ -0,0 +1,106 @@
+"""\
+GitHub Repository Stats Tests
+=============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the fetching and caching of the stats of the repositories,
+against a local stand-in of GitHub's API, see
+`theme.extensions.github`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions import github
+
+
+REPOSITORY = {
+    "full_name": "xames3/smart",
+    "stargazers_count": 42,
+    "forks_count": 7,
+    "open_issues_count": 3,
+}
+STATS = {"stars": 42, "forks": 7, "issues": 3}
+ETAG = '"5f1d"'
+
+
+@pytest.fixture
+def api(app, httpd, monkeypatch):
+    monkeypatch.setattr(github, "attempted", set())
+    monkeypatch.setattr(github, "limited", False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    app.config.html_context["github_endpoint"] = f"{httpd.url}/"
+    return httpd
+
+
+def test_lookup_fetches_and_caches_the_stats(app, api) -> None:
+    api.json("/repos/xames3/smart", REPOSITORY, headers={"ETag": ETAG})
+    assert github.lookup(app, "xames3/smart") == STATS
+    assert github.lookup(app, "xames3/smart") == STATS
+    assert api.paths() == ["/repos/xames3/smart"]
+    _, headers = api.requests[0]
+    assert headers["Accept"] == "application/vnd.github+json"
+    assert "Authorization" not in headers
+    assert "If-None-Match" not in headers
+
+
+def test_expired_stats_are_revalidated(app, api) -> None:
+    app.config.html_context["github_ttl"] = 0
+    api.json("/repos/xames3/smart", REPOSITORY, headers={"ETag": ETAG})
+    github.prefetch(app, {"xames3/smart"})
+    api.routes["/repos/xames3/smart"] = (304, {"ETag": ETAG}, b"")
+    github.attempted.clear()
+    github.prefetch(app, {"xames3/smart"})
+    _, headers = api.requests[-1]
+    assert headers["If-None-Match"] == ETAG
+    assert github.lookup(app, "xames3/smart") == STATS
+
+
+def test_requests_are_authenticated_with_the_token(
+    app, api, monkeypatch
+) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    api.json("/repos/xames3/smart", REPOSITORY)
+    github.lookup(app, "xames3/smart")
+    _, headers = api.requests[0]
+    assert headers["Authorization"] == "Bearer secret"
+
+
+def test_missing_repositories_are_cached(app, api) -> None:
+    api.json("/repos/xames3/missing", {"message": "Not Found"}, status=404)
+    assert github.fetch(app, "xames3/missing")
+    assert github.lookup(app, "xames3/missing") == {}
+    assert github.cached(app, "xames3/missing")["stats"] is None
+    assert len(api.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    ({"full_name": "xames3/smart"}, ["not", "an", "object"]),
+)
+def test_invalid_payloads_are_not_cached(app, api, data) -> None:
+    api.json("/repos/xames3/smart", data)
+    assert not github.fetch(app, "xames3/smart")
+    assert github.cached(app, "xames3/smart") is None
+
+
+def test_rate_limit_stops_the_fetching(app, api) -> None:
+    api.json("/repos/xames3/one", {"message": "Rate limited"}, status=403)
+    api.json("/repos/xames3/two", REPOSITORY)
+    assert not github.fetch(app, "xames3/one")
+    assert github.limited
+    assert not github.fetch(app, "xames3/two")
+    assert api.paths() == ["/repos/xames3/one"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    ((True, True), ("yes", True), ("false", False), ("0", False)),
+)
+def test_repository_stats_is_parsed_as_a_boolean(app, value, expected):
+    app.config.html_context["repository_stats"] = value
+    assert github.enabled(app) is expected
@@ -0,0 +1,111 @@
+"""\
+Git History Index Tests
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the index of the last commit dates, against a temporary git
+repository, see `theme.extensions.history`.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+
+import pytest
+
+from theme.extensions import cache
+from theme.extensions import history
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    top = tmp_path / "repository"
+    (top / "docs").mkdir(parents=True)
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    git(top, "init", "--quiet")
+    commit(top, "index.rst", "2026-01-02T10:00:00")
+    commit(top, "about.rst", "2026-03-04T10:00:00")
+    commit(top, "index.rst", "2026-05-06T10:00:00")
+    return top
+
+
+def git(top, *args: str, **env: str) -> None:
+    subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=top,
+        check=True,
+        capture_output=True,
+        env={**os.environ, **env},
+    )
+
+
+def commit(top, name: str, on: str) -> None:
+    path = top / "docs" / name
+    path.write_text(f"{on}\n", encoding="utf-8")
+    git(top, "add", ".")
+    git(
+        top,
+        "-c",
+        "commit.gpgsign=false",
+        "commit",
+        "--quiet",
+        "-m",
+        name,
+        GIT_AUTHOR_DATE=on,
+        GIT_COMMITTER_DATE=on,
+    )
+
+
+@pytest.fixture
+def docs(app, repository, monkeypatch):
+    app.srcdir = str(repository / "docs")
+    monkeypatch.setattr(history, "root", None)
+    monkeypatch.setattr(history, "dates", {})
+    return app
+
+
+def test_build_indexes_the_last_commit_dates(docs, repository) -> None:
+    history.build(docs)
+    assert history.lookup(repository / "docs" / "index.rst") == "May 06, 2026"
+    assert history.lookup(repository / "docs" / "about.rst") == "March 04, 2026"
+    assert history.lookup(repository / "docs" / "missing.rst") == ""
+    assert history.lookup(repository.parent / "outside.rst") == ""
+
+
+def test_the_index_is_cached_per_commit(docs, repository, monkeypatch) -> None:
+    history.build(docs)
+
+    def walk(*_: object) -> dict[str, str]:
+        raise AssertionError("the history was walked again")
+
+    monkeypatch.setattr(history, "walk", walk)
+    history.build(docs)
+    assert history.lookup(repository / "docs" / "index.rst") == "May 06, 2026"
+
+
+def test_outside_a_repository_the_index_is_empty(app, tmp_path) -> None:
+    app.srcdir = str(tmp_path)
+    history.build(app)
+    assert history.root is None
+    assert history.lookup(tmp_path / "index.rst") == ""
+
+
+def test_build_finished_prunes_the_cache(docs, monkeypatch) -> None:
+    history.build(docs)
+    store = history.history_cache(docs)
+    assert any(store.root.glob("??/*"))
+    monkeypatch.setattr(
+        history,
+        "history_cache",
+        lambda app: cache.Cache(cache.directory(app, "history"), 0),
+    )
+    history.build_finished(docs, None)
+    assert not any(store.root.glob("??/*"))
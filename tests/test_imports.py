@@ -0,0 +1,31 @@
+"""\
+Import Time Tests
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the startup time of the theme, which run the import guard of
+the benchmarks (`python -m benchmarks imports`) in a fresh process.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+root = Path(__file__).resolve().parents[1]
+
+
+def test_theme_imports_within_its_budget() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "imports", "--verbose"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
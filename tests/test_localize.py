@@ -0,0 +1,57 @@
+"""\
+Localized Images Tests
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the local copies of the remote images, fetched from a local
+stand-in of the image host, see `theme.extensions.localize`.
+"""
+
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from theme.extensions import localize
+
+
+@pytest.fixture
+def avatar(httpd) -> str:
+    data = io.BytesIO()
+    Image.new("RGB", (400, 200)).save(data, "PNG")
+    httpd.routes["/avatar.png"] = (
+        200,
+        {"Content-Type": "image/png"},
+        data.getvalue(),
+    )
+    return f"{httpd.url}/avatar.png"
+
+
+@pytest.fixture
+def env() -> SimpleNamespace:
+    return SimpleNamespace(docname="index")
+
+
+@pytest.mark.parametrize("value", (False, "", "0", "false", "off"))
+def test_disabled_unless_the_option_is_set(app, env, avatar, value) -> None:
+    app.config.html_context["localize_images"] = value
+    assert localize.image(app, env, avatar, 100) is None
+
+
+def test_image_queues_the_copies_for_the_densities(app, env, avatar) -> None:
+    app.config.html_context["localize_images"] = "true"
+    localized = localize.image(app, env, avatar, 100)
+    assert localized is not None
+    assert localized["image_width"] == 100
+    assert localized["image_height"] == 50
+    assert [
+        candidate.split(" ")[1]
+        for candidate in localized["image_srcset"].split(", ")
+    ] == ["1x", "2x"]
+    assert len(env.theme_images["index"]) == 2
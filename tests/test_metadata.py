@@ -0,0 +1,102 @@
+"""\
+Document Metadata Tests
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the metadata index of the documents, which is collected from
+the doctrees of a real build, see `theme.extensions.metadata`.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sphinx.application import Sphinx
+
+from theme.extensions import metadata
+from theme.extensions import roles
+
+
+SOURCE = """\
+Title
+=====
+
+The first paragraph of the document has exactly ten words.
+
+``short code``
+
+.. note::
+
+    The words of the admonitions are not counted as prose.
+
+.. code-block:: python
+
+    print("The code is not counted either, whatever its length.")
+
+Usage
+-----
+
+Write to :email:`me <xa@mes3.dev>` for questions about this document.
+
+Advanced usage
+~~~~~~~~~~~~~~
+
+Nothing.
+"""
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory: pytest.TempPathFactory) -> Sphinx:
+    root = tmp_path_factory.mktemp("metadata")
+    source = root / "source"
+    source.mkdir()
+    (source / "conf.py").write_text('project = "Test"\n', encoding="utf-8")
+    (source / "index.rst").write_text(SOURCE, encoding="utf-8")
+    app = Sphinx(
+        source,
+        source,
+        root / "html",
+        root / "doctrees",
+        "html",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    app.add_role("email", roles.email)
+    app.connect("doctree-read", metadata.doctree_read, 500)
+    app.build()
+    return app
+
+
+def test_collects_the_titles_and_ids(app) -> None:
+    found = metadata.lookup(app.env, "index")
+    assert found.title == "Title"
+    assert found.sections == ("Usage", "Advanced usage")
+    assert found.ids == ("title", "usage", "advanced-usage")
+
+
+def test_only_the_prose_words_are_counted(app) -> None:
+    found = metadata.lookup(app.env, "index")
+    assert found.words == 10 + 8
+    assert found.reading_time == 1
+
+
+def test_email_links_get_the_title_as_subject(app) -> None:
+    doctree = app.env.get_doctree("index")
+    assert [
+        node["refuri"]
+        for node in doctree.findall(metadata.nodes.reference)
+        if node.get("refuri", "").startswith("mailto:")
+    ] == ["mailto:xa@mes3.dev?subject=Title"]
+
+
+def test_unknown_documents_have_empty_metadata(app) -> None:
+    assert metadata.lookup(app.env, "missing") == ("", (), (), 0, 0)
+
+
+def test_html_page_context_exposes_the_metadata(app) -> None:
+    context: dict[str, metadata.entry] = {}
+    metadata.html_page_context(app, "index", "page.html", context, None)
+    assert context["page_metadata"] == metadata.lookup(app.env, "index")
@@ -0,0 +1,91 @@
+"""\
+HTML Minifier Tests
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the streaming minification of the pages, see
+`theme.extensions.minifier`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions import minifier
+from theme.extensions.minifier import markup
+
+
+PAGE = """\
+<!DOCTYPE html>
+<html>
+  <head>
+    <script type="text/javascript">
+      if (a  <  b) { run(); }
+    </script>
+  </head>
+  <body>
+    <!-- navigation -->
+    <div class=" site-header   current " id="">
+      <a href="index.html">Home</a>  <em> and </em>
+      <span>more</span>
+    </div>
+    <pre>  keep
+    this  </pre>
+  </body>
+</html>
+"""
+
+
+def test_whitespace_is_collapsed_around_the_inline_elements() -> None:
+    html = "<p>\n  a  <em> b </em>\n  c\n</p>"
+    assert markup(html) == "<p>a <em> b </em> c</p>"
+
+
+def test_whitespace_is_dropped_next_to_the_blocks() -> None:
+    assert markup("<div>\n  <p> a </p>\n</div>\n") == "<div><p>a</p></div>"
+
+
+@pytest.mark.parametrize("tag", sorted(minifier.VERBATIM))
+def test_verbatim_content_is_kept(tag) -> None:
+    html = f"<{tag}>  a\n   b  </{tag}>"
+    assert markup(html) == html
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    (
+        ('<div class="" id="" style=" ">x</div>', "<div>x</div>"),
+        ('<p class="  a   b ">x</p>', '<p class="a b">x</p>'),
+        ('<script type="text/javascript"></script>', "<script></script>"),
+        ('<input type="text" disabled="disabled">', "<input disabled>"),
+        ('<a href="a b" title="x">y</a>', '<a href="a b" title=x>y</a>'),
+        ('<a href="a/">y</a>', '<a href="a/">y</a>'),
+        ('<img alt="&quot;">', "<img alt=&quot;>"),
+    ),
+)
+def test_optional_attributes_and_quotes_are_dropped(html, expected) -> None:
+    assert markup(html) == expected
+
+
+def test_only_the_conditional_comments_are_kept() -> None:
+    html = "<p>a<!-- b -->c</p><!--[if IE]><p>d</p><![endif]-->"
+    assert markup(html) == "<p>ac</p><!--[if IE]><p>d</p><![endif]-->"
+
+
+def test_minify_matches_the_markup_across_chunks(tmp_path) -> None:
+    html = tmp_path / "index.html"
+    html.write_text(PAGE, encoding="utf-8")
+    saved = minifier.minify(str(html), chunksize=7)
+    minified = html.read_text(encoding="utf-8")
+    assert minified == f"{markup(PAGE)}\n"
+    assert saved == len(PAGE.encode()) - len(minified.encode())
+    assert not (tmp_path / "index.html.tmp").exists()
+
+
+def test_minifying_is_deterministic_and_idempotent() -> None:
+    once = markup(PAGE)
+    assert markup(PAGE) == once
+    assert markup(once) == once
@@ -0,0 +1,119 @@
+"""\
+YouTube Metadata Tests
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the fetching and caching of the YouTube metadata, against a
+local stand-in of the oEmbed endpoint, see `theme.extensions.oembed`.
+"""
+
+from __future__ import annotations
+
+import urllib.parse as urlparse
+
+import pytest
+
+from theme.extensions import oembed
+
+
+METADATA = {"title": "Attention", "author_name": "xames3"}
+
+
+@pytest.fixture
+def endpoint(app, httpd, monkeypatch):
+    monkeypatch.setattr(oembed, "attempted", set())
+    app.config.html_context["oembed_endpoint"] = f"{httpd.url}/oembed"
+    return httpd
+
+
+@pytest.mark.parametrize(
+    ("src", "vid"),
+    (
+        ("https://www.youtube.com/watch?v=abc123&t=10", "abc123"),
+        ("https://youtu.be/abc123?si=share", "abc123"),
+        ("abc123", "abc123"),
+    ),
+)
+def test_video_id(src, vid) -> None:
+    assert oembed.video_id(src) == vid
+
+
+def test_scan_finds_the_videos_of_both_directives() -> None:
+    source = (
+        ".. youtube:: https://youtu.be/one\n"
+        "\n"
+        ".. thumbnail::\n"
+        "    :title: Two\n"
+        "\n"
+        "    https://www.youtube.com/watch?v=two\n"
+    )
+    assert oembed.scan(source) == [
+        ("youtube", "https://youtu.be/one"),
+        ("thumbnail", "https://www.youtube.com/watch?v=two"),
+    ]
+
+
+def test_lookup_fetches_and_caches_the_metadata(app, endpoint) -> None:
+    endpoint.json("/oembed", METADATA)
+    assert oembed.lookup(app, "abc123") == METADATA
+    assert oembed.lookup(app, "abc123") == METADATA
+    assert endpoint.paths() == ["/oembed"]
+    path, _ = endpoint.requests[0]
+    query = dict(urlparse.parse_qsl(urlparse.urlsplit(path).query))
+    assert query == {
+        "url": "https://www.youtube.com/watch?v=abc123",
+        "format": "json",
+    }
+
+
+def test_prefetch_skips_the_fresh_entries(app, endpoint) -> None:
+    endpoint.json("/oembed", METADATA)
+    oembed.prefetch(app, {"one", "two"})
+    oembed.prefetch(app, {"one", "two"})
+    assert len(endpoint.requests) == 2
+    assert oembed.lookup(app, "two") == METADATA
+
+
+def test_prefetch_refreshes_the_expired_entries(app, endpoint) -> None:
+    app.config.html_context["oembed_ttl"] = 0
+    endpoint.json("/oembed", METADATA)
+    oembed.prefetch(app, {"abc123"})
+    endpoint.json("/oembed", {**METADATA, "title": "Renamed"})
+    oembed.prefetch(app, {"abc123"})
+    assert len(endpoint.requests) == 2
+    assert oembed.lookup(app, "abc123")["title"] == "Renamed"
+
+
+def test_unavailable_videos_are_cached(app, endpoint) -> None:
+    endpoint.json("/oembed", {"error": "Unauthorized"}, status=401)
+    assert oembed.fetch(app, "private")
+    assert oembed.lookup(app, "private") == {}
+    assert oembed.cached(app, "private")["metadata"] is None
+    assert len(endpoint.requests) == 1
+
+
+@pytest.mark.parametrize(
+    ("status", "data"),
+    ((503, {"error": "Unavailable"}), (200, ["not", "an", "object"])),
+)
+def test_invalid_responses_are_not_cached(app, endpoint, status, data) -> None:
+    endpoint.json("/oembed", data, status=status)
+    assert not oembed.fetch(app, "abc123")
+    assert oembed.cached(app, "abc123") is None
+
+
+def test_offline_builds_do_not_fetch(app, endpoint) -> None:
+    app.config.html_context["offline"] = True
+    endpoint.json("/oembed", METADATA)
+    oembed.prefetch(app, {"abc123"})
+    assert oembed.lookup(app, "abc123") == {}
+    assert endpoint.requests == []
+
+
+def test_offline_is_parsed_as_a_boolean(app, endpoint) -> None:
+    app.config.html_context["offline"] = "false"
+    endpoint.json("/oembed", METADATA)
+    assert oembed.lookup(app, "abc123") == METADATA
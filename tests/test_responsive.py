@@ -0,0 +1,47 @@
+"""\
+Responsive Images Tests
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the publishing of the responsive variants of the pictures, see
+`theme.extensions.responsive`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions import cache
+from theme.extensions import responsive
+
+
+@pytest.fixture
+def dest(tmp_path):
+    path = tmp_path / "_images"
+    path.mkdir()
+    return path
+
+
+def test_unsupported_formats_are_skipped(app, monkeypatch) -> None:
+    monkeypatch.setattr(responsive, "skipped", set())
+    app.config.html_context["image_formats"] = "webp,bogus"
+    assert responsive.formats(app) == ("webp",)
+    assert responsive.skipped == {"bogus"}
+
+
+def test_undecodable_originals_are_published_as_is(app, tmp_path, dest):
+    src = tmp_path / "broken.png"
+    src.write_bytes(b"\x89PNG\r\n\x1a\nnot an image")
+    tasks = [
+        ("broken-480.webp", (str(src), "abc", "webp", 480)),
+        ("broken-960.webp", (str(src), "abc", "webp", 960)),
+        ("broken.png", (str(src), "abc", "", 0)),
+    ]
+    store = cache.Cache(tmp_path / "cache")
+    responsive.render(app, store, dest, tasks)
+    for name, _ in tasks:
+        assert (dest / name).read_bytes() == src.read_bytes()
+    assert not any(store.root.glob("??/*"))
@@ -0,0 +1,106 @@
+"""\
+Streaming HTML Rewriter Tests
+=============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the transformations applied by the streaming rewrite engine,
+see `theme.extensions.rewriter`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from theme.extensions import rewriter
+from theme.extensions.rewriter import fragment
+
+
+SIDEBAR = (
+    '<ul><li class="toctree-l1 current">'
+    '<a class="reference internal" href="#">One</a>'
+    '<ul><li class="toctree-l2"><a href="two.html">Two</a></li></ul></li>'
+    '<li class="toctree-l1"><a href="three.html">Three</a></li></ul>'
+)
+
+
+def test_starttag_escapes_the_values() -> None:
+    attrs: rewriter.Attributes = [("href", 'a"b<'), ("hidden", None)]
+    assert rewriter.starttag("a", attrs) == '<a href="a&quot;b&lt;" hidden>'
+    assert rewriter.starttag("br", [], close=True) == "<br />"
+
+
+def test_attributes_keep_their_positions() -> None:
+    attrs: rewriter.Attributes = [("id", "x"), ("class", "a b")]
+    rewriter.setattr_(attrs, "id", "y")
+    rewriter.setattr_(attrs, "rel", "nofollow")
+    assert rewriter.classes(attrs) == ["a", "b"]
+    rewriter.delattr_(attrs, "class")
+    assert attrs == [("id", "y"), ("rel", "nofollow")]
+    assert rewriter.getattr_(attrs, "class") is None
+
+
+def test_external_links_open_in_a_new_tab() -> None:
+    markup = '<p><a class="reference external" href="https://x.dev">x</a></p>'
+    assert fragment(markup) == (
+        '<p><a class="reference external" href="https://x.dev" '
+        'rel="nofollow noopener" target="_blank">x</a></p>'
+    )
+
+
+def test_header_links_copy_their_url_and_bind_the_scrollspy() -> None:
+    markup = '<h2>T<a class="headerlink" href="#t" title="Link">#</a></h2>'
+    assert fragment(markup) == (
+        '<h2>T<a class="headerlink" href="#t" @click.prevent='
+        '"window.navigator.clipboard.writeText($el.href);" '
+        'aria-label="Copy link" x-intersect.margin.0%.0%.-70%.0%='
+        "\"activeSection = '#t'\">#</a></h2>"
+    )
+
+
+@pytest.mark.parametrize(
+    ("markup", "expected"),
+    (
+        ('<div class="toctree-wrapper compound">\n</div><p>x</p>', "<p>x</p>"),
+        (
+            '<div class="toctree-wrapper compound"><ul><li>x</li></ul></div>',
+            '<div class="toctree-wrapper compound"><ul><li>x</li></ul></div>',
+        ),
+    ),
+)
+def test_only_the_empty_toctree_wrappers_are_removed(markup, expected) -> None:
+    assert fragment(markup) == expected
+
+
+def test_comments_are_stripped_and_void_elements_kept() -> None:
+    markup = '<p>a<!-- comment -->b</p><br><img src="a.png">'
+    assert fragment(markup) == '<p>ab</p><br><img src="a.png">'
+
+
+def test_left_sidebar_branches_are_collapsible() -> None:
+    rewritten = fragment(SIDEBAR, "left")
+    assert (
+        '<li class="toctree-l1 current has-children" aria-expanded="true">'
+    ) in rewritten
+    assert rewriter.toggle("nav-branch-1") in rewritten
+    assert '<ul id="nav-branch-1">' in rewritten
+    assert '<li class="toctree-l1"><a href="three.html">' in rewritten
+
+
+def test_right_sidebar_links_track_the_active_section() -> None:
+    markup = '<ul><li><a class="reference internal" href="#b">B</a></li></ul>'
+    assert ":data-current=\"activeSection === '#b'\"" in fragment(
+        markup, "right"
+    )
+
+
+def test_rewrite_matches_the_fragment_across_chunks(tmp_path) -> None:
+    html = tmp_path / "index.html"
+    html.write_text(f"<html><body>{SIDEBAR}</body></html>", encoding="utf-8")
+    rewriter.rewrite(str(html), chunksize=7)
+    assert html.read_text(encoding="utf-8") == fragment(
+        f"<html><body>{SIDEBAR}</body></html>"
+    )
+    assert not (tmp_path / "index.html.tmp").exists()
@@ -0,0 +1,163 @@
+"""\
+Offline Search Tests
+====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the sharded index of the client-side search, which is written
+by a real build and decoded back, see `theme.extensions.search`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import typing as t
+from pathlib import Path
+
+import pytest
+from sphinx.application import Sphinx
+
+from theme.extensions import metadata
+from theme.extensions import search
+
+
+INDEX = """\
+Transformers
+============
+
+Attention is all you need, and the transformer uses attention.
+
+Training
+--------
+
+Train the model.
+"""
+ABOUT = """\
+About
+=====
+
+Attention to detail.
+"""
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory: pytest.TempPathFactory) -> Sphinx:
+    root = tmp_path_factory.mktemp("search")
+    source = root / "source"
+    source.mkdir()
+    (source / "conf.py").write_text(
+        'project = "Test"\nhtml_context = {"search_index": "true"}\n',
+        encoding="utf-8",
+    )
+    (source / "index.rst").write_text(
+        f"{INDEX}\n.. toctree::\n\n    about\n", encoding="utf-8"
+    )
+    (source / "about.rst").write_text(ABOUT, encoding="utf-8")
+    app = Sphinx(
+        source,
+        source,
+        root / "html",
+        root / "doctrees",
+        "html",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    app.connect("doctree-read", metadata.doctree_read, 500)
+    app.connect("doctree-read", search.doctree_read, 500)
+    app.connect("build-finished", search.build_finished, 500)
+    app.build()
+    return app
+
+
+def load(path: Path) -> t.Any:
+    """Return the data of a file of the index."""
+    script = path.read_text(encoding="utf-8")
+    found = re.fullmatch(r'xaSearch\.load\("([^"]+)",(.*)\)\n', script)
+    assert found is not None
+    assert found[1] == path.stem
+    return json.loads(found[2])
+
+
+def decode(encoded: list[int]) -> dict[int, int]:
+    """Return the postings of a term from their encoding."""
+    postings: dict[int, int] = {}
+    docid = 0
+    for delta, score in zip(encoded[::2], encoded[1::2], strict=True):
+        docid += delta
+        postings[docid] = score
+    return postings
+
+
+def test_terms_leave_out_the_stopwords() -> None:
+    assert search.terms("The Attention, is a key-value OF it") == [
+        "attention",
+        "key",
+        "value",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("term", "expected"),
+    (("attention", "at"), ("x2", "x2"), ("über", "xc3bc62")),
+)
+def test_shard_names_are_safe_file_names(term, expected) -> None:
+    assert search.shard(term) == expected
+
+
+def test_titles_score_higher_than_the_prose(app) -> None:
+    scores = search.indexed(app.env)["index"]
+    assert scores["transformers"] == search.TITLE
+    assert scores["training"] == search.SECTION
+    assert scores["attention"] == 2
+    assert scores["model"] == 1
+
+
+@pytest.mark.parametrize(
+    "postings",
+    (
+        {0: 3},
+        {4: 1, 1: 9, 7: 2},
+        {docid: docid % 7 + 1 for docid in range(150)},
+    ),
+)
+def test_encode_round_trips_the_best_postings(postings) -> None:
+    best = sorted(postings.items(), key=lambda item: (-item[1], item[0]))
+    assert decode(search.encode(postings)) == dict(
+        sorted(best[: search.POSTINGS])
+    )
+
+
+def test_shards_round_trip_the_indexed_terms(app) -> None:
+    directory = Path(app.outdir, "_search")
+    manifest = load(directory / "index.js")
+    assert manifest["documents"] == 2
+    documents = load(directory / "docs-0.js")
+    assert documents == [
+        ["about.html", "About"],
+        ["index.html", "Transformers"],
+    ]
+    decoded: dict[str, dict[int, int]] = {}
+    for name in manifest["shards"]:
+        for suffix, encoded in load(directory / f"{name}.js").items():
+            term = f"{name}{suffix}"
+            decoded[term] = decode(encoded)
+    found = search.indexed(app.env)
+    assert decoded == {
+        term: {
+            docid: found[docname][term]
+            for docid, docname in enumerate(("about", "index"))
+            if term in found[docname]
+        }
+        for term in found["about"].keys() | found["index"].keys()
+    }
+    assert decoded["attention"] == {0: 1, 1: 2}
+
+
+def test_disabled_unless_the_option_is_set(app, monkeypatch) -> None:
+    monkeypatch.setitem(app.config.html_context, "search_index", "false")
+    assert not search.enabled(app)
+    assert search.env_get_outdated(app, app.env, set(), set(), set()) == []
@@ -0,0 +1,102 @@
+"""\
+Page Table of Contents Tests
+============================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the "On this page" ToC, which is derived from the doctree of a
+real build, see `theme.extensions.toc`.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sphinx.application import Sphinx
+
+from theme.extensions import toc
+
+
+SOURCE = """\
+Title
+=====
+
+Introduction.
+
+First *section*
+---------------
+
+Nested
+~~~~~~
+
+Text.
+
+Second
+------
+
+Text.
+"""
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory: pytest.TempPathFactory) -> Sphinx:
+    root = tmp_path_factory.mktemp("toc")
+    source = root / "source"
+    source.mkdir()
+    (source / "conf.py").write_text('project = "Test"\n', encoding="utf-8")
+    (source / "index.rst").write_text(SOURCE, encoding="utf-8")
+    (source / "empty.rst").write_text("Empty\n=====\n", encoding="utf-8")
+    app = Sphinx(
+        source,
+        source,
+        root / "html",
+        root / "doctrees",
+        "html",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    app.connect("doctree-read", toc.doctree_read, 900)
+    app.build()
+    return app
+
+
+def test_the_page_title_is_unwrapped(app) -> None:
+    assert app.env.theme_tocs["index"] == (
+        (
+            "#first-section",
+            "First <em>section</em>",
+            (("#nested", "Nested", ()),),
+        ),
+        ("#second", "Second", ()),
+    )
+
+
+def test_pages_without_sections_have_no_entries(app) -> None:
+    assert app.env.theme_tocs["empty"] == ()
+    assert toc.render(()) == ""
+
+
+def test_render_binds_the_links_to_the_scrollspy(app) -> None:
+    rendered = toc.render(app.env.theme_tocs["index"])
+    assert rendered == (
+        "<ul>\n"
+        '<li><a class="reference internal" href="#first-section" '
+        ":data-current=\"activeSection === '#first-section'\">"
+        "First <em>section</em></a><ul>\n"
+        '<li><a class="reference internal" href="#nested" '
+        ":data-current=\"activeSection === '#nested'\">Nested</a></li>\n"
+        "</ul>\n</li>\n"
+        '<li><a class="reference internal" href="#second" '
+        ":data-current=\"activeSection === '#second'\">Second</a></li>\n"
+        "</ul>\n"
+    )
+
+
+def test_html_page_context_renders_the_stored_toc(app) -> None:
+    context: dict[str, str] = {}
+    toc.html_page_context(app, "genindex", "genindex.html", context, None)
+    assert context["toc"] == ""
+    toc.html_page_context(app, "index", "page.html", context, None)
+    assert context["toc"] == toc.render(app.env.theme_tocs["index"])
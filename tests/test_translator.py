@@ -0,0 +1,122 @@
+"""\
+HTML Translator Tests
+=====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the markup rendered by the theme's HTML translator while the
+pages are written, see `theme.extensions.translator`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import docutils.nodes as nodes
+import pytest
+from sphinx.application import Sphinx
+
+from theme.extensions.translator import HTMLTranslator
+from theme.extensions.translator import branches
+
+
+SOURCE = """\
+Title
+=====
+
+See `Python <https://www.python.org>`_ and :ref:`the section <section>`.
+
+.. A comment which isn't rendered.
+
+.. raw:: html
+
+   <p>raw<!-- hidden --> markup</p>
+
+.. _section:
+
+Section
+-------
+
+Text.
+"""
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory: pytest.TempPathFactory) -> Sphinx:
+    root = tmp_path_factory.mktemp("translator")
+    source = root / "source"
+    source.mkdir()
+    (source / "conf.py").write_text('project = "Test"\n', encoding="utf-8")
+    (source / "index.rst").write_text(SOURCE, encoding="utf-8")
+    app = Sphinx(
+        source,
+        source,
+        root / "html",
+        root / "doctrees",
+        "html",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    app.set_translator("html", HTMLTranslator, override=True)
+    app.build()
+    return app
+
+
+@pytest.fixture(scope="module")
+def body(app: Sphinx) -> str:
+    html = Path(app.outdir, "index.html").read_text(encoding="utf-8")
+    return html.split('role="main">', 1)[1].split("</section>\n</section>")[0]
+
+
+def test_external_links_open_in_a_new_tab(body) -> None:
+    assert (
+        '<a class="reference external" href="https://www.python.org" '
+        'rel="nofollow noopener" target="_blank">Python</a>'
+    ) in body
+    assert '<a class="reference internal" href="#section">' in body
+
+
+def test_header_links_copy_their_url(body) -> None:
+    assert (
+        '<a class="headerlink" href="#title" @click.prevent='
+        '"window.navigator.clipboard.writeText($el.href);" '
+        'aria-label="Copy link">'
+    ) in body
+
+
+def test_only_the_second_and_third_levels_bind_the_scrollspy(body) -> None:
+    assert "activeSection = '#section'" in body
+    assert "activeSection = '#title'" not in body
+
+
+def test_comments_are_skipped(body) -> None:
+    assert "A comment" not in body
+    assert "<p>raw markup</p>" in body
+
+
+def test_branches_are_collapsible(app) -> None:
+    def item(
+        text: str, *children: nodes.Node, current: bool = False
+    ) -> nodes.list_item:
+        link = nodes.reference("", text, internal=True, refuri=f"{text}.html")
+        classes = ["current"] if current else []
+        return nodes.list_item(
+            "", nodes.paragraph("", "", link), *children, classes=classes
+        )
+
+    tree = nodes.bullet_list(
+        "",
+        item("one", nodes.bullet_list("", item("two")), current=True),
+        item("three", nodes.bullet_list("", item("four"))),
+        item("five"),
+    )
+    branches(tree)
+    rendered = app.builder.render_partial(tree)["fragment"]
+    assert rendered.count('aria-controls="nav-branch-1"') == 1
+    assert '<ul id="nav-branch-2">' in rendered
+    assert '<li aria-expanded="true" class="current has-children">' in rendered
+    assert '<li aria-expanded="false" class="has-children">' in rendered
+    assert '<li><p><a class="reference internal" href="five.html">' in rendered
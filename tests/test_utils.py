@@ -0,0 +1,119 @@
+"""\
+Post-processing Tests
+=====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+Tests of the post-processing of the pages written by the build, see
+`theme.extensions.utils`.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sphinx.errors import ConfigError
+
+from theme.extensions import utils
+
+
+PAGE = """\
+<!DOCTYPE html>
+<html>
+  <head>
+    <title>Page</title>
+  </head>
+  <body>
+    <!-- A comment -->
+    <main><p>Hello,   world!</p></main>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def build(app, tmp_path, monkeypatch):
+    app.builder = SimpleNamespace(name="html")
+    app.doctreedir = str(tmp_path / "doctrees")
+    app.parallel = 1
+    app.verbosity = 0
+    app.config.html_context.update(
+        {"postprocess_engine": "stream", "minify_html": True}
+    )
+    monkeypatch.setattr(utils, "written", set())
+    monkeypatch.setattr(utils, "spool", None)
+    Path(app.outdir).mkdir(parents=True)
+    return app
+
+
+@pytest.fixture
+def processed(monkeypatch):
+    pages: list[str] = []
+    postprocess = utils.postprocess
+
+    def recorded(html: str, app: t.Any) -> tuple[bool, int]:
+        pages.append(html)
+        return postprocess(html, app)
+
+    monkeypatch.setattr(utils, "postprocess", recorded)
+    return pages
+
+
+def write(app, name: str, text: str = PAGE) -> str:
+    html = Path(app.outdir, name)
+    html.write_text(text, encoding="utf-8")
+    utils.written.add(str(html))
+    return str(html)
+
+
+def test_written_pages_are_postprocessed(build) -> None:
+    html = write(build, "index.html")
+    utils.build_finished(build, None)
+    text = Path(html).read_text(encoding="utf-8")
+    assert "A comment" not in text
+    assert "<p>Hello, world!</p>" in text
+    manifest = json.loads(Path(build.doctreedir, utils.MANIFEST).read_text())
+    assert list(manifest["files"]) == ["index.html"]
+
+
+def test_unchanged_pages_are_skipped(build, processed) -> None:
+    html = write(build, "index.html")
+    utils.build_finished(build, None)
+    expected = Path(html).read_text(encoding="utf-8")
+    processed.clear()
+    write(build, "index.html")
+    changed = write(build, "about.html", PAGE.replace("Hello", "About"))
+    utils.build_finished(build, None)
+    assert processed == [changed]
+    assert Path(html).read_text(encoding="utf-8") == expected
+
+
+def test_unchanged_pages_are_postprocessed_without_the_cache(
+    build, processed
+) -> None:
+    build.config.html_context["postprocess_cache"] = "false"
+    write(build, "index.html")
+    utils.build_finished(build, None)
+    processed.clear()
+    html = write(build, "index.html")
+    utils.build_finished(build, None)
+    assert processed == [html]
+
+
+def test_unknown_engines_are_rejected(build) -> None:
+    build.config.html_context["postprocess_engine"] = "streaming"
+    with pytest.raises(ConfigError, match="streaming"):
+        utils.builder_inited(build)
+
+
+def test_pages_are_not_minified_if_the_option_is_false(build) -> None:
+    build.config.html_context["minify_html"] = "false"
+    html = write(build, "index.html")
+    utils.build_finished(build, None)
+    assert "<p>Hello,   world!</p>" in Path(html).read_text(encoding="utf-8")
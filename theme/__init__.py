@@ -4,7 +4,7 @@ Akshay's Corner Sphinx Theme
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 21 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module serves as the primary entry point for the Akshay's Corner
 Sphinx Theme. It is responsible for initialising the theme, configuring
@@ -51,6 +51,44 @@ hooks for post-processing and dynamic content handling.
         instead of `base`, like before. This allows to make the
         development simple and easy to follow by keeping the templates
         (html/jinja2 templates) separate then the styling components.
+
+.. versionadded:: 18.10.2026
+
+    [1] Added a custom HTML translator which rewrites the pages while
+        they are being written instead of post-processing them after
+        the build.
+    [2] The "On this page" ToC is derived from the doctree once per
+        document and rendered without a docutils publisher.
+    [3] Added an opt-in profiling mode, which writes a Chrome trace of
+        the time spent in the theme.
+    [4] Images of the `picture` directive are published as responsive
+        variants, which are cached by the hash of their content.
+    [5] The theme's static files are copied incrementally, driven by a
+        manifest of the previous build's copies.
+    [6] The theme's stylesheets and scripts are served as minified
+        bundles, named after the hash of their content.
+    [7] Added opt-in gzip and Brotli siblings of the build's output for
+        static hosts which serve precompressed files.
+    [8] The critical CSS of every page is inlined and the full
+        stylesheets are loaded asynchronously.
+    [9] The metadata of the YouTube videos is prefetched concurrently
+        into an on-disk cache, so the builds also work offline.
+    [10] Added opt-in localization of the remote images, like the
+         thumbnails of the YouTube videos and the authors' avatars.
+    [11] Added a click-to-load facade for the embedded YouTube videos,
+         which is opt-in using the `youtube_facade` option.
+    [12] Added opt-in build-time stats of the GitHub repositories, which
+         are fetched concurrently and cached using conditional requests.
+    [13] The templates of the directives are loaded lazily from a shared
+         environment, with their bytecode cached on disk.
+    [14] Added an index of the documents' metadata, like their titles
+         and reading times, shared by the directives, roles and templates.
+    [15] Added an opt-in offline search, backed by a prefix-sharded index
+         which is loaded on demand, one shard at a time.
+    [16] Every page written by the build is post-processed exactly once,
+         including the ones which weren't read again.
+    [17] Added an opt-in minification of the pages, which is enabled by
+         setting the `minify_html` option.
 """
 
 from __future__ import annotations
@@ -64,15 +102,29 @@ import docutils.parsers.rst as rst
 from sphinx.builders.html import StandaloneHTMLBuilder
 from sphinx.locale import __
 from sphinx.util import logging
-from sphinx.util.fileutil import copy_asset
 from sphinx.util.matching import DOTFILES
 
+from theme.extensions import assets
+from theme.extensions import bundles
+from theme.extensions import compress
+from theme.extensions import critical
 from theme.extensions import directives
+from theme.extensions import github
+from theme.extensions import history
+from theme.extensions import localize
+from theme.extensions import metadata
+from theme.extensions import oembed
+from theme.extensions import profiling
+from theme.extensions import responsive
 from theme.extensions import roles
+from theme.extensions import search
+from theme.extensions import templating
+from theme.extensions import toc
+from theme.extensions import translator
+from theme.extensions import utils
 from theme.extensions.utils import build_finished
 from theme.extensions.utils import env_before_read_docs
 from theme.extensions.utils import last_updated_date
-from theme.extensions.utils import remove_title_from_scrollspy
 
 
 if t.TYPE_CHECKING:
@@ -93,9 +145,6 @@ supported_extensions: t.Sequence[str] = (
 )
 
 
-unmodified = StandaloneHTMLBuilder.copy_theme_static_files
-
-
 def copy_theme_static_files(
     self: StandaloneHTMLBuilder,
     context: dict[str, t.Any],
@@ -105,26 +154,35 @@ def copy_theme_static_files(
     .. versionadded:: 2.11.2025
 
         Add "relative" static (styling) directory to the theme path.
+
+    .. versionchanged:: 18.10.2026
+
+        The static files are copied incrementally using a manifest, so
+        unchanged files are no longer copied (or rendered) every build.
+        The theme's bundles are written alongside them.
     """
-    unmodified(self, context)
+    if not self.theme:
+        return
 
     def onerror(filename: str, error: Exception) -> None:
         """Display warning on file transfer."""
         msg = __("Failed to copy file in theme's 'static' directory: %s: %r")
         logger.warning(msg, filename, error)
 
-    copy_asset(
-        Path(self.theme.get_theme_dirs()[0], "../static"),
-        self._static_dir,
-        excluded=DOTFILES,
-        context=context,
-        renderer=self.templates,
-        onerror=onerror,
-        force=True,
+    dirs = [Path(entry, "static") for entry in self.theme.get_theme_dirs()]
+    assets.copy(
+        self,
+        [*reversed(dirs), Path(self.theme.get_theme_dirs()[0], "../static")],
+        DOTFILES,
+        context,
+        onerror,
     )
+    bundles.write(self)
 
 
-StandaloneHTMLBuilder.copy_theme_static_files = copy_theme_static_files
+StandaloneHTMLBuilder.copy_theme_static_files = profiling.traced(
+    copy_theme_static_files, category="static"
+)
 
 
 def fix(module: types.ModuleType) -> type[nodes.Element]:
@@ -146,7 +204,7 @@ def fix(module: types.ModuleType) -> type[nodes.Element]:
     return node
 
 
-def setup(app: Sphinx) -> dict[str, str | bool]:
+def setup(app: Sphinx) -> dict[str, str | int]:
     """Initialise and configure the sphinx theme.
 
     This function serves as the main entry point for integrating the
@@ -175,6 +233,10 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
 
         Overridding CSS files now have slightly higher priority than
         before. It was 900 earlier, now it's 800.
+
+    .. versionadded:: 18.10.2026
+
+        Register the theme's HTML translator for the HTML builders.
     """
     for extension in supported_extensions:
         app.setup_extension(extension)
@@ -186,16 +248,74 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
     for role in inspect.getmembers(roles, inspect.isfunction):
         rst.roles.register_local_role(*role)
     for directive in directives:
-        app.add_node(fix(directive), html=(directive.visit, directive.depart))
-        app.add_directive(directive.name, directive.directive)
+        app.add_node(
+            fix(directive),
+            html=(
+                profiling.traced(
+                    directive.visit, f"{directive.name}.visit", "directive"
+                ),
+                directive.depart,
+            ),
+        )
+        app.add_directive(
+            directive.name,
+            profiling.directive(directive.directive, directive.name),
+        )
         if hasattr(directive, "html_page_context"):
-            app.connect("html-page-context", directive.html_page_context)
-    app.connect("env-before-read-docs", env_before_read_docs)
-    app.connect("source-read", last_updated_date)
-    app.connect("html-page-context", remove_title_from_scrollspy)
-    app.connect("build-finished", build_finished)
+            app.connect(
+                "html-page-context",
+                profiling.traced(
+                    directive.html_page_context,
+                    f"{directive.name}.html_page_context",
+                ),
+            )
+    app.connect("builder-inited", profiling.builder_inited, 100)
+    app.connect("env-before-read-docs", profiling.env_before_read_docs, 100)
+    app.connect("env-updated", profiling.env_updated, 100)
+    app.connect("build-finished", profiling.build_finished, 100)
+    app.connect("build-finished", profiling.write, 900)
+    for event, handler, priority in (
+        ("env-before-read-docs", env_before_read_docs, 500),
+        ("env-before-read-docs", oembed.env_before_read_docs, 500),
+        ("env-before-read-docs", localize.env_before_read_docs, 500),
+        ("env-before-read-docs", github.env_before_read_docs, 500),
+        ("env-get-outdated", github.env_get_outdated, 500),
+        ("env-get-outdated", search.env_get_outdated, 500),
+        ("source-read", last_updated_date, 500),
+        ("builder-inited", translator.builder_inited, 500),
+        ("builder-inited", bundles.builder_inited, 500),
+        ("builder-inited", templating.builder_inited, 500),
+        ("builder-inited", utils.builder_inited, 500),
+        ("doctree-read", metadata.doctree_read, 500),
+        ("doctree-read", search.doctree_read, 500),
+        ("doctree-read", toc.doctree_read, 900),
+        ("env-purge-doc", toc.env_purge_doc, 500),
+        ("env-merge-info", toc.env_merge_info, 500),
+        ("env-purge-doc", responsive.env_purge_doc, 500),
+        ("env-merge-info", responsive.env_merge_info, 500),
+        ("env-purge-doc", github.env_purge_doc, 500),
+        ("env-merge-info", github.env_merge_info, 500),
+        ("env-purge-doc", metadata.env_purge_doc, 500),
+        ("env-merge-info", metadata.env_merge_info, 500),
+        ("env-purge-doc", search.env_purge_doc, 500),
+        ("env-merge-info", search.env_merge_info, 500),
+        ("html-page-context", metadata.html_page_context, 500),
+        ("html-page-context", toc.html_page_context, 500),
+        ("html-page-context", translator.html_page_context, 600),
+        ("html-page-context", critical.html_page_context, 900),
+        ("html-page-context", utils.html_page_context, 900),
+        ("build-finished", build_finished, 500),
+        ("build-finished", responsive.build_finished, 500),
+        ("build-finished", localize.build_finished, 600),
+        ("build-finished", history.build_finished, 600),
+        ("build-finished", search.build_finished, 600),
+        ("build-finished", compress.build_finished, 800),
+        ("build-finished", templating.build_finished, 800),
+    ):
+        app.connect(event, profiling.traced(handler), priority)
     return {
         "version": version,
+        "env_version": 3,
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
@@ -1,4 +1,6 @@
 document.addEventListener('DOMContentLoaded', () => {
+    const existing = document.getElementById('readingTime');
+    if (existing && existing.textContent.trim()) return;
     const wordsPerMinute = 225;
     const root = document.getElementById('content') || document.querySelector('[role="main"]') || document.querySelector('section');
     if (!root) return;
@@ -729,6 +731,55 @@ document.addEventListener('DOMContentLoaded', function () {
     }
 })();
 
+(function () {
+    const warmed = new Set();
+
+    function preconnect(origin) {
+        if (!origin || warmed.has(origin)) return;
+        warmed.add(origin);
+        const link = document.createElement('link');
+        link.rel = 'preconnect';
+        link.href = origin;
+        link.crossOrigin = '';
+        document.head.appendChild(link);
+    }
+
+    function warm(facade) {
+        preconnect(facade.dataset.youtubeOrigin);
+        preconnect('https://www.google.com');
+    }
+
+    function play(facade) {
+        const iframe = document.createElement('iframe');
+        iframe.className = 'site-media__iframe';
+        iframe.src = facade.dataset.youtubeEmbed;
+        iframe.title = facade.dataset.youtubeTitle || 'YouTube';
+        iframe.allow = 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share';
+        iframe.allowFullscreen = true;
+        facade.replaceChildren(iframe);
+        facade.classList.remove('site-media__facade');
+        iframe.focus();
+    }
+
+    function bootYouTubeFacades() {
+        document.querySelectorAll('.site-media__facade[data-youtube-embed]').forEach(facade => {
+            facade.addEventListener('pointerenter', () => warm(facade), { once: true });
+            facade.addEventListener('focusin', () => warm(facade), { once: true });
+            facade.addEventListener('click', (event) => {
+                if (event.ctrlKey || event.metaKey || event.shiftKey) return;
+                event.preventDefault();
+                play(facade);
+            });
+        });
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', bootYouTubeFacades);
+    } else {
+        bootYouTubeFacades();
+    }
+})();
+
 function formatNumber(num) {
     if (num >= 1000) {
         return (num / 1000).toFixed(1).replace(/\.0$/, '') + 'k';
@@ -736,6 +787,274 @@ function formatNumber(num) {
     return num;
 }
 
+(function () {
+    function render(el, value) {
+        if (!el) return;
+        el.innerHTML = '';
+        const span = document.createElement('span');
+        span.style.color = 'hsl(var(--foreground))';
+        span.textContent = formatNumber(value);
+        el.appendChild(span);
+    }
+
+    function refreshRepository(repo, widgets) {
+        fetch('https://api.github.com/repos/' + repo)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`GitHub API for ${repo} returned status: ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(data => {
+                widgets.forEach(widget => {
+                    render(widget.querySelector('.site-github-repository__stars'), data.stargazers_count);
+                    render(widget.querySelector('.site-github-repository__forks'), data.forks_count);
+                    widget.removeAttribute('data-github-pending');
+                });
+            })
+            .catch(error => {
+                console.error("Error fetching GitHub data:", error);
+                widgets.forEach(widget => {
+                    if (!widget.hasAttribute('data-github-pending')) return;
+                    widget.querySelectorAll('.site-github-repository__details p').forEach(el => {
+                        el.style.display = 'none';
+                    });
+                });
+            });
+    }
+
+    function bootGitHubRepositories() {
+        const repos = new Map();
+        document.querySelectorAll('.site-github-repository[data-github-refresh]').forEach(widget => {
+            const repo = widget.dataset.githubRepo;
+            if (!repo) return;
+            if (!repos.has(repo)) repos.set(repo, []);
+            repos.get(repo).push(widget);
+        });
+        repos.forEach((widgets, repo) => refreshRepository(repo, widgets));
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', bootGitHubRepositories);
+    } else {
+        bootGitHubRepositories();
+    }
+})();
+
+// Offline search, answered from the shards of the theme's search index
+(function () {
+    const scope = document.querySelector('[data-search-root]');
+    if (!scope) return;
+    const root = scope.dataset.searchRoot || '';
+    const wordPattern = /[\p{L}\p{N}_]+/gu;
+    const requests = new Map();
+    let manifest = null;
+
+    function request(name, version) {
+        if (requests.has(name)) return requests.get(name).promise;
+        const entry = {};
+        entry.promise = new Promise((resolve, reject) => {
+            entry.resolve = resolve;
+            const script = document.createElement('script');
+            script.src = `${root}_search/${name}.js${version ? `?v=${version}` : ''}`;
+            script.async = true;
+            script.onerror = () => {
+                requests.delete(name);
+                reject(new Error(`Search index file ${name} failed to load`));
+            };
+            script.onload = () => script.remove();
+            document.head.appendChild(script);
+        });
+        requests.set(name, entry);
+        return entry.promise;
+    }
+
+    window.xaSearch = {
+        load(name, data) {
+            const entry = requests.get(name);
+            if (entry) entry.resolve(data);
+        }
+    };
+
+    async function loadManifest() {
+        if (!manifest) {
+            manifest = request('index').then(data => ({
+                ...data,
+                shards: new Set(data.shards),
+                stopwords: new Set(data.stopwords)
+            }));
+        }
+        return manifest;
+    }
+
+    function shardName(word, prefix) {
+        const head = Array.from(word).slice(0, prefix).join('');
+        if (/^[a-z0-9]+$/.test(head)) return head;
+        const bytes = Array.from(new TextEncoder().encode(head), b => b.toString(16).padStart(2, '0'));
+        return `x${bytes.join('')}`;
+    }
+
+    function decode(postings) {
+        const scores = new Map();
+        let docid = 0;
+        for (let i = 0; i < postings.length; i += 2) {
+            docid += postings[i];
+            scores.set(docid, postings[i + 1]);
+        }
+        return scores;
+    }
+
+    async function query(text, limit) {
+        const index = await loadManifest();
+        const words = (text.toLowerCase().match(wordPattern) || []).filter(
+            word => Array.from(word).length >= index.prefix && !index.stopwords.has(word)
+        );
+        if (!words.length) return [];
+        const names = words.map(word => shardName(word, index.prefix));
+        if (names.some(name => !index.shards.has(name))) return [];
+        const shards = await Promise.all(names.map(name => request(name, index.version)));
+        const completing = !/\s$/.test(text);
+        let totals = null;
+        words.forEach((word, position) => {
+            const rest = Array.from(word).slice(index.prefix).join('');
+            const partial = completing && position === words.length - 1;
+            const scores = new Map();
+            Object.keys(shards[position]).forEach(suffix => {
+                const exact = suffix === rest;
+                if (!exact && !(partial && suffix.startsWith(rest))) return;
+                decode(shards[position][suffix]).forEach((score, docid) => {
+                    scores.set(docid, Math.max(scores.get(docid) || 0, exact ? score * 2 : score));
+                });
+            });
+            if (totals === null) {
+                totals = scores;
+                return;
+            }
+            const merged = new Map();
+            totals.forEach((score, docid) => {
+                if (scores.has(docid)) merged.set(docid, score + scores.get(docid));
+            });
+            totals = merged;
+        });
+        const ranked = Array.from(totals).sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, limit);
+        const chunks = Array.from(new Set(ranked.map(([docid]) => Math.floor(docid / index.chunk))));
+        const documents = new Map(await Promise.all(
+            chunks.map(async chunk => [chunk, await request(`docs-${chunk}`, index.version)])
+        ));
+        return ranked.map(([docid, score]) => {
+            const [url, title] = documents.get(Math.floor(docid / index.chunk))[docid % index.chunk];
+            return { url: `${root}${url}` || './', title, score };
+        });
+    }
+
+    function link(result, className) {
+        const anchor = document.createElement('a');
+        anchor.href = result.url;
+        anchor.className = className;
+        anchor.textContent = result.title;
+        return anchor;
+    }
+
+    function bootSearchbox(form) {
+        const input = form.querySelector('input[name="q"]');
+        const list = form.querySelector('.site-search__results');
+        if (!input || !list) return;
+        let sequence = 0;
+        let timer = 0;
+
+        function hide() {
+            list.hidden = true;
+        }
+
+        async function update() {
+            const current = ++sequence;
+            const text = input.value;
+            if (!text.trim()) return hide();
+            let results = [];
+            try {
+                results = await query(text, 8);
+            } catch (error) {
+                return hide();
+            }
+            if (current !== sequence) return;
+            list.replaceChildren(...results.map(result => {
+                const item = document.createElement('li');
+                item.appendChild(link(result, 'site-search__result'));
+                return item;
+            }));
+            if (!results.length) {
+                const item = document.createElement('li');
+                item.className = 'site-search__empty';
+                item.textContent = 'No results';
+                list.appendChild(item);
+            }
+            list.hidden = false;
+        }
+
+        input.addEventListener('focus', () => loadManifest().catch(() => { manifest = null; }), { once: true });
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(update, 80);
+        });
+        form.addEventListener('keydown', event => {
+            const links = Array.from(list.querySelectorAll('a'));
+            const position = links.indexOf(document.activeElement);
+            if (event.key === 'Escape') {
+                hide();
+                input.focus();
+            } else if (event.key === 'ArrowDown' && links.length && !list.hidden) {
+                event.preventDefault();
+                links[Math.min(position + 1, links.length - 1)].focus();
+            } else if (event.key === 'ArrowUp' && position >= 0) {
+                event.preventDefault();
+                (position ? links[position - 1] : input).focus();
+            }
+        });
+        form.addEventListener('focusout', event => {
+            if (!form.contains(event.relatedTarget)) hide();
+        });
+    }
+
+    async function bootResults(container) {
+        const text = new URLSearchParams(window.location.search).get('q') || '';
+        document.querySelectorAll('#xa-search input[name="q"]').forEach(input => { input.value = text; });
+        const summary = document.createElement('p');
+        summary.className = 'site-search-page__summary';
+        container.replaceChildren(summary);
+        if (!text.trim()) return;
+        let results = [];
+        try {
+            results = await query(text, 50);
+        } catch (error) {
+            summary.textContent = 'The search index could not be loaded.';
+            return;
+        }
+        summary.textContent = results.length
+            ? `${results.length} result${results.length === 1 ? '' : 's'} for "${text}"`
+            : `No results for "${text}"`;
+        const list = document.createElement('ul');
+        list.className = 'search';
+        results.forEach(result => {
+            const item = document.createElement('li');
+            item.appendChild(link(result, 'site-search-page__result'));
+            list.appendChild(item);
+        });
+        container.appendChild(list);
+    }
+
+    function bootSearch() {
+        document.querySelectorAll('form[data-search-root]').forEach(bootSearchbox);
+        const container = document.querySelector('#search-results[data-search-root]');
+        if (container) bootResults(container);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', bootSearch);
+    } else {
+        bootSearch();
+    }
+})();
+
 (function (C, A, L) {
     let p = function (a, ar) { a.q.push(ar); };
     let d = C.document;
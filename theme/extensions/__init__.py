@@ -4,7 +4,7 @@ Theme Extension Manager
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 22 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module manages this theme's custom directive and roles.
 
@@ -12,18 +12,33 @@ This module manages this theme's custom directive and roles.
 
     The `tagged` directive is now deprecated as it didn't serve any
     specific purpose or was being used in any way.
+
+.. versionchanged:: 18.10.2026
+
+    The directives load their templates lazily from the environment of
+    `theme.extensions.templating`, which also reports the time spent
+    importing them.
 """
 
 from __future__ import annotations
 
+import time
 import typing as t
 
-from . import author
-from . import picture
-from . import repository
-from . import thumbnail
-from . import video
-from . import youtube
+from . import templating
+
+
+start = time.perf_counter_ns()
+
+from . import author  # noqa: E402
+from . import picture  # noqa: E402
+from . import repository  # noqa: E402
+from . import thumbnail  # noqa: E402
+from . import video  # noqa: E402
+from . import youtube  # noqa: E402
+
+
+templating.imported = time.perf_counter_ns() - start
 
 
 if t.TYPE_CHECKING:
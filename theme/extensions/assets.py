@@ -0,0 +1,196 @@
+"""\
+Theme Static Assets
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module copies the static assets (stylesheets, scripts, fonts and
+so on) of this sphinx theme into the build's `_static` directory,
+incrementally.
+
+Sphinx copies (and re-renders) every static file of a theme on every
+build, even if nothing has changed. Instead, this module keeps a
+manifest of the copied files in the build's doctree directory, which
+records the hash of every source and the size and modification time of
+its output. On the next build, a file is only rewritten if its source
+has changed or its output has been modified (or removed) since. The
+templated assets (`*_t` and `*.jinja`) are rendered on every build, as
+their output depends on the build's context, but they're only rewritten
+if the rendered output has changed.
+
+The manifest also records how many files were copied, rendered and
+skipped by the last build.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import typing as t
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from sphinx.builders.html import StandaloneHTMLBuilder
+    from sphinx.util.matching import Matcher
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION: t.Final[str] = "1"
+MANIFEST: t.Final[str] = "theme-static.json"
+TEMPLATES: t.Final[tuple[str, ...]] = ("_t", ".jinja")
+
+
+def output(name: str) -> str:
+    """Return the output name of a static file.
+
+    :param name: Name (or relative path) of the static file.
+    :return: The name without the template suffix, if it's a template.
+    """
+    lowered = name.lower()
+    for suffix in TEMPLATES:
+        if lowered.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def template(path: Path) -> bool:
+    """Return whether a static file is a template.
+
+    :param path: Path of the static file.
+    :return: `True` if the file is rendered instead of copied.
+    """
+    return output(path.name) != path.name
+
+
+def sources(dirs: Iterable[Path], excluded: Matcher) -> dict[str, Path]:
+    """Return the static files to be copied, keyed by their output path.
+
+    The directories are walked in order, so a file of a later directory
+    overrides the one with the same output path of an earlier directory.
+
+    :param dirs: Static directories, in order of precedence.
+    :param excluded: Matcher of the files to be skipped.
+    :return: Mapping of the relative output paths and the source files.
+    """
+    files: dict[str, Path] = {}
+    for root in dirs:
+        if not root.is_dir():
+            continue
+        for base, dirnames, filenames in os.walk(root, followlinks=True):
+            reldir = Path(base).relative_to(root).as_posix()
+            dirnames[:] = [
+                dirname
+                for dirname in dirnames
+                if not excluded(os.path.join(reldir, dirname))
+            ]
+            for filename in filenames:
+                relpath = os.path.normpath(os.path.join(reldir, filename))
+                if excluded(relpath):
+                    continue
+                files[Path(output(relpath)).as_posix()] = Path(base, filename)
+    return files
+
+
+def stat(path: Path) -> list[int] | None:
+    """Return the size and modification time of a file.
+
+    :param path: Path of the file.
+    :return: List of the size and modification time in nanoseconds, or
+        `None` if the file doesn't exist.
+    """
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return [info.st_size, info.st_mtime_ns]
+
+
+def copy(
+    builder: StandaloneHTMLBuilder,
+    dirs: Iterable[Path],
+    excluded: Matcher,
+    context: dict[str, t.Any],
+    onerror: Callable[[str, Exception], None],
+) -> dict[str, int]:
+    """Copy the static files of the theme, skipping the unchanged ones.
+
+    :param builder: The HTML builder.
+    :param dirs: Static directories, in order of precedence.
+    :param excluded: Matcher of the files to be skipped.
+    :param context: Context used for rendering the templated files.
+    :param onerror: Callback for the files which failed to be copied.
+    :return: Number of the copied, rendered and skipped files.
+    """
+    static = Path(builder._static_dir)
+    manifest = Path(builder.doctreedir, MANIFEST)
+    try:
+        previous = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    if previous.get("version") != MANIFEST_VERSION:
+        previous = {}
+    entries: dict[str, dict[str, t.Any]] = previous.get("files", {})
+    files: dict[str, dict[str, t.Any]] = {}
+    counts = {"copied": 0, "rendered": 0, "skipped": 0}
+    for relpath, src in sources(dirs, excluded).items():
+        dest = static / relpath
+        entry = entries.get(relpath, {})
+        try:
+            source = stat(src)
+            if template(src):
+                text = builder.templates.render_string(
+                    src.read_text(encoding="utf-8"), context
+                )
+                digest = cache.digest(text)
+            elif entry.get("source") == source:
+                digest = entry["digest"]
+            else:
+                digest = cache.filedigest(src)
+            if (
+                entry.get("digest") == digest
+                and entry.get("output") is not None
+                and entry.get("output") == stat(dest)
+            ):
+                counts["skipped"] += 1
+            else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                if template(src):
+                    dest.write_text(text, encoding="utf-8")
+                    counts["rendered"] += 1
+                else:
+                    shutil.copyfile(src, dest)
+                    counts["copied"] += 1
+        except Exception as exc:
+            onerror(os.fsdecode(src), exc)
+            continue
+        files[relpath] = {
+            "source": source,
+            "digest": digest,
+            "output": stat(dest),
+        }
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(
+        json.dumps(
+            {"version": MANIFEST_VERSION, "files": files, **counts},
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    logger.verbose(
+        "Theme static files: %d copied, %d rendered, %d skipped",
+        counts["copied"],
+        counts["rendered"],
+        counts["skipped"],
+    )
+    return counts
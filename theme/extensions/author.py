@@ -4,7 +4,7 @@ Author Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 22 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `author` directive for this sphinx theme.
 The directive allows embedding details directly within the document.
@@ -38,28 +38,32 @@ theme's Jinja2 template, producing a final HTML output.
 .. deprecated:: 19.10.2025
 
     Removed the custom subject header in favour of page title.
+
+.. versionchanged:: 18.10.2026
+
+    The avatar is localized by `theme.extensions.localize` if the
+    `localize_images` option is set, instead of being hotlinked.
 """
 
 from __future__ import annotations
 
-import os.path as p
 import typing as t
 
 import docutils.nodes as nodes
 import docutils.parsers.rst as rst
-import jinja2
+
+from theme.extensions import localize
+from theme.extensions import metadata
+from theme.extensions import templating
 
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "author"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "author.html.jinja")
+template = templating.template("author.html.jinja")
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+AVATAR_WIDTH: t.Final[int] = 20
 
 
 class node(nodes.Element):
@@ -130,8 +134,12 @@ class directive(rst.Directive):
             The `option_spec` will take precedence over the
             `html_context` values.
         """
-        ctx = self.state.document.settings.env.config.html_context
+        env = self.state.document.settings.env
+        ctx = env.config.html_context
         self.options.update(ctx)
+        if avatar := self.options.get("avatar"):
+            localized = localize.image(env.app, env, avatar, AVATAR_WIDTH)
+            self.options.update(localized or {})
         element = node("\n".join(self.content), **self.options)
         return [element]
 
@@ -153,14 +161,21 @@ def visit(self: HTMLTranslator, node: node) -> None:
     .. deprecated:: 19.10.2025
 
         Removed the custom subject header in favour of page title.
+
+    .. versionchanged:: 18.10.2026
+
+        The page title and the reading time are looked up from the index
+        of `theme.extensions.metadata`, instead of converting the whole
+        document to a DOM for every author.
     """
-    title = (
-        dom.asdom().getElementsByTagName("title")
-        if (dom := node.document)
-        else ["Article"]
-    )
-    node.attributes["subject"] = title[0].firstChild.nodeValue
-    self.body.append(template.render(**node.attributes))
+    found = metadata.lookup(self.builder.env, self.builder.current_docname)
+    attributes = {
+        **node.attributes,
+        **localize.urls(self, node),
+        "subject": found.title or "Article",
+        "reading_time": found.reading_time,
+    }
+    self.body.append(template.render(**attributes))
 
 
 def depart(self: HTMLTranslator, node: node) -> None:
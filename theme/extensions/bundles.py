@@ -0,0 +1,359 @@
+"""\
+Theme Bundles
+=============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module bundles the stylesheets and scripts of this sphinx theme
+into minified files named after the hash of their content, so they can
+be served with immutable, long-lived caching. Any change to one of the
+bundled files results in a new name and hence, a new URL.
+
+The theme ships the following bundles::
+
+    [1] `theme.<hash>.css` from `theme.css`, with its local `@import`
+        rules (`base.css`, `geist.css` and `code.css`) inlined.
+    [2] `overrides.<hash>.css` from `sphinx-design.css` and
+        `doc-search.css`, which override the styles of the respective
+        extensions and are therefore loaded after them.
+    [3] `theme.<hash>.js` from `base.js` and `theme.js`.
+
+Every bundle takes the place of the first of its files among the page's
+stylesheets or scripts (keeping its priority and attributes), while the
+rest of its files are dropped. This way, the references rendered by
+`layout.html` point to the bundles without changing the cascade.
+
+The minifiers are deliberately conservative. The stylesheets are
+stripped of comments and redundant whitespace. The scripts are stripped
+of comments and indentation, but their line breaks are kept, so the
+automatic semicolon insertion of JavaScript is never affected. License
+comments (`/*! ... */`) are kept in both cases. The minified bundles are
+cached by the hash of their sources.
+
+Bundling can be disabled by setting `bundle_assets` to `False`.
+"""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions.utils import flag
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.builders.html import StandaloneHTMLBuilder
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION: t.Final[str] = "1"
+BUNDLES: t.Final[dict[str, tuple[str, ...]]] = {
+    "theme.css": ("theme.css",),
+    "overrides.css": ("sphinx-design.css", "doc-search.css"),
+    "theme.js": ("base.js", "theme.js"),
+}
+CSS_TOKENS: re.Pattern[str] = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)""", re.DOTALL
+)
+CSS_IMPORT: re.Pattern[str] = re.compile(
+    r"""@import\s+(?:url\(\s*)?(["']?)([\w.-]+\.css)\1\s*\)?\s*;"""
+)
+CSS_HOISTED: re.Pattern[str] = re.compile(r"@(?:charset|import)\b[^;]*;")
+JS_REGEX_PREFIX: t.Final[str] = "(,=:[!&|?{};+-*%<>~^"
+JS_REGEX_KEYWORDS: t.Final[frozenset[str]] = frozenset(
+    {
+        "await",
+        "case",
+        "delete",
+        "do",
+        "else",
+        "in",
+        "instanceof",
+        "new",
+        "of",
+        "return",
+        "throw",
+        "typeof",
+        "void",
+        "yield",
+    }
+)
+
+
+def minify_css(text: str) -> str:
+    """Minify a stylesheet.
+
+    Comments are removed (except the license comments) and whitespace
+    is collapsed and removed around the characters where it has no
+    meaning. Strings are kept as is.
+
+    :param text: The stylesheet.
+    :return: The minified stylesheet.
+    """
+    parts: list[str] = []
+    last = 0
+
+    def _code(segment: str) -> None:
+        if parts and parts[-1].endswith("\n"):
+            segment = segment.lstrip()
+        segment = re.sub(r"\s+", " ", segment)
+        segment = re.sub(r"\s*([{};,>])\s*", r"\1", segment)
+        segment = re.sub(r":\s+", ":", segment)
+        parts.append(segment.replace(";}", "}"))
+
+    # NOTE(xames3): The removed comments are replaced by a space, which
+    # is collapsed with the surrounding code, so minifying a stylesheet
+    # twice yields the same result.
+    segment = ""
+    for match in CSS_TOKENS.finditer(text):
+        segment += text[last : match.start()]
+        last = match.end()
+        string, comment = match.groups()
+        if comment and not comment.startswith("/*!"):
+            segment += " "
+            continue
+        _code(segment)
+        segment = ""
+        parts.append(string or f"{comment}\n")
+    _code(segment + text[last:])
+    return "".join(parts).strip()
+
+
+def minify_js(text: str) -> str:
+    """Minify a script.
+
+    Comments are removed (except the license comments), as well as the
+    indentation, trailing whitespace and empty lines. Runs of spaces are
+    collapsed, but line breaks are kept. Strings, template literals and
+    regular expression literals are kept as is.
+
+    :param text: The script.
+    :return: The minified script.
+    """
+    out: list[str] = []
+    size = len(text)
+    index = 0
+
+    def _significant() -> str:
+        """Return the last significant character of the output."""
+        for chunk in reversed(out):
+            stripped = chunk.rstrip()
+            if stripped:
+                return stripped
+        return ""
+
+    def _regex() -> bool:
+        """Return whether a slash starts a regular expression."""
+        previous = _significant()
+        if not previous or previous[-1] in JS_REGEX_PREFIX:
+            return True
+        word = re.search(r"[\w$]+$", previous)
+        return bool(word and word.group() in JS_REGEX_KEYWORDS)
+
+    def _space(whitespace: str) -> None:
+        """Append whitespace, merging it with the preceding one."""
+        if out and out[-1] in {" ", "\n"}:
+            if whitespace == "\n":
+                out[-1] = whitespace
+            return
+        out.append(whitespace)
+
+    def _skip(start: int, quote: str) -> int:
+        """Return the end of a string or a template literal."""
+        position = start + 1
+        while position < size and text[position] != quote:
+            position += 2 if text[position] == "\\" else 1
+        return position + 1
+
+    while index < size:
+        char = text[index]
+        if char in "'\"`":
+            end = _skip(index, char)
+            out.append(text[index:end])
+            index = end
+        elif text.startswith("//", index):
+            index = text.find("\n", index)
+            index = size if index < 0 else index
+        elif text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            end = size if end < 0 else end + 2
+            if text.startswith("/*!", index):
+                out.append(text[index:end])
+                _space("\n")
+            else:
+                _space(" ")
+            index = end
+        elif char == "/" and _regex():
+            position = index + 1
+            klass = False
+            while position < size and text[position] != "\n":
+                if text[position] == "\\":
+                    position += 2
+                    continue
+                if text[position] == "[":
+                    klass = True
+                elif text[position] == "]":
+                    klass = False
+                elif text[position] == "/" and not klass:
+                    break
+                position += 1
+            position += 1
+            while position < size and (
+                text[position].isalnum() or text[position] == "_"
+            ):
+                position += 1
+            out.append(text[index:position])
+            index = position
+        elif char in " \t\r\n":
+            end = index
+            while end < size and text[end] in " \t\r\n":
+                end += 1
+            _space("\n" if "\n" in text[index:end] else " ")
+            index = end
+        else:
+            end = index
+            while end < size and text[end] not in " \t\r\n'\"`/":
+                end += 1
+            out.append(text[index : max(end, index + 1)])
+            index = max(end, index + 1)
+    return "".join(out).strip() + "\n"
+
+
+def inline(static: Path, name: str, seen: set[str]) -> str:
+    """Return a stylesheet with its local `@import` rules inlined.
+
+    Only the stylesheets in the same directory are inlined, so the
+    relative URLs of the inlined stylesheets remain valid.
+
+    :param static: Directory of the stylesheets.
+    :param name: Name of the stylesheet.
+    :param seen: Names of the stylesheets inlined so far, so every
+        stylesheet is inlined once.
+    :return: The stylesheet with its imports inlined.
+    """
+    seen.add(name)
+
+    def _import(match: re.Match[str]) -> str:
+        imported = match.group(2)
+        if imported in seen:
+            return ""
+        if not (static / imported).is_file():
+            return match.group()
+        return inline(static, imported, seen)
+
+    text = (static / name).read_text(encoding="utf-8")
+    return CSS_IMPORT.sub(_import, text)
+
+
+def render(static: Path, name: str, sources: tuple[str, ...]) -> str:
+    """Return the minified content of a bundle.
+
+    :param static: Directory of the theme's static files.
+    :param name: Name of the bundle.
+    :param sources: Names of the bundled files, in order.
+    :return: The minified bundle.
+    """
+    if name.endswith(".js"):
+        return "".join(
+            minify_js((static / source).read_text(encoding="utf-8"))
+            for source in sources
+        )
+    seen: set[str] = set()
+    text = "\n".join(inline(static, source, seen) for source in sources)
+    hoisted = CSS_HOISTED.findall(text)
+    text = CSS_HOISTED.sub("", text)
+    charset = [rule for rule in hoisted if rule.startswith("@charset")][:1]
+    imports = [rule for rule in hoisted if rule.startswith("@import")]
+    return minify_css("".join(charset + imports) + text) + "\n"
+
+
+def build(app: Sphinx, static: Path) -> dict[str, str]:
+    """Build the bundles, reusing the cached ones.
+
+    :param app: The Sphinx application instance.
+    :param static: Directory of the theme's static files.
+    :return: Mapping of the bundles and their fingerprinted names.
+    """
+    store = cache.Cache(cache.directory(app, "bundles"), 16 * cache.MiB)
+    digests = [
+        f"{path.name}:{cache.filedigest(path)}"
+        for path in sorted(static.iterdir())
+        if path.suffix in {".css", ".js"}
+    ]
+    bundles: dict[str, str] = {}
+    built: dict[str, str] = {}
+    for name, sources in BUNDLES.items():
+        key = cache.digest(BUNDLE_VERSION, name, *sources, *digests)
+        if (data := store.read(key)) is not None:
+            content = data.decode()
+        else:
+            content = render(static, name, sources)
+            store.write(key, content.encode())
+        stem, _, ext = name.rpartition(".")
+        fingerprinted = f"{stem}.{cache.digest(content)[:12]}.{ext}"
+        bundles[name] = fingerprinted
+        built[fingerprinted] = content
+    app.builder.theme_bundles = built
+    return bundles
+
+
+def builder_inited(app: Sphinx) -> None:
+    """Replace the theme's stylesheets and scripts with their bundles.
+
+    :param app: The Sphinx application instance.
+    """
+    builder = t.cast("StandaloneHTMLBuilder", app.builder)
+    if builder.format != "html" or not flag(app, "bundle_assets", default=True):
+        return
+    static = Path(__file__).parent.parent / "base" / "static"
+    bundles = build(app, static)
+    for name, sources in BUNDLES.items():
+        script = name.endswith(".js")
+        assets: list[t.Any] = (
+            builder._js_files if script else builder._css_files
+        )
+        bundled = {f"_static/{source}" for source in sources}
+        for index, asset in enumerate(assets):
+            if asset.filename in bundled:
+                assets[index] = type(asset)(
+                    f"_static/{bundles[name]}",
+                    priority=asset.priority,
+                    **asset.attributes,
+                )
+                break
+        assets[:] = [asset for asset in assets if asset.filename not in bundled]
+        # NOTE(xames3): The assets added by the extensions are re-added
+        # by the builder before writing, so they're replaced in the
+        # registry as well.
+        registry = app.registry
+        registered: list[t.Any] = (
+            registry.js_files if script else registry.css_files
+        )
+        for index, (filename, attributes) in enumerate(registered):
+            if filename in sources:
+                registered[index] = (bundles[name], attributes)
+                break
+        registered[:] = [
+            entry for entry in registered if entry[0] not in sources
+        ]
+
+
+def write(builder: StandaloneHTMLBuilder) -> None:
+    """Write the bundles to the build's static directory.
+
+    As the bundles are named after their content, the existing ones are
+    never rewritten.
+
+    :param builder: The HTML builder.
+    """
+    for name, content in getattr(builder, "theme_bundles", {}).items():
+        path = Path(builder._static_dir, name)
+        if not path.exists():
+            path.write_text(content, encoding="utf-8")
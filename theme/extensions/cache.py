@@ -0,0 +1,195 @@
+"""\
+Theme Build Cache
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides a persistent, content-addressed on-disk cache used
+by this sphinx theme to avoid redoing expensive work across builds.
+
+Every entry is stored under the hex digest of its key, sharded by the
+first two characters of the digest. Entries are written atomically, so
+the cache can be shared between the forked worker processes of a build.
+The cache is bounded in size and evicts the least recently used entries
+first, where reading an entry counts as using it.
+
+By default, the cache lives in a `.cache/theme` directory next to the
+build's output directory, i.e. `docs/.cache/theme` for this website.
+It's kept outside of the output directory on purpose, so that it never
+gets deployed and can be saved and restored by the CI between runs. The
+location can be changed using the `cache_dir` option or the
+`THEME_CACHE_DIR` environment variable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import typing as t
+from pathlib import Path
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
+MiB: t.Final[int] = 1024 * 1024
+
+
+def directory(app: Sphinx, name: str) -> Path:
+    """Return the cache directory used for a particular purpose.
+
+    :param app: The Sphinx application instance.
+    :param name: Name of the cache, used as a sub directory.
+    :return: Path of the cache directory (may not exist yet).
+    """
+    root = app.config.html_context.get("cache_dir") or os.environ.get(
+        "THEME_CACHE_DIR"
+    )
+    if not root:
+        root = Path(app.outdir).parent / ".cache" / "theme"
+    return Path(root, name)
+
+
+def digest(*parts: str | bytes) -> str:
+    """Return a stable hex digest of the given parts.
+
+    :param parts: Parts of the key, strings are encoded as UTF-8.
+    :return: SHA-256 hex digest of the parts.
+    """
+    sha = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        sha.update(len(data).to_bytes(8, "little"))
+        sha.update(data)
+    return sha.hexdigest()
+
+
+def filedigest(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-256 hex digest of a file's content.
+
+    :param path: Path of the file.
+    :return: SHA-256 hex digest of the file.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class Cache:
+    """Content-addressed on-disk cache with LRU eviction.
+
+    :param root: Directory where the entries are stored.
+    :param limit: Maximum size of the cache in bytes, defaults to
+        256 MiB.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], limit: int = 256 * MiB):
+        self.root = Path(root)
+        self.limit = limit
+
+    def path(self, key: str) -> Path:
+        """Return the path of an entry.
+
+        :param key: Hex digest identifying the entry.
+        :return: Path of the entry (may not exist).
+        """
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> Path | None:
+        """Return the path of an entry and mark it as recently used.
+
+        :param key: Hex digest identifying the entry.
+        :return: Path of the entry, or `None` if it's not cached.
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def fetch(self, key: str, dest: str | os.PathLike[str]) -> bool:
+        """Copy a cached entry to the destination.
+
+        :param key: Hex digest identifying the entry.
+        :param dest: Path where the entry should be copied to.
+        :return: `True` if the entry was cached and copied.
+        """
+        path = self.get(key)
+        if path is None:
+            return False
+        try:
+            shutil.copyfile(path, dest)
+        except OSError:
+            return False
+        return True
+
+    def read(self, key: str) -> bytes | None:
+        """Return the content of a cached entry.
+
+        :param key: Hex digest identifying the entry.
+        :return: Content of the entry, or `None` if it's not cached.
+        """
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def store(self, key: str, src: str | os.PathLike[str]) -> None:
+        """Store a copy of a file in the cache.
+
+        :param key: Hex digest identifying the entry.
+        :param src: Path of the file to be cached.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def write(self, key: str, data: bytes) -> None:
+        """Store content in the cache.
+
+        :param key: Hex digest identifying the entry.
+        :param data: Content to be cached.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Evict the least recently used entries over the size limit.
+
+        :return: Number of evicted entries.
+        """
+        if not self.root.is_dir():
+            return 0
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("??/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        size = sum(entry[1] for entry in entries)
+        evicted = 0
+        for _, length, path in sorted(entries):
+            if size <= self.limit:
+                break
+            path.unlink(missing_ok=True)
+            size -= length
+            evicted += 1
+        return evicted
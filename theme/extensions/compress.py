@@ -0,0 +1,208 @@
+"""\
+Precompressed Output
+====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module writes precompressed siblings of the build's output, so a
+static host can serve them as is instead of compressing every response
+on the fly (or not at all).
+
+Once the build is finished (and the pages are post-processed), every
+text file of the output (HTML, CSS, JS, SVG and so on) larger than
+`precompress_min_size` bytes gets a `.gz` sibling, compressed with the
+maximum level of gzip, and a `.br` sibling, compressed with the maximum
+quality of Brotli. If the `brotli` package (a dependency of the theme)
+isn't installed, only the `.gz` siblings are written. A sibling which
+isn't smaller than its file is not written at all.
+
+The files are compressed in parallel by a thread pool, as both of the
+compressors release the GIL. A manifest of the compressed files and the
+hashes of their content is kept in the build's doctree directory, so the
+files which haven't changed since the last build are skipped.
+
+Precompression is disabled by default, and can be enabled by setting
+the `precompress` option.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_VERSION: t.Final[str] = "1"
+MANIFEST: t.Final[str] = "theme-compress.json"
+SUFFIXES: t.Final[frozenset[str]] = frozenset(
+    {
+        ".css",
+        ".html",
+        ".js",
+        ".json",
+        ".map",
+        ".mjs",
+        ".svg",
+        ".txt",
+        ".webmanifest",
+        ".xml",
+    }
+)
+
+
+def encoders() -> dict[str, Callable[[bytes], bytes]]:
+    """Return the available compressors, keyed by their file suffix.
+
+    :return: Mapping of the suffixes and their compressors.
+    """
+    available: dict[str, Callable[[bytes], bytes]] = {
+        ".gz": partial(gzip.compress, compresslevel=9, mtime=0)
+    }
+    try:
+        import brotli
+    except ImportError:
+        logger.info("Brotli is not installed, skipping the .br siblings")
+    else:
+        available[".br"] = partial(
+            brotli.compress, quality=11, mode=brotli.MODE_TEXT
+        )
+    return available
+
+
+def files(outdir: Path, threshold: int) -> list[Path]:
+    """Return the text files of the output which are worth compressing.
+
+    :param outdir: The build's output directory.
+    :param threshold: Minimum size of the files in bytes.
+    :return: List of the files to be compressed.
+    """
+    found = []
+    for root, dirnames, filenames in os.walk(outdir):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        for filename in filenames:
+            path = Path(root, filename)
+            if path.suffix.lower() not in SUFFIXES:
+                continue
+            try:
+                if path.stat().st_size >= threshold:
+                    found.append(path)
+            except OSError:
+                continue
+    return found
+
+
+def compress(
+    path: Path,
+    entry: dict[str, t.Any],
+    available: dict[str, Callable[[bytes], bytes]],
+) -> dict[str, t.Any] | None:
+    """Write the compressed siblings of a file, unless it's unchanged.
+
+    :param path: Path of the file.
+    :param entry: Manifest entry of the file from the last build.
+    :param available: Mapping of the suffixes and their compressors.
+    :return: Manifest entry of the file with the hash of its content and
+        the suffixes of its siblings, or `None` if it was unchanged.
+    """
+    data = path.read_bytes()
+    digest = cache.digest(data)
+    if entry.get("digest") == digest and all(
+        path.with_name(f"{path.name}{suffix}").exists()
+        for suffix in entry.get("siblings", ())
+    ):
+        return None
+    written = []
+    for suffix, encode in available.items():
+        sibling = path.with_name(f"{path.name}{suffix}")
+        compressed = encode(data)
+        if len(compressed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            continue
+        tmp = sibling.with_name(f".{sibling.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, sibling)
+        written.append(suffix)
+    return {"digest": digest, "siblings": written}
+
+
+def build_finished(app: Sphinx, exc: Exception | None) -> None:
+    """Write the compressed siblings of the changed output files.
+
+    This runs after the pages are post-processed, so the siblings are
+    compressed from their final content.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    if exc or app.builder.format != "html" or not flag(app, "precompress"):
+        return
+    outdir = Path(app.outdir)
+    threshold = int(option(app, "precompress_min_size", 1024))
+    available = encoders()
+    manifest = Path(app.doctreedir, MANIFEST)
+    try:
+        previous = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    signature = [COMPRESS_VERSION, *sorted(available)]
+    entries = previous.get("files", {})
+    if previous.get("signature") != signature:
+        entries = {}
+    found = {
+        path.relative_to(outdir).as_posix(): path
+        for path in files(outdir, threshold)
+    }
+    compressed: dict[str, dict[str, t.Any]] = {}
+    changed = 0
+    workers = int(option(app, "precompress_workers", 0)) or os.cpu_count()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            relpath: executor.submit(
+                compress, path, entries.get(relpath, {}), available
+            )
+            for relpath, path in found.items()
+        }
+        for relpath, future in futures.items():
+            try:
+                entry = future.result()
+            except OSError as exc:
+                logger.warning("Failed to compress %s: %s", relpath, exc)
+                continue
+            if entry is None:
+                entry = entries[relpath]
+            else:
+                changed += 1
+            compressed[relpath] = entry
+    for relpath in entries.keys() - compressed.keys():
+        for suffix in entries[relpath].get("siblings", ()):
+            Path(outdir, f"{relpath}{suffix}").unlink(missing_ok=True)
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(
+        json.dumps({"signature": signature, "files": compressed}, indent=2),
+        encoding="utf-8",
+    )
+    logger.info(
+        "Precompressed %d file(s), %d unchanged",
+        changed,
+        len(compressed) - changed,
+    )
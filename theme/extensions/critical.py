@@ -0,0 +1,484 @@
+"""\
+Critical CSS
+============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module inlines the critical CSS of every page, i.e. the rules of
+the theme's stylesheets needed for rendering the structure above the
+fold (the header, the left sidebar and the start of the article), and
+loads the full stylesheets asynchronously, so they no longer block the
+first render of the page.
+
+The critical CSS is derived from the page's template. The template is
+scanned for the classes, IDs and elements it uses, following its
+`extends` and `include` tags, except for the templates rendered below
+the fold (like the footer). The classes and elements of the generated
+markup, like the ToC of the left sidebar and the article's heading, are
+added to them. A rule of the stylesheets is critical if any of its
+selectors only uses these classes, IDs and elements, and only those
+selectors are kept. Attribute selectors and the pseudo-classes and
+pseudo-elements are ignored for the matching, so the critical CSS errs
+on the side of including a rule, except for the interactive states
+(like `:hover`), which aren't needed for the first render.
+
+The font faces, keyframes and the rules referencing relative URLs are
+left to the full stylesheets, as the URLs would be resolved relative to
+the page instead of the stylesheet.
+
+The critical CSS is capped at `critical_css_limit` bytes (14 KiB by
+default, so it fits in the first round trip along with the markup).
+Whole rules are kept by their rank, the base rules (the custom
+properties, the resets and the elements) first, then the rules of the
+layout, the header and the left sidebar, and the rest of the rules (the
+start of the article) last, and the kept rules stay in their order in
+the stylesheets. The rules which don't fit are only applied once the
+full stylesheets are loaded, which is logged along with the number of
+bytes truncated. Only the theme's
+own stylesheets are deferred, the ones added by the other extensions
+(like Pygments' styles) are loaded as usual, as the critical CSS
+doesn't cover them.
+
+The critical CSS is computed once per template and cached by the hash
+of the template sources and the theme's stylesheets, so it's only
+recomputed when either of them changes. It can be disabled by setting
+`inline_critical_css` to `False`.
+"""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from pathlib import Path
+
+from jinja2 import TemplateNotFound
+from sphinx.util import logging
+
+from theme.extensions import bundles
+from theme.extensions import cache
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    import docutils.nodes as nodes
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+CRITICAL_VERSION: t.Final[str] = "2"
+LIMIT: t.Final[int] = 14 * 1024
+BELOW_THE_FOLD: t.Final[frozenset[str]] = frozenset(
+    {
+        "feedback.html.jinja",
+        "footer.html.jinja",
+        "previous_next_pages.html.jinja",
+        "scrolltop.html.jinja",
+    }
+)
+GENERATED_CLASSES: t.Final[frozenset[str]] = frozenset(
+    {
+        "caption",
+        "caption-text",
+        "current",
+        "has-children",
+        "headerlink",
+        "internal",
+        "nav-toggle",
+        "reference",
+        "section",
+        "sr-only",
+        "toctree-l1",
+        "toctree-l2",
+        "toctree-l3",
+        "toctree-wrapper",
+    }
+)
+GENERATED_ELEMENTS: t.Final[frozenset[str]] = frozenset(
+    {
+        "a",
+        "body",
+        "button",
+        "h1",
+        "html",
+        "li",
+        "p",
+        "section",
+        "span",
+        "ul",
+    }
+)
+REFERENCES: re.Pattern[str] = re.compile(
+    r"""{%-?\s*(?:extends|include)\s+["']([^"']+)["']"""
+)
+CLASSES: re.Pattern[str] = re.compile(
+    r"""(?:\bclass|:class)\s*=\s*"([^"]*)"|classList\.\w+\(([^)]*)\)"""
+)
+IDS: re.Pattern[str] = re.compile(r"""\bid\s*=\s*["']([^"'{]+)["']""")
+ELEMENTS: re.Pattern[str] = re.compile(r"<([a-zA-Z][\w-]*)")
+TOKENS: re.Pattern[str] = re.compile(r"""[^\s'"{}(),:!=&|?]+""")
+IGNORED: re.Pattern[str] = re.compile(
+    r"\[[^\]]*\]|(?<!\\)::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?"
+)
+INTERACTIVE: re.Pattern[str] = re.compile(
+    r":(?:active|focus|focus-visible|focus-within|hover|visited)\b"
+    r"|::(?:backdrop|selection|-webkit-scrollbar[\w-]*)"
+)
+NESTED: t.Final[tuple[str, ...]] = (
+    "@container",
+    "@layer",
+    "@media",
+    "@supports",
+)
+CHROME: re.Pattern[str] = re.compile(
+    r"[.#](?:site-(?:body|shell|layout|header|sidebar)|left-sidebar"
+    r"|toctree-|nav-toggle|sr-only)"
+)
+RELATIVE_URL: re.Pattern[str] = re.compile(
+    r"""url\(\s*["']?(?!data:|https?:|//|#)"""
+)
+
+
+class scanned(t.NamedTuple):
+    """Class to represent the classes, IDs and elements of a template."""
+
+    sources: list[str]
+    classes: set[str]
+    ids: set[str]
+    elements: set[str]
+
+
+def scan(app: Sphinx, templatename: str) -> scanned:
+    """Scan a template and the templates rendered above the fold by it.
+
+    :param app: The Sphinx application instance.
+    :param templatename: Name of the page's template.
+    :return: Sources of the scanned templates, with the classes, IDs
+        and elements used by them.
+    """
+    loader = app.builder.templates
+    found = scanned([], set(GENERATED_CLASSES), set(), set(GENERATED_ELEMENTS))
+    pending = [templatename]
+    seen: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in seen or name.lstrip("!") in BELOW_THE_FOLD:
+            continue
+        seen.add(name)
+        try:
+            source, _, _ = loader.get_source(loader.environment, name)
+        except TemplateNotFound:
+            continue
+        found.sources.append(f"{name}:{source}")
+        pending.extend(REFERENCES.findall(source))
+        for attribute in CLASSES.findall(source):
+            found.classes.update(TOKENS.findall(" ".join(attribute)))
+        found.ids.update(IDS.findall(source))
+        found.elements.update(tag.lower() for tag in ELEMENTS.findall(source))
+    return found
+
+
+def rules(text: str) -> list[tuple[str, str]]:
+    """Split a stylesheet into its top-level rules.
+
+    :param text: The stylesheet.
+    :return: List of the preludes and the bodies of the rules, the
+        statements (like `@import`) are skipped.
+    """
+    parsed: list[tuple[str, str]] = []
+    size = len(text)
+    index = start = 0
+    depth = 0
+    prelude = ""
+    while index < size:
+        char = text[index]
+        if char in "'\"":
+            index += 1
+            while index < size and text[index] != char:
+                index += 2 if text[index] == "\\" else 1
+        elif text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            index = size if end < 0 else end + 1
+            if not depth:
+                start = index + 1
+        elif char == "{":
+            if not depth:
+                prelude = text[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if not depth:
+                parsed.append((prelude, text[start:index]))
+                start = index + 1
+        elif char == ";" and not depth:
+            start = index + 1
+        index += 1
+    return parsed
+
+
+def selectors(prelude: str) -> list[str]:
+    """Split a selector list into its selectors.
+
+    :param prelude: Selector list of a rule.
+    :return: List of the selectors.
+    """
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and not depth:
+            parts.append(prelude[start:index])
+            start = index + 1
+    parts.append(prelude[start:])
+    return parts
+
+
+def matches(selector: str, found: scanned) -> bool:
+    """Check if a selector only uses the scanned names.
+
+    The selectors of the interactive states (like `:hover`) never match,
+    as they aren't needed for the first render.
+
+    :param selector: Selector of a rule.
+    :param found: The scanned classes, IDs and elements.
+    :return: `True` if the selector applies to the scanned templates.
+    """
+    if INTERACTIVE.search(selector):
+        return False
+    selector = IGNORED.sub("", selector)
+    classes = [
+        name.replace("\\", "")
+        for name in re.findall(r"\.((?:\\.|[\w-])+)", selector)
+    ]
+    ids = re.findall(r"#([\w-]+)", selector)
+    elements = re.findall(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)", selector)
+    return (
+        all(name in found.classes for name in classes)
+        and all(name in found.ids for name in ids)
+        and all(name.lower() in found.elements for name in elements)
+    )
+
+
+def extract(text: str, found: scanned) -> str:
+    """Return the critical rules of a stylesheet.
+
+    :param text: The minified stylesheet.
+    :param found: The scanned classes, IDs and elements.
+    :return: The critical rules, minified.
+    """
+    critical: list[str] = []
+    for prelude, body in rules(text):
+        if prelude.startswith(NESTED):
+            if nested := extract(body, found):
+                critical.append(f"{prelude}{{{nested}}}")
+        elif prelude.startswith("@") or RELATIVE_URL.search(body):
+            continue
+        elif matched := [
+            selector
+            for selector in selectors(prelude)
+            if matches(selector, found)
+        ]:
+            critical.append(f"{','.join(matched)}{{{body}}}")
+    return "".join(critical)
+
+
+def rank(prelude: str, body: str) -> int:
+    """Rank a critical rule by how much of the first render it covers.
+
+    :param prelude: Selector list or at-rule of the rule.
+    :param body: Body of the rule.
+    :return: `0` for the base rules, which don't use any class or ID
+        (like the custom properties and the resets), `1` for the rules
+        of the layout, the header and the left sidebar, and `2` for the
+        rest of the rules. The nested rules take the best rank of the
+        rules inside them.
+    """
+    if prelude.startswith("@"):
+        return min((rank(*rule) for rule in rules(body)), default=2)
+    if not re.search(r"[.#]", IGNORED.sub("", prelude)):
+        return 0
+    return 1 if CHROME.search(prelude) else 2
+
+
+def cap(css: str, limit: int) -> str:
+    """Trim the critical CSS to its size limit.
+
+    Whole rules are kept by their rank, see `rank`, and a rule which
+    doesn't fit is skipped in favour of the smaller ones after it. The
+    kept rules stay in their order in the stylesheets, so the cascade
+    between them is unchanged.
+
+    :param css: The critical CSS.
+    :param limit: Maximum size of the critical CSS in bytes.
+    :return: The rules of the critical CSS which fit in the limit.
+    """
+    parsed = rules(css)
+    sizes = [len(f"{prelude}{{{body}}}".encode()) for prelude, body in parsed]
+    kept: set[int] = set()
+    size = 0
+    for index in sorted(range(len(parsed)), key=lambda i: rank(*parsed[i])):
+        if size + sizes[index] <= limit:
+            kept.add(index)
+            size += sizes[index]
+    return "".join(
+        f"{prelude}{{{body}}}"
+        for index, (prelude, body) in enumerate(parsed)
+        if index in kept
+    )
+
+
+def compute(app: Sphinx, templatename: str) -> str:
+    """Return the critical CSS of a template, reusing the cached one.
+
+    :param app: The Sphinx application instance.
+    :param templatename: Name of the page's template.
+    :return: The critical CSS of the template.
+    """
+    static = Path(__file__).parent.parent / "base" / "static"
+    stylesheets = [
+        (name, sources)
+        for name, sources in bundles.BUNDLES.items()
+        if name.endswith(".css")
+    ]
+    found = scan(app, templatename)
+    limit = int(option(app, "critical_css_limit", LIMIT))
+    digests = [
+        f"{path.name}:{cache.filedigest(path)}"
+        for path in sorted(static.glob("*.css"))
+    ]
+    key = cache.digest(
+        CRITICAL_VERSION,
+        bundles.BUNDLE_VERSION,
+        str(limit),
+        *found.sources,
+        *digests,
+    )
+    store = cache.Cache(cache.directory(app, "critical"), 4 * cache.MiB)
+    if (data := store.read(key)) is not None:
+        return data.decode()
+    extracted = "".join(
+        extract(bundles.render(static, name, sources), found)
+        for name, sources in stylesheets
+    )
+    css = cap(extracted, limit)
+    if (truncated := len(extracted.encode()) - len(css.encode())) > 0:
+        logger.info(
+            "Critical CSS of %s truncated by %d of %d bytes, the rules "
+            "left out apply once the stylesheets load (raise "
+            "critical_css_limit to inline them, at the cost of a larger "
+            "first round trip)",
+            templatename,
+            truncated,
+            len(extracted.encode()),
+        )
+    # NOTE(xames3): The critical CSS is inlined in a `style` element,
+    # which must not be closed by the content of a string.
+    css = css.replace("</", "<\\/")
+    store.write(key, css.encode())
+    logger.verbose(
+        "Critical CSS of %s: %d bytes", templatename, len(css.encode())
+    )
+    return css
+
+
+def owned(app: Sphinx) -> set[str]:
+    """Return the theme's own stylesheets.
+
+    :param app: The Sphinx application instance.
+    :return: Paths of the theme's stylesheets and of their bundles,
+        relative to the output directory.
+    """
+    names = {
+        source
+        for name, sources in bundles.BUNDLES.items()
+        if name.endswith(".css")
+        for source in sources
+    }
+    names.update(getattr(app.builder, "theme_bundles", {}))
+    return {f"_static/{name}" for name in names if name.endswith(".css")}
+
+
+def deferred(css: t.Any, theme: set[str]) -> t.Any:
+    """Return a stylesheet which is loaded without blocking the render.
+
+    The stylesheet is loaded for the `print` media, which doesn't block
+    the render, and switched to all media once it's loaded.
+
+    :param css: The stylesheet.
+    :param theme: Paths of the theme's own stylesheets, see `owned`.
+    :return: The deferred stylesheet, or the stylesheet itself if it
+        is not one of the theme's plain stylesheets for all media.
+    """
+    attributes = getattr(css, "attributes", None)
+    if (
+        getattr(css, "filename", css) not in theme
+        or not attributes
+        or attributes.get("rel") != "stylesheet"
+        or attributes.get("media", "all") != "all"
+        or "onload" in attributes
+    ):
+        return css
+    return type(css)(
+        css.filename,
+        priority=css.priority,
+        **{**attributes, "media": "print", "onload": "this.media='all'"},
+    )
+
+
+def html_page_context(
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, t.Any],
+    doctree: nodes.Node,
+) -> None:
+    """Inline the critical CSS of the page and defer its stylesheets.
+
+    The original deferred stylesheets are kept as `noscript_css_files`,
+    so they are loaded as usual if JavaScript is disabled.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being processed.
+    :param templatename: The name of the HTML template used for
+        rendering.
+    :param context: Context variables passed to the template.
+    :param doctree: The document tree for the current page.
+    """
+    # NOTE(xames3): The parameters `pagename` and `doctree` are
+    # currently unused but are included to match the expected signature
+    # for a Sphinx event handler.
+    pagename = pagename or ""
+    del doctree
+    if app.builder.name not in {"html", "dirhtml"} or not flag(
+        app, "inline_critical_css", default=True
+    ):
+        return
+    if not hasattr(app.builder, "theme_critical_css"):
+        app.builder.theme_critical_css = {}
+    computed = app.builder.theme_critical_css
+    if templatename not in computed:
+        computed[templatename] = compute(app, templatename)
+    if not computed[templatename]:
+        return
+    css_files = context.get("css_files", [])
+    theme = owned(app)
+    loaded = [deferred(css, theme) for css in css_files]
+    context["critical_css"] = computed[templatename]
+    # NOTE(xames3): The stylesheets are sorted by their priority after
+    # this event, so are the ones which aren't deferred.
+    context["noscript_css_files"] = sorted(
+        (
+            css
+            for css, deferring in zip(css_files, loaded, strict=True)
+            if deferring is not css
+        ),
+        key=lambda css: getattr(css, "priority", 500),
+    )
+    context["css_files"] = loaded
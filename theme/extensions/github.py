@@ -0,0 +1,353 @@
+"""\
+GitHub Repository Stats
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the stats (stars, forks and open issues) of the
+GitHub repositories embedded by the `repository` directive of this
+sphinx theme, fetched from GitHub's REST API at build time.
+
+The stats are cached on disk, one entry per repository, along with the
+time they were fetched and the `ETag` of the response. An entry is
+fresh for `github_ttl` seconds (a day by default), after which it's
+revalidated with a conditional request. If the stats haven't changed,
+GitHub responds with `304 Not Modified`, which doesn't count against
+the rate limit of the API. The repositories which don't exist are
+cached as well, so they aren't requested on every build. The requests
+are authenticated if the `GITHUB_TOKEN` environment variable is set.
+
+Every repository referenced by the documents is gathered before they're
+read, and the stats which aren't cached (or have expired) are fetched
+concurrently, over the pooled connections of `theme.extensions.remote`.
+The directive then renders the cached stats straight into the page.
+The documents which rendered any stats that have changed since are
+marked as outdated, so they're rewritten with the new stats.
+
+Once the rate limit is exceeded (or if the build is offline), the stale
+entries are used as is and the repositories without any stats are left
+to the client-side script of the theme, which fetches them on page
+load like before.
+
+The build-time stats are disabled by default, and can be enabled by
+setting the `repository_stats` option. The API can be changed using the
+`github_endpoint` option, for example to point it to a local stand-in
+server.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions import oembed
+from theme.extensions import remote
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+GITHUB_VERSION: t.Final[str] = "1"
+ENDPOINT: t.Final[str] = "https://api.github.com"
+TTL: t.Final[int] = 24 * 60 * 60
+DIRECTIVE: re.Pattern[str] = re.compile(r"^(\s*)\.\.\s+(repository)::(.*)$")
+
+attempted: set[str] = set()
+limited: bool = False
+
+
+def enabled(app: Sphinx) -> bool:
+    """Check if the stats are rendered at build time.
+
+    :param app: The Sphinx application instance.
+    :return: `True` if the `repository_stats` option is set.
+    """
+    return flag(app, "repository_stats")
+
+
+def store(app: Sphinx) -> cache.Cache:
+    """Return the cache of the stats.
+
+    :param app: The Sphinx application instance.
+    :return: Cache of the stats entries.
+    """
+    return cache.Cache(cache.directory(app, "github"), 4 * cache.MiB)
+
+
+def key(repo: str) -> str:
+    """Return the cache key of a repository's stats.
+
+    :param repo: Full name of the repository, like `owner/name`.
+    :return: Hex digest identifying the entry.
+    """
+    return cache.digest(GITHUB_VERSION, repo.lower())
+
+
+def cached(app: Sphinx, repo: str) -> dict[str, t.Any] | None:
+    """Return the cached entry of a repository's stats.
+
+    :param app: The Sphinx application instance.
+    :param repo: Full name of the repository.
+    :return: Entry with the time it was fetched, the `ETag` of the
+        response and the stats (which are `None` for a repository which
+        doesn't exist), or `None` if not cached.
+    """
+    data = store(app).read(key(repo))
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def fresh(app: Sphinx, entry: dict[str, t.Any] | None) -> bool:
+    """Check if a cached entry hasn't expired.
+
+    :param app: The Sphinx application instance.
+    :param entry: The cached entry, if any.
+    :return: `True` if the entry is younger than `github_ttl`.
+    """
+    ttl = float(option(app, "github_ttl", TTL))
+    return entry is not None and time.time() - entry["fetched"] < ttl
+
+
+def headers(entry: dict[str, t.Any] | None) -> dict[str, str]:
+    """Return the headers of a request for a repository's stats.
+
+    :param entry: The cached entry, if any, which is revalidated using
+        its `ETag`.
+    :return: Mapping of the request headers.
+    """
+    found = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token := os.environ.get("GITHUB_TOKEN"):
+        found["Authorization"] = f"Bearer {token}"
+    if entry and entry.get("etag"):
+        found["If-None-Match"] = entry["etag"]
+    return found
+
+
+def fetch(app: Sphinx, repo: str) -> bool:
+    """Fetch (or revalidate) and cache the stats of a repository.
+
+    :param app: The Sphinx application instance.
+    :param repo: Full name of the repository.
+    :return: `True` if the API responded, even if the repository doesn't
+        exist.
+    """
+    global limited
+    attempted.add(repo)
+    if limited:
+        return False
+    entry = cached(app, repo)
+    endpoint = option(app, "github_endpoint", ENDPOINT).rstrip("/")
+    response = remote.get(
+        app, f"{endpoint}/repos/{repo}", headers=headers(entry)
+    )
+    if response is None or response.status_code >= 500:
+        return False
+    if response.status_code in {403, 429}:
+        # NOTE(xames3): The concurrent fetches may all be limited at
+        # once, so only the first of them reports the rate limit.
+        if not limited:
+            limited = True
+            logger.info(
+                "GitHub API rate limit exceeded, using the cached stats"
+            )
+        return False
+    if response.status_code == 304 and entry is not None:
+        entry["fetched"] = time.time()
+    else:
+        stats = None
+        if response.ok:
+            try:
+                data: dict[str, t.Any] = response.json()
+                stats = {
+                    "stars": int(data["stargazers_count"]),
+                    "forks": int(data["forks_count"]),
+                    "issues": int(data["open_issues_count"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                return False
+        entry = {
+            "fetched": time.time(),
+            "etag": response.headers.get("ETag"),
+            "stats": stats,
+        }
+    store(app).write(key(repo), json.dumps(entry).encode())
+    return True
+
+
+def lookup(app: Sphinx, repo: str) -> dict[str, int]:
+    """Return the stats of a repository.
+
+    The stats are read from the cache, which is filled before the
+    documents are read. They're only fetched if the repository wasn't
+    found by the scan of the sources (like the ones in the included
+    files).
+
+    :param app: The Sphinx application instance.
+    :param repo: Full name of the repository.
+    :return: The stats, which are empty if they're not available.
+    """
+    entry = cached(app, repo)
+    if entry is None and repo not in attempted and fetch(app, repo):
+        entry = cached(app, repo)
+    return (entry or {}).get("stats") or {}
+
+
+def prefetch(app: Sphinx, repos: set[str]) -> None:
+    """Fetch the stats of the repositories which aren't cached or have
+    expired.
+
+    :param app: The Sphinx application instance.
+    :param repos: Full names of the repositories.
+    """
+    pending = sorted(
+        repo
+        for repo in repos
+        if repo not in attempted and not fresh(app, cached(app, repo))
+    )
+    if not pending or remote.offline(app):
+        return
+    with ThreadPoolExecutor(max_workers=remote.workers(app)) as executor:
+        fetched = sum(executor.map(partial(fetch, app), pending))
+    logger.info(
+        "Fetched the stats of %d repositories, %d cached, %d failed",
+        fetched,
+        len(repos) - len(pending),
+        len(pending) - fetched,
+    )
+
+
+def rendered(env: BuildEnvironment) -> dict[str, dict[str, dict[str, int]]]:
+    """Return the stats rendered by the documents.
+
+    :param env: The build environment.
+    :return: Mapping of the documents and the stats of the repositories
+        rendered by them.
+    """
+    if not hasattr(env, "theme_repositories"):
+        env.theme_repositories = {}
+    return t.cast(
+        "dict[str, dict[str, dict[str, int]]]", env.theme_repositories
+    )
+
+
+def record(env: BuildEnvironment, repo: str, stats: dict[str, int]) -> None:
+    """Record the stats of a repository rendered by the document being
+    read.
+
+    :param env: The build environment.
+    :param repo: Full name of the repository.
+    :param stats: The rendered stats.
+    """
+    rendered(env).setdefault(env.docname, {})[repo] = stats
+
+
+def env_get_outdated(
+    app: Sphinx,
+    env: BuildEnvironment,
+    added: set[str],
+    changed: set[str],
+    removed: set[str],
+) -> list[str]:
+    """Refresh the stats rendered by the documents which are up to date.
+
+    The expired stats of the repositories are revalidated, and the
+    documents rendering any stats which have changed since are marked as
+    outdated.
+
+    :param app: The Sphinx application instance.
+    :param env: The current build environment.
+    :param added: The names of the added documents.
+    :param changed: The names of the changed documents.
+    :param removed: The names of the removed documents.
+    :return: The names of the documents to be read again.
+    """
+    if not enabled(app):
+        return []
+    current = {
+        docname: repos
+        for docname, repos in rendered(env).items()
+        if docname not in added | changed | removed
+    }
+    prefetch(app, {repo for repos in current.values() for repo in repos})
+    return sorted(
+        docname
+        for docname, repos in current.items()
+        if any(lookup(app, repo) != stats for repo, stats in repos.items())
+    )
+
+
+def env_before_read_docs(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Prefetch the stats of the repositories of the documents to be
+    read.
+
+    :param app: The Sphinx application instance.
+    :param env: The current build environment.
+    :param docnames: A list of document names to be read.
+    """
+    if not enabled(app):
+        return
+    repos = {
+        repo
+        for source in oembed.sources(env, docnames)
+        for _, repo in oembed.scan(source, DIRECTIVE)
+    }
+    if repos:
+        prefetch(app, repos)
+
+
+def env_purge_doc(_: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the stats rendered by a document which is removed or
+    re-read.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment.
+    :param docname: The name of the document.
+    """
+    if hasattr(env, "theme_repositories"):
+        env.theme_repositories.pop(docname, None)
+
+
+def env_merge_info(
+    _: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the stats rendered by the parallel reading processes.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment of the main process.
+    :param docnames: The names of the documents read by the process.
+    :param other: The build environment of the reading process.
+    """
+    repositories = getattr(other, "theme_repositories", {})
+    rendered(env).update(
+        (docname, repositories[docname])
+        for docname in docnames
+        if docname in repositories
+    )
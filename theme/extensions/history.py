@@ -0,0 +1,202 @@
+"""\
+Git History Index
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module builds a repository-wide index of the last commit date of
+every file in the documentation's source directory. The index is built
+once per build from a single `git log --name-only` walk, instead of
+spawning a `git log -n1` process per document.
+
+The index is persisted in the theme's build cache, keyed by the `HEAD`
+commit. So, builds of an unchanged repository skip the walk entirely.
+The cache is pruned to its size limit once the build is finished, so
+the indexes of the older commits are evicted.
+
+In a shallow clone (like a CI checkout with `fetch-depth: 1`), the
+commits at the clone boundary appear to add every file of the
+repository. The dates from these commits are ignored, so the affected
+documents fall back to their file timestamps, unless the
+`last_updated_unshallow` option is set, in which case the missing
+history is fetched before walking it.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from pathlib import Path
+from subprocess import DEVNULL
+from subprocess import CalledProcessError
+from subprocess import check_output as co
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+
+
+if t.TYPE_CHECKING:
+    import os
+
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT: t.Final[str] = "%B %d, %Y"
+
+root: Path | None = None
+dates: dict[str, str] = {}
+
+
+def git(*args: str, cwd: str | os.PathLike[str]) -> str:
+    """Run a git command and return its output.
+
+    :param args: Arguments passed to git.
+    :param cwd: Directory to run the command in.
+    :return: Decoded output of the command.
+    :raises CalledProcessError: If the command fails.
+    :raises FileNotFoundError: If git is not installed.
+    """
+    cmd = ["git", "-c", "core.quotepath=off", *args]
+    return co(cmd, cwd=cwd, stderr=DEVNULL).decode()  # noqa: S603
+
+
+def boundary(top: Path) -> set[str]:
+    """Return the commits at the boundary of a shallow clone.
+
+    :param top: Top level directory of the repository.
+    :return: Set of commit hashes, empty if the clone is not shallow.
+    """
+    if git("rev-parse", "--is-shallow-repository", cwd=top).strip() != "true":
+        return set()
+    shallow = Path(
+        top, git("rev-parse", "--git-path", "shallow", cwd=top).strip()
+    )
+    try:
+        return set(shallow.read_text().split())
+    except OSError:
+        return set()
+
+
+def walk(top: Path, path: str, shallow: set[str]) -> dict[str, str]:
+    """Walk the history once and collect the last commit date per file.
+
+    :param top: Top level directory of the repository.
+    :param path: Path (relative to the top level directory) to which
+        the walk is restricted.
+    :param shallow: Commits at the boundary of a shallow clone, whose
+        dates are ignored.
+    :return: Mapping of file paths (relative to the top level directory)
+        and their last commit dates.
+    """
+    out = git(
+        "log",
+        "--name-only",
+        "--format=%x00%H %cd",
+        f"--date=format:{DATE_FORMAT}",
+        "--",
+        path,
+        cwd=top,
+    )
+    found: dict[str, str] = {}
+    for entry in out.split("\x00")[1:]:
+        header, _, names = entry.partition("\n")
+        commit, _, on = header.partition(" ")
+        if commit in shallow:
+            continue
+        for name in names.splitlines():
+            if name:
+                found.setdefault(name, on)
+    return found
+
+
+def history_cache(app: Sphinx) -> cache.Cache:
+    """Return the cache of the indexes.
+
+    :param app: The Sphinx application instance.
+    :return: The cache.
+    """
+    return cache.Cache(cache.directory(app, "history"), 4 * cache.MiB)
+
+
+def build(app: Sphinx) -> None:
+    """Build (or load) the index of last commit dates for the build.
+
+    The index is loaded from the cache if it was already built for the
+    current `HEAD` commit, otherwise the history is walked once and the
+    index is persisted for the next builds.
+
+    :param app: The Sphinx application instance.
+    """
+    # NOTE(xames3): The utilities import this module, so they're only
+    # imported once the build has started.
+    from theme.extensions.utils import flag
+
+    global root
+    root = None
+    dates.clear()
+    srcdir = Path(app.srcdir).resolve()
+    try:
+        top = Path(git("rev-parse", "--show-toplevel", cwd=srcdir).strip())
+        head = git("rev-parse", "HEAD", cwd=top).strip()
+        shallow = boundary(top)
+        if shallow and flag(app, "last_updated_unshallow"):
+            logger.info("Fetching the full history for last updated dates")
+            git("fetch", "--unshallow", "--quiet", cwd=top)
+            shallow = boundary(top)
+    except (CalledProcessError, FileNotFoundError, OSError):
+        return
+    if shallow:
+        # NOTE(xames3): This is deliberately not a warning, as the CI
+        # builds run with `--fail-on-warning`.
+        logger.info(
+            "The repository is a shallow clone, last updated dates of the "
+            "documents changed before the clone's boundary fall back to "
+            "their file timestamps. Fetch the full history or set the "
+            "`last_updated_unshallow` option to fix them."
+        )
+    path = srcdir.relative_to(top).as_posix()
+    key = cache.digest(head, path, DATE_FORMAT, *sorted(shallow))
+    store = history_cache(app)
+    data = store.read(key)
+    if data is not None:
+        found = json.loads(data)
+    else:
+        try:
+            found = walk(top, path, shallow)
+        except (CalledProcessError, FileNotFoundError):
+            return
+        store.write(key, json.dumps(found).encode())
+    root = top
+    dates.update(found)
+
+
+def lookup(src: str | os.PathLike[str]) -> str:
+    """Return the last commit date of a file from the index.
+
+    :param src: Path of the file.
+    :return: Last commit date of the file, or an empty string if the
+        file is not tracked (or the index is not available).
+    """
+    if root is None:
+        return ""
+    try:
+        name = Path(src).resolve().relative_to(root).as_posix()
+    except ValueError:
+        return ""
+    return dates.get(name, "")
+
+
+def build_finished(app: Sphinx, exc: Exception | None) -> None:
+    """Prune the cache of the indexes to its size limit.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    if exc:
+        return
+    history_cache(app).prune()
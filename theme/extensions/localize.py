@@ -0,0 +1,229 @@
+"""\
+Localized Images
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module localizes the remote images rendered by the directives of
+this sphinx theme, like the thumbnails of the `thumbnail` directive, the
+posters of the `youtube` directive's facades and the avatars of the
+`author` directive.
+
+Instead of hotlinking them, which costs every visitor the connections
+to another host and an image much larger than the one displayed, the
+images are fetched once at build time over the pooled connections of
+`theme.extensions.remote`. They're resized to their display size (and
+twice of it, for the high density screens), re-encoded and published
+to the `_images` directory under content-hashed names by the pipeline
+of `theme.extensions.responsive`. The markup then points to the local
+copies, with an explicit width and height.
+
+The images of the documents to be read are fetched concurrently before
+they're read. The fetched images are cached on disk by their URL, so
+they're fetched once across builds, and the encoded copies are cached by
+the pipeline.
+If an image can't be fetched (like when the build is offline), the
+remote one is rendered as before.
+
+Localization is disabled by default, and can be enabled by setting the
+`localize_images` option.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import typing as t
+import urllib.parse as urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions import oembed
+from theme.extensions import remote
+from theme.extensions import responsive
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    import docutils.nodes as nodes
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+    from sphinx.writers.html import HTMLTranslator
+
+logger = logging.getLogger(__name__)
+
+LOCALIZE_VERSION: t.Final[str] = "1"
+DENSITIES: t.Final[tuple[int, ...]] = (1, 2)
+AVATAR: re.Pattern[str] = re.compile(r"^\s*:avatar:\s*(\S+)\s*$", re.MULTILINE)
+
+
+def remote_cache(app: Sphinx) -> cache.Cache:
+    """Return the cache of the fetched images.
+
+    :param app: The Sphinx application instance.
+    :return: The cache.
+    """
+    return cache.Cache(cache.directory(app, "remote"), 64 * cache.MiB)
+
+
+def key(url: str) -> str:
+    """Return the cache key of a remote image.
+
+    :param url: URL of the image.
+    :return: Hex digest identifying the entry.
+    """
+    return cache.digest(LOCALIZE_VERSION, url)
+
+
+def fetch(app: Sphinx, url: str) -> Path | None:
+    """Return the cached copy of a remote image, fetching it if needed.
+
+    :param app: The Sphinx application instance.
+    :param url: URL of the image.
+    :return: Path of the cached copy, or `None` if it can't be fetched.
+    """
+    store = remote_cache(app)
+    if (path := store.get(key(url))) is not None:
+        return path
+    response = remote.get(app, url)
+    if response is None or not response.ok:
+        return None
+    store.write(key(url), response.content)
+    return store.get(key(url))
+
+
+def image(
+    app: Sphinx,
+    env: BuildEnvironment,
+    url: str,
+    width: int,
+) -> dict[str, t.Any] | None:
+    """Queue the local copies of a remote image for publishing.
+
+    :param app: The Sphinx application instance.
+    :param env: The build environment.
+    :param url: URL of the image.
+    :param width: Display width of the image in CSS pixels.
+    :return: Attributes of the localized image with the name of the
+        published copy (`image_src`), its candidates for the densities
+        (`image_srcset`) and its display dimensions (`image_width` and
+        `image_height`), or `None` if the image isn't localized.
+    """
+    if not flag(app, "localize_images") or not url.startswith(
+        ("http://", "https://")
+    ):
+        return None
+    if (src := fetch(app, url)) is None or (
+        meta := responsive.probe(src)
+    ) is None:
+        return None
+    original, height, fmt = meta
+    width = min(width, original)
+    content = cache.filedigest(src)
+    _, ext, _ = responsive.ENCODERS[fmt]
+    stem = re.sub(r"[^\w.-]", "-", Path(urlparse.urlsplit(url).path).stem)
+    queued = responsive.queue(env)
+    candidates: list[str] = []
+    for density in DENSITIES:
+        size = min(width * density, original)
+        name = f"{stem or 'image'}-{content[:12]}-{size}w{ext}"
+        queued[name] = (os.fspath(src), content, fmt, size)
+        candidates.append(f"{name} {size / width:g}x")
+        if size == original:
+            break
+    return {
+        "image_src": candidates[0].split(" ", 1)[0],
+        "image_srcset": ", ".join(candidates),
+        "image_width": width,
+        "image_height": max(1, round(height * width / original)),
+    }
+
+
+def urls(self: HTMLTranslator, node: nodes.Element) -> dict[str, str]:
+    """Return the URLs of a localized image relative to the page.
+
+    :param self: The HTML translator instance.
+    :param node: The node with the attributes of the localized image.
+    :return: The `image_src` and `image_srcset` attributes of the node
+        pointing to the published copies, or nothing if the image isn't
+        localized.
+    """
+    if not node.get("image_src"):
+        return {}
+    prefix = f"{self.builder.imgpath}/"
+    return {
+        "image_src": f"{prefix}{node['image_src']}",
+        "image_srcset": ", ".join(
+            f"{prefix}{candidate}"
+            for candidate in node["image_srcset"].split(", ")
+        ),
+    }
+
+
+def env_before_read_docs(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Prefetch the remote images of the documents to be read.
+
+    The sources are scanned for the videos of the `thumbnail` directives
+    (and the `youtube` directives, if they're rendered as facades) and
+    the avatars of the `author` directives, and the images which aren't
+    cached are fetched concurrently. This way, the directives only read
+    the cache while the documents are parsed.
+
+    :param app: The Sphinx application instance.
+    :param env: The current build environment.
+    :param docnames: A list of document names to be read.
+    """
+    if not flag(app, "localize_images") or remote.offline(app):
+        return
+    found: set[str] = set()
+    facades = flag(app, "youtube_facade")
+    for source in oembed.sources(env, docnames):
+        found.update(
+            oembed.THUMBNAIL.format(oembed.video_id(src))
+            for name, src in oembed.scan(source)
+            if name == "thumbnail" or facades
+        )
+        found.update(AVATAR.findall(source))
+    if avatar := option(app, "avatar"):
+        found.add(avatar)
+    store = remote_cache(app)
+    pending = sorted(
+        url
+        for url in found
+        if url.startswith(("http://", "https://"))
+        and store.get(key(url)) is None
+    )
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=remote.workers(app)) as executor:
+        fetched = sum(
+            path is not None
+            for path in executor.map(partial(fetch, app), pending)
+        )
+    logger.info(
+        "Fetched %d remote image(s), %d cached, %d failed",
+        fetched,
+        len(found) - len(pending),
+        len(pending) - fetched,
+    )
+
+
+def build_finished(app: Sphinx, exc: Exception | None) -> None:
+    """Prune the cache of the fetched images to its size limit.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    if exc or not flag(app, "localize_images"):
+        return
+    remote_cache(app).prune()
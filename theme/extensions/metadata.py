@@ -0,0 +1,211 @@
+"""\
+Document Metadata
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module builds a compact metadata index of the documents, i.e. the
+title, the section titles, the anchor IDs, the word count and the
+reading time of every document.
+
+The metadata of a document is collected once, right after its doctree
+is read, in a single pass over the doctree. It's stored in the build
+environment, so it's pickled along with the environment and merged
+from the parallel reading processes, and only recomputed when the
+document changes.
+
+The index is shared by the theme's directives and roles, which used to
+walk the whole document to look up its title, and it's exposed to the
+templates as `page_metadata`.
+
+The words are counted the same way as the theme's client-side script
+did, i.e. only the words of the prose paragraphs count, leaving out the
+code, the figures, the admonitions and the sidebars.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import typing as t
+
+import docutils.nodes as nodes
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+WORDS_PER_MINUTE: t.Final[int] = 225
+MINIMUM_LENGTH: t.Final[int] = 20
+SKIPPED: t.Final[tuple[type[nodes.Element], ...]] = (
+    nodes.Admonition,
+    nodes.caption,
+    nodes.figure,
+    nodes.FixedTextElement,
+    nodes.math_block,
+    nodes.sidebar,
+    nodes.topic,
+)
+WORD: re.Pattern[str] = re.compile(r"\S*\w\S*")
+
+
+class entry(t.NamedTuple):
+    """Class to represent the metadata of a document."""
+
+    title: str
+    sections: tuple[str, ...]
+    ids: tuple[str, ...]
+    words: int
+    reading_time: int
+
+
+def words(paragraph: nodes.paragraph) -> int:
+    """Count the words of a prose paragraph.
+
+    :param paragraph: The paragraph.
+    :return: Number of the words, leaving out the inline code, or zero
+        if the paragraph is too short to be prose.
+    """
+    text = " ".join(
+        node.astext()
+        for node in paragraph.findall(nodes.Text)
+        if not isinstance(node.parent, nodes.literal)
+    )
+    if len(text.strip()) < MINIMUM_LENGTH:
+        return 0
+    return len(WORD.findall(text))
+
+
+def prose(node: nodes.Node) -> bool:
+    """Check if a node isn't nested in any of the skipped elements.
+
+    :param node: The node.
+    :return: `True` if the node is a part of the prose.
+    """
+    parent: nodes.Element | None = node.parent
+    while parent is not None:
+        if isinstance(parent, SKIPPED):
+            return False
+        parent = parent.parent
+    return True
+
+
+def collect(doctree: nodes.document) -> entry:
+    """Collect the metadata of a document in a single pass.
+
+    :param doctree: The doctree of the document.
+    :return: The metadata of the document.
+    """
+    title = ""
+    sections: list[str] = []
+    ids: list[str] = []
+    count = 0
+    for node in doctree.findall(nodes.Element):
+        if isinstance(node, nodes.title) and isinstance(
+            node.parent, nodes.section
+        ):
+            text = node.astext().strip()
+            title = title or text
+            sections.append(text)
+        elif isinstance(node, nodes.paragraph) and prose(node):
+            count += words(node)
+        ids.extend(node["ids"])
+    return entry(
+        title=title,
+        sections=tuple(sections[1:]),
+        ids=tuple(ids),
+        words=count,
+        reading_time=math.ceil(count / WORDS_PER_MINUTE),
+    )
+
+
+def lookup(env: BuildEnvironment, docname: str | None = None) -> entry:
+    """Return the metadata of a document.
+
+    :param env: The build environment.
+    :param docname: The name of the document, defaults to the document
+        being read.
+    :return: The metadata, which is empty if the document isn't read
+        yet.
+    """
+    index = getattr(env, "theme_metadata", {})
+    found = index.get(docname or env.docname)
+    return found if found is not None else entry("", (), (), 0, 0)
+
+
+def doctree_read(app: Sphinx, doctree: nodes.document) -> None:
+    """Index the metadata of the document which was read.
+
+    The subjects of the `email` links without an explicit subject are
+    filled in with the title of the document as well.
+
+    :param app: The Sphinx application instance.
+    :param doctree: The document tree which was read.
+    """
+    env = app.env
+    if not hasattr(env, "theme_metadata"):
+        env.theme_metadata = {}
+    found = env.theme_metadata[env.docname] = collect(doctree)
+    for node in doctree.findall(nodes.reference):
+        if "mailto" in node:
+            address = node.attributes.pop("mailto")
+            node["refuri"] = f"mailto:{address}?subject={found.title}"
+
+
+def env_purge_doc(_: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the metadata of a document which is removed or re-read.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment.
+    :param docname: The name of the document.
+    """
+    if hasattr(env, "theme_metadata"):
+        env.theme_metadata.pop(docname, None)
+
+
+def env_merge_info(
+    _: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the metadata collected by the parallel reading processes.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment of the main process.
+    :param docnames: The names of the documents read by the process.
+    :param other: The build environment of the reading process.
+    """
+    if not hasattr(env, "theme_metadata"):
+        env.theme_metadata = {}
+    index = getattr(other, "theme_metadata", {})
+    env.theme_metadata.update(
+        (docname, index[docname]) for docname in docnames if docname in index
+    )
+
+
+def html_page_context(
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, t.Any],
+    doctree: nodes.Node,
+) -> None:
+    """Expose the metadata of the page being rendered to the templates.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being processed.
+    :param templatename: The name of the HTML template used for
+        rendering.
+    :param context: Context variables passed to the template.
+    :param doctree: The document tree for the current page.
+    """
+    # NOTE(xames3): The parameters `templatename` and `doctree` are
+    # currently unused but are included to match the expected signature
+    # for a Sphinx event handler.
+    templatename = templatename or ""
+    del doctree
+    context["page_metadata"] = lookup(app.env, pagename)
@@ -0,0 +1,305 @@
+"""\
+HTML Minifier
+=============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides a streaming, tokenizer based minifier for the HTML
+pages generated by this sphinx theme.
+
+The pages carry a lot of whitespace from the indentation of the Jinja
+templates, which the browsers ignore anyway. The minifier makes a
+single forward pass over the tokens emitted by the standard library's
+`html.parser`, like `theme.extensions.rewriter`, and applies the
+following::
+
+    [1] Whitespace between the tags is collapsed into a single space,
+        and dropped entirely next to the block-level elements.
+    [2] The content of `pre`, `code`, `textarea`, `script` and `style`
+        elements is kept as is.
+    [3] Empty `class`, `id` and `style` attributes and the attributes
+        with their default values (like `type="text/javascript"`) are
+        dropped, and the boolean attributes lose their values.
+    [4] Attribute values are left unquoted where the quotes aren't
+        needed.
+    [5] HTML comments are stripped, except the conditional comments.
+
+The output only depends on the input, so minifying the same page always
+produces the exact same bytes.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import typing as t
+from html.parser import HTMLParser
+
+from theme.extensions.rewriter import CHUNKSIZE
+from theme.extensions.rewriter import VOID_ELEMENTS
+from theme.extensions.rewriter import escape
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from theme.extensions.rewriter import Attributes
+
+VERBATIM: t.Final[frozenset[str]] = frozenset(
+    {"code", "pre", "script", "style", "textarea"}
+)
+BLOCKS: t.Final[frozenset[str]] = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "base",
+        "blockquote",
+        "body",
+        "br",
+        "caption",
+        "col",
+        "colgroup",
+        "dd",
+        "details",
+        "dialog",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "head",
+        "header",
+        "hgroup",
+        "hr",
+        "html",
+        "li",
+        "link",
+        "main",
+        "meta",
+        "nav",
+        "noscript",
+        "ol",
+        "p",
+        "pre",
+        "script",
+        "section",
+        "style",
+        "summary",
+        "table",
+        "tbody",
+        "td",
+        "template",
+        "tfoot",
+        "th",
+        "thead",
+        "title",
+        "tr",
+        "ul",
+    }
+)
+BOOLEANS: t.Final[frozenset[str]] = frozenset(
+    {
+        "allowfullscreen",
+        "async",
+        "autofocus",
+        "autoplay",
+        "checked",
+        "controls",
+        "default",
+        "defer",
+        "disabled",
+        "hidden",
+        "inert",
+        "ismap",
+        "loop",
+        "multiple",
+        "muted",
+        "nomodule",
+        "novalidate",
+        "open",
+        "playsinline",
+        "readonly",
+        "required",
+        "reversed",
+        "selected",
+    }
+)
+EMPTY: t.Final[frozenset[str]] = frozenset({"class", "id", "style"})
+DEFAULTS: t.Final[dict[tuple[str, str], frozenset[str]]] = {
+    ("form", "method"): frozenset({"get"}),
+    ("input", "type"): frozenset({"text"}),
+    ("link", "type"): frozenset({"text/css"}),
+    ("script", "type"): frozenset(
+        {"application/javascript", "text/javascript"}
+    ),
+    ("style", "type"): frozenset({"text/css"}),
+}
+WHITESPACE: re.Pattern[str] = re.compile(r"\s+")
+UNQUOTED: re.Pattern[str] = re.compile(r"[^\s\"'=<>`]+")
+
+
+def attributes(tag: str, attrs: Attributes) -> str:
+    """Serialise the attributes of a start tag, leaving out the optional
+    ones.
+
+    :param tag: Name of the tag.
+    :param attrs: List of attribute name and value pairs.
+    :return: The serialised attributes, each preceded by a space.
+    """
+    rendered: list[str] = []
+    for name, value in attrs:
+        if value is not None:
+            if name == "class":
+                value = " ".join(value.split())
+            if name in EMPTY and not value.strip():
+                continue
+            if value.strip().lower() in DEFAULTS.get((tag, name), ()):
+                continue
+            if name in BOOLEANS and value.lower() in {"", name}:
+                value = None
+        if value is None:
+            rendered.append(f" {name}")
+            continue
+        value = escape(value)
+        if UNQUOTED.fullmatch(value) and not value.endswith("/"):
+            rendered.append(f" {name}={value}")
+        else:
+            rendered.append(f' {name}="{value}"')
+    return "".join(rendered)
+
+
+class Minifier(HTMLParser):
+    """Single pass HTML minifier.
+
+    The whitespace is held back until the next token, as whether it's
+    kept depends on the element which follows it.
+
+    :param write: Callable used for writing the minified markup.
+    """
+
+    def __init__(self, write: Callable[[str], t.Any]) -> None:
+        super().__init__(convert_charrefs=False)
+        self.write = write
+        self.verbatim = 0
+        self.boundary = True
+        self.space = False
+
+    def text(self, data: str) -> None:
+        """Write out the content of an element."""
+        if self.space and not self.boundary:
+            self.write(" ")
+        self.space = False
+        self.boundary = False
+        self.write(data)
+
+    def tag(self, tag: str, markup: str) -> None:
+        """Write out a tag, with the whitespace held back before it."""
+        block = tag in BLOCKS
+        if self.space and not self.boundary and not block:
+            self.write(" ")
+        self.space = False
+        self.boundary = block
+        self.write(markup)
+
+    def handle_decl(self, decl: str) -> None:
+        self.tag("html", f"<!{decl}>")
+
+    def handle_pi(self, data: str) -> None:
+        self.tag("html", f"<?{data}>")
+
+    def unknown_decl(self, data: str) -> None:
+        self.text(f"<![{data}]>")
+
+    def handle_comment(self, data: str) -> None:
+        """Strip HTML comments, except the conditional comments."""
+        if data.startswith("[if") or data.endswith("[endif]"):
+            self.text(f"<!--{data}-->")
+
+    def handle_data(self, data: str) -> None:
+        if self.verbatim:
+            self.text(data)
+            return
+        collapsed = WHITESPACE.sub(" ", data)
+        content = collapsed.strip()
+        if not content:
+            self.space = self.space or bool(collapsed)
+            return
+        self.space = self.space or collapsed[0] == " "
+        self.text(content)
+        self.space = collapsed[-1] == " "
+
+    def handle_entityref(self, name: str) -> None:
+        self.text(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.text(f"&#{name};")
+
+    def handle_startendtag(self, tag: str, attrs: Attributes) -> None:
+        close = "" if tag in VOID_ELEMENTS else " /"
+        self.tag(tag, f"<{tag}{attributes(tag, attrs)}{close}>")
+
+    def handle_starttag(self, tag: str, attrs: Attributes) -> None:
+        self.tag(tag, f"<{tag}{attributes(tag, attrs)}>")
+        if tag in VERBATIM:
+            self.verbatim += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VERBATIM and self.verbatim:
+            self.verbatim -= 1
+        self.tag(tag, f"</{tag}>")
+
+
+def markup(text: str) -> str:
+    """Minify HTML markup and return it.
+
+    :param text: HTML markup to be minified.
+    :return: The minified markup.
+    """
+    parts: list[str] = []
+    parser = Minifier(parts.append)
+    parser.feed(text)
+    parser.close()
+    return "".join(parts)
+
+
+def minify(html: str, chunksize: int = CHUNKSIZE) -> int:
+    """Minify an HTML file in place using a single streaming pass.
+
+    Like `theme.extensions.rewriter.rewrite`, the minified markup is
+    written to a temporary sibling file which atomically replaces the
+    original once it's complete.
+
+    :param html: Path to the HTML file to be minified.
+    :param chunksize: Number of characters to read and feed at once,
+        defaults to `CHUNKSIZE`.
+    :return: Number of bytes saved.
+    """
+    before = os.path.getsize(html)
+    tmp = f"{html}.tmp"
+    try:
+        with (
+            open(html, encoding="utf-8") as src,
+            open(tmp, "w", encoding="utf-8", buffering=chunksize) as dest,
+        ):
+            parser = Minifier(dest.write)
+            while chunk := src.read(chunksize):
+                parser.feed(chunk)
+            parser.close()
+            dest.write("\n")
+        os.replace(tmp, html)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return before - os.path.getsize(html)
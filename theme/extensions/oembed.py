@@ -0,0 +1,256 @@
+"""\
+YouTube Metadata
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the metadata (title, channel and so on) of the
+YouTube videos embedded by the `youtube` and `thumbnail` directives of
+this sphinx theme, fetched from YouTube's oEmbed endpoint.
+
+The metadata is cached on disk, one entry per video, along with the
+time it was fetched. An entry is fresh for `oembed_ttl` seconds (a week
+by default), after which it's fetched again. The videos which aren't
+available (like the private ones) are cached as well, so they aren't
+requested on every build.
+
+Before the documents are read, their sources are scanned for the videos
+of both the directives and the metadata of the ones which aren't cached
+(or have expired) is fetched concurrently, over the pooled connections
+of `theme.extensions.remote`. This way, the directives only read the
+cache while the documents are parsed, instead of blocking on a request
+per directive. If the build is offline, the stale entries are used as
+is and the videos without any metadata are rendered without it.
+
+The endpoint can be changed using the `oembed_endpoint` option, for
+example to point it to a local stand-in server.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions import remote
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+OEMBED_VERSION: t.Final[str] = "1"
+ENDPOINT: t.Final[str] = "https://www.youtube.com/oembed"
+THUMBNAIL: t.Final[str] = "https://img.youtube.com/vi/{}/hqdefault.jpg"
+TTL: t.Final[int] = 7 * 24 * 60 * 60
+DIRECTIVE: re.Pattern[str] = re.compile(
+    r"^(\s*)\.\.\s+(youtube|thumbnail)::(.*)$"
+)
+
+attempted: set[str] = set()
+
+
+def video_id(src: str) -> str:
+    """Return the ID of a YouTube video from its URL.
+
+    :param src: URL of the video, or its ID.
+    :return: ID of the video.
+    """
+    if "youtu.be/" in src:
+        return src.rsplit("/", 1)[-1].split("?", 1)[0]
+    if "watch?v=" in src:
+        return src.split("v=", 1)[-1].split("&", 1)[0]
+    return src
+
+
+def scan(
+    source: str, pattern: re.Pattern[str] = DIRECTIVE
+) -> list[tuple[str, str]]:
+    """Return the videos of the `youtube` and `thumbnail` directives.
+
+    Both the directives take the URL of the video as the last line of
+    their content, which may start on the line of the directive.
+
+    :param source: Source of the document.
+    :param pattern: Pattern matching the indent, the name and the rest
+        of the line of the scanned directives, defaults to the ones of
+        the videos.
+    :return: List of the names of the directives and the last lines of
+        their content, i.e. the URLs of the videos.
+    """
+    found = []
+    lines = source.splitlines()
+    for index, line in enumerate(lines):
+        if not (match := pattern.match(line)):
+            continue
+        indent = len(match.group(1))
+        block = [match.group(3).strip()]
+        for following in lines[index + 1 :]:
+            stripped = following.strip()
+            if stripped and len(following) - len(following.lstrip()) <= indent:
+                break
+            block.append(stripped)
+        content = [text for text in block if text and text[0] != ":"]
+        if content:
+            found.append((match.group(2), content[-1]))
+    return found
+
+
+def store(app: Sphinx) -> cache.Cache:
+    """Return the cache of the metadata.
+
+    :param app: The Sphinx application instance.
+    :return: Cache of the metadata entries.
+    """
+    return cache.Cache(cache.directory(app, "oembed"), 16 * cache.MiB)
+
+
+def key(vid: str) -> str:
+    """Return the cache key of a video's metadata.
+
+    :param vid: ID of the video.
+    :return: Hex digest identifying the entry.
+    """
+    return cache.digest(OEMBED_VERSION, vid)
+
+
+def cached(app: Sphinx, vid: str) -> dict[str, t.Any] | None:
+    """Return the cached entry of a video's metadata.
+
+    :param app: The Sphinx application instance.
+    :param vid: ID of the video.
+    :return: Entry with the time it was fetched and the metadata (which
+        is `None` for an unavailable video), or `None` if not cached.
+    """
+    data = store(app).read(key(vid))
+    if data is None:
+        return None
+    try:
+        entry = json.loads(data)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def fresh(app: Sphinx, entry: dict[str, t.Any] | None) -> bool:
+    """Check if a cached entry hasn't expired.
+
+    :param app: The Sphinx application instance.
+    :param entry: The cached entry, if any.
+    :return: `True` if the entry is younger than `oembed_ttl`.
+    """
+    ttl = float(option(app, "oembed_ttl", TTL))
+    return entry is not None and time.time() - entry["fetched"] < ttl
+
+
+def fetch(app: Sphinx, vid: str) -> bool:
+    """Fetch and cache the metadata of a video.
+
+    :param app: The Sphinx application instance.
+    :param vid: ID of the video.
+    :return: `True` if the endpoint responded, even if the video is
+        unavailable.
+    """
+    attempted.add(vid)
+    params = {
+        "url": f"https://www.youtube.com/watch?v={vid}",
+        "format": "json",
+    }
+    response = remote.get(
+        app, option(app, "oembed_endpoint", ENDPOINT), params=params
+    )
+    if response is None or response.status_code >= 500:
+        return False
+    metadata = None
+    if response.ok:
+        try:
+            metadata = response.json()
+        except ValueError:
+            return False
+        if not isinstance(metadata, dict):
+            return False
+    entry = {"fetched": time.time(), "metadata": metadata}
+    store(app).write(key(vid), json.dumps(entry).encode())
+    return True
+
+
+def lookup(app: Sphinx, vid: str) -> dict[str, t.Any]:
+    """Return the metadata of a video.
+
+    The metadata is read from the cache, which is filled before the
+    documents are read. It's only fetched if the video wasn't found by
+    the scan of the sources (like the ones in the included files).
+
+    :param app: The Sphinx application instance.
+    :param vid: ID of the video.
+    :return: The metadata, which is empty if it's not available.
+    """
+    entry = cached(app, vid)
+    if entry is None and vid not in attempted and fetch(app, vid):
+        entry = cached(app, vid)
+    return (entry or {}).get("metadata") or {}
+
+
+def prefetch(app: Sphinx, vids: set[str]) -> None:
+    """Fetch the metadata of the videos which isn't cached or expired.
+
+    :param app: The Sphinx application instance.
+    :param vids: IDs of the videos.
+    """
+    pending = sorted(vid for vid in vids if not fresh(app, cached(app, vid)))
+    if not pending or remote.offline(app):
+        return
+    with ThreadPoolExecutor(max_workers=remote.workers(app)) as executor:
+        fetched = sum(executor.map(partial(fetch, app), pending))
+    logger.info(
+        "Fetched the metadata of %d video(s), %d cached, %d failed",
+        fetched,
+        len(vids) - len(pending),
+        len(pending) - fetched,
+    )
+
+
+def sources(env: BuildEnvironment, docnames: list[str]) -> Iterator[str]:
+    """Return the sources of the documents to be read.
+
+    :param env: The current build environment.
+    :param docnames: A list of document names to be read.
+    :return: Iterator over the sources which could be read.
+    """
+    for docname in docnames:
+        try:
+            with open(env.doc2path(docname), encoding="utf-8") as f:
+                yield f.read()
+        except OSError:
+            continue
+
+
+def env_before_read_docs(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Prefetch the metadata of the videos of the documents to be read.
+
+    :param app: The Sphinx application instance.
+    :param env: The current build environment.
+    :param docnames: A list of document names to be read.
+    """
+    vids = {
+        video_id(src)
+        for source in sources(env, docnames)
+        for _, src in scan(source)
+    }
+    if vids:
+        prefetch(app, vids)
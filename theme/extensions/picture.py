@@ -4,7 +4,7 @@ Picture Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 02 September, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `picture` directive for this sphinx theme.
 The directive allows embedding and rendering images specific to the
@@ -31,31 +31,42 @@ theme's Jinja2 template, producing a final HTML output.
 
     Simplified the directive to render images according to the theme's
     colour scheme using the `img` tag instead of fancy Javascript.
+
+.. versionchanged:: 18.10.2026
+
+    The images are published as resized, recompressed and modern format
+    variants by `theme.extensions.responsive` and rendered using
+    `srcset` and `sizes`, instead of copying the originals verbatim.
+
+.. versionchanged:: 18.10.2026
+
+    The images are queued while the document is read and published
+    under content-hashed names once the documents are written. They're
+    noted as dependencies of the document, so it's re-read exactly when
+    any of its images change.
 """
 
 from __future__ import annotations
 
-import os
 import os.path as p
-import shutil
 import typing as t
 
 import docutils.nodes as nodes
-import jinja2
 from docutils.parsers import rst
 from docutils.parsers.rst.directives import images
 
+from theme.extensions import responsive
+from theme.extensions import templating
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "picture"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "picture.html.jinja")
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+template = templating.template("picture.html.jinja")
 
 
 class node(nodes.Element):
@@ -118,8 +129,6 @@ class directive(images.Figure):
         env = self.state.document.settings.env
         depth = env.docname.count("/")
         doc_dir = p.dirname(env.doc2path(env.docname))
-        images_dir = p.join(env.app.builder.outdir, "_images")
-        os.makedirs(images_dir, exist_ok=True)
         allowed = (
             "left",
             "center",
@@ -130,35 +139,59 @@ class directive(images.Figure):
             "default",
         )
 
-        def _copy(src: str) -> None:
-            """Copy the source image to the destination if it doesn't
-            already exist or is outdated.
+        queued = responsive.queue(env)
+
+        def _queue(src: str) -> tuple[str, responsive.Sources, int, int]:
+            """Queue the responsive variants of the source image for
+            publishing, falling back to publishing it verbatim.
             """
-            dest = p.join(images_dir, p.basename(src))
             try:
-                if (
-                    not p.exists(dest)
-                    or os.stat(src).st_mtime > os.stat(dest).st_mtime
-                ):
-                    shutil.copy2(src, dest)
+                env.note_dependency(src)
+                published = None
+                if flag(env.app, "responsive_images", default=True):
+                    published = responsive.variants(env.app, src, queued)
+                if published is None:
+                    return responsive.original(src, queued), [], 0, 0
             except OSError as exc:
-                raise self.error(
-                    f"Failed to copy {src!r} to {dest!r}: {exc}"
-                ) from exc
+                raise self.error(f"Failed to read {src!r}: {exc}") from exc
+            sources, width, height = published
+            return sources[-1][1][-1][0], sources, width, height
 
         light = p.normpath(p.join(doc_dir, self.options["light"]))
         dark = p.normpath(p.join(doc_dir, self.options["dark"]))
-        for mode in [light, dark]:
-            _copy(mode)
+        light_src, light_sources, width, height = _queue(light)
+        dark_src, dark_sources, _, _ = _queue(dark)
+        # NOTE(xames3): The variants are only used if both the images
+        # have them, otherwise the published images are used as is.
+        if len(light_sources) != len(dark_sources):
+            light_sources = dark_sources = []
         prefix = "../" * depth if depth else ""
+        url = f"{prefix}_images/"
+        sizes = option(env.app, "image_sizes", responsive.SIZES)
+        sources = [
+            (
+                mime,
+                responsive.srcset(url, light_variants),
+                responsive.srcset(url, dark_variants),
+            )
+            for (mime, light_variants), (_, dark_variants) in zip(
+                light_sources, dark_sources, strict=True
+            )
+        ]
         klass = self.options.get("class", "")
         align = self.options.get("align", "default")
         assert align in allowed, (
             f"Available align options are {', '.join(allowed)}"
         )
         attributes = {
-            "light": f"{prefix}_images/{p.basename(light)}",
-            "dark": f"{prefix}_images/{p.basename(dark)}",
+            "light": f"{url}{light_src}",
+            "dark": f"{url}{dark_src}",
+            "sources": sources[:-1],
+            "light_srcset": sources[-1][1] if sources else "",
+            "dark_srcset": sources[-1][2] if sources else "",
+            "sizes": sizes,
+            "width": width,
+            "height": height,
             "alt": self.options.get("alt", ""),
             "align": align,
             "figclass": self.options.get("figclass", klass),
@@ -0,0 +1,371 @@
+"""\
+Build Profiler
+==============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides an opt-in profiling mode for this sphinx theme,
+which records how much of a build is spent in the theme's hooks,
+directives and transforms as opposed to Sphinx itself.
+
+The profiler is enabled by setting the `profile` option. Every span is
+recorded as a complete event of the Chrome trace format, so the trace
+can be opened as is in `chrome://tracing` or https://ui.perfetto.dev.
+Once the build is finished, the trace is written to `profile_output`
+(`theme-trace.json` next to the output directory by default) and a
+summary of the `profile_top` most expensive spans is logged.
+
+The build is split into phases (initialisation, reading, writing and
+finishing), each of which is recorded as a span as well. If the
+`profile_memory` option is set, the peak memory allocated during each
+phase is traced using `tracemalloc` and attached to the phase's span.
+
+Spans recorded by the forked worker processes (parallel reads, writes
+and post-processing) are appended to a spool file per process, as the
+workers exit without returning to the main process. The spool files are
+merged into the trace once the build is finished.
+
+When the profiler is disabled, every traced function costs a single
+flag check.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions.cache import MiB
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from docutils.parsers.rst import Directive
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+enabled: bool = False
+memory: bool = False
+events: list[dict[str, t.Any]] = []
+spool: Path | None = None
+sink: t.TextIO | None = None
+main: int = 0
+current: tuple[str, int] | None = None
+
+
+def record(
+    name: str,
+    category: str,
+    start: int,
+    end: int,
+    args: dict[str, t.Any],
+) -> None:
+    """Record a complete event of the Chrome trace format.
+
+    The events of the main process are kept in memory, whereas the ones
+    of the worker processes are appended to their spool file.
+
+    :param name: Name of the span.
+    :param category: Category of the span.
+    :param start: Start of the span in nanoseconds.
+    :param end: End of the span in nanoseconds.
+    :param args: Arguments attached to the span.
+    """
+    global sink
+    pid = os.getpid()
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start / 1000,
+        "dur": (end - start) / 1000,
+        "pid": pid,
+        "tid": threading.get_native_id(),
+        "args": args,
+    }
+    if pid == main or spool is None:
+        events.append(event)
+        return
+    if sink is None or sink.closed:
+        sink = open(  # noqa: SIM115
+            spool / f"{pid}.jsonl", "a", encoding="utf-8", buffering=1
+        )
+    sink.write(f"{json.dumps(event, default=str)}\n")
+
+
+@contextmanager
+def span(name: str, category: str = "theme", **args: t.Any) -> Iterator[None]:
+    """Record the time spent in a block of code as a span.
+
+    :param name: Name of the span.
+    :param category: Category of the span, defaults to `theme`.
+    :param args: Arguments attached to the span, like the page being
+        processed.
+    """
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        record(name, category, start, time.perf_counter_ns(), args)
+
+
+def traced[F: Callable[..., t.Any]](
+    func: F, name: str | None = None, category: str = "hook"
+) -> F:
+    """Wrap a function to record every call to it as a span.
+
+    :param func: Function to be traced.
+    :param name: Name of the span, defaults to the module and the name
+        of the function.
+    :param category: Category of the span, defaults to `hook`.
+    :return: The wrapped function.
+    """
+    if name is None:
+        name = f"{func.__module__.rpartition('.')[2]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        if not enabled:
+            return func(*args, **kwargs)
+        with span(name, category):
+            return func(*args, **kwargs)
+
+    return t.cast("F", wrapper)
+
+
+def directive(cls: type[Directive], name: str) -> type[Directive]:
+    """Subclass a directive to record every call to its `run` as a span.
+
+    :param cls: Directive class to be traced.
+    :param name: Name of the directive.
+    :return: The traced subclass of the directive.
+    """
+    run = traced(cls.run, f"{name}.run", "directive")
+    return type(cls.__name__, (cls,), {"run": run, "__doc__": cls.__doc__})
+
+
+def phase(name: str | None) -> None:
+    """Close the current phase of the build and start the next one.
+
+    :param name: Name of the next phase, or `None` to only close the
+        current one.
+    """
+    global current
+    now = time.perf_counter_ns()
+    if current is not None:
+        args: dict[str, t.Any] = {}
+        if memory:
+            import tracemalloc
+
+            if tracemalloc.is_tracing():
+                args["peak_memory"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.reset_peak()
+        record(current[0], "phase", current[1], now, args)
+    current = (name, now) if name is not None else None
+
+
+def builder_inited(app: Sphinx) -> None:
+    """Enable the profiler if the `profile` option is set.
+
+    :param app: The Sphinx application instance.
+    """
+    # NOTE(xames3): The utilities import this module, so they're only
+    # imported once the build has started.
+    from theme.extensions.utils import flag
+
+    global enabled, memory, spool, sink, main
+    enabled = flag(app, "profile")
+    if not enabled:
+        return
+    memory = flag(app, "profile_memory")
+    events.clear()
+    sink = None
+    main = os.getpid()
+    spool = Path(tempfile.mkdtemp(prefix="theme-profile-"))
+    if memory:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    phase("initialise")
+
+
+def env_before_read_docs(*_: t.Any) -> None:
+    """Start the reading phase of the build."""
+    if enabled:
+        phase("read")
+
+
+def env_updated(*_: t.Any) -> None:
+    """Start the writing phase of the build."""
+    if enabled:
+        phase("write")
+
+
+def build_finished(*_: t.Any) -> None:
+    """Start the finishing phase of the build."""
+    if enabled:
+        phase("finish")
+
+
+def collect() -> list[dict[str, t.Any]]:
+    """Return the events of the main and the worker processes.
+
+    :return: List of events, including the process name metadata.
+    """
+    collected = list(events)
+    if spool is not None:
+        for path in sorted(spool.glob("*.jsonl")):
+            with open(path, encoding="utf-8") as f:
+                collected.extend(json.loads(line) for line in f if line)
+    collected.extend(
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "main" if pid == main else f"worker {pid}"},
+        }
+        for pid in sorted({event["pid"] for event in collected})
+    )
+    return collected
+
+
+def themed(
+    collected: list[dict[str, t.Any]],
+    start: float,
+    end: float,
+    pid: int | None = None,
+) -> float:
+    """Return the time spent in the theme's spans of the main process.
+
+    Only the outermost spans are counted, so the time spent in nested
+    spans is not counted twice.
+
+    :param collected: List of events.
+    :param start: Start of the window in microseconds.
+    :param end: End of the window in microseconds.
+    :param pid: Process ID of the main process, defaults to the current
+        build's main process.
+    :return: Time spent in the theme's spans in microseconds.
+
+    .. versionchanged:: 18.10.2026
+
+        Added the `pid` parameter for reading traces of other processes.
+    """
+    pid = main if pid is None else pid
+    spans = sorted(
+        (event["ts"], event["ts"] + event["dur"])
+        for event in collected
+        if event["ph"] == "X"
+        and event["cat"] != "phase"
+        and event["pid"] == pid
+        and start <= event["ts"] < end
+    )
+    total = 0.0
+    reach = start
+    for begin, finish in spans:
+        if finish <= reach:
+            continue
+        total += finish - max(begin, reach)
+        reach = finish
+    return total
+
+
+def summarise(collected: list[dict[str, t.Any]], top: int) -> None:
+    """Log the phases of the build and the most expensive spans.
+
+    :param collected: List of events.
+    :param top: Number of spans to be logged.
+    """
+    spans: dict[str, list[float]] = {}
+    for event in collected:
+        if event["ph"] != "X":
+            continue
+        if event["cat"] == "phase":
+            start, dur = event["ts"], event["dur"]
+            peak = event["args"].get("peak_memory")
+            logger.info(
+                "Phase %-10s %10.1f ms, theme %10.1f ms%s",
+                event["name"],
+                dur / 1000,
+                themed(collected, start, start + dur) / 1000,
+                "" if peak is None else f", peak {peak / MiB:.1f} MiB",
+            )
+            continue
+        spans.setdefault(event["name"], []).append(event["dur"])
+    ranked = sorted(spans.items(), key=lambda item: sum(item[1]), reverse=True)
+    logger.info(
+        "%-48s %8s %12s %10s %10s",
+        "Span",
+        "Calls",
+        "Total ms",
+        "Mean ms",
+        "Max ms",
+    )
+    for name, durations in ranked[:top]:
+        logger.info(
+            "%-48s %8d %12.1f %10.3f %10.3f",
+            name[:48],
+            len(durations),
+            sum(durations) / 1000,
+            sum(durations) / len(durations) / 1000,
+            max(durations) / 1000,
+        )
+
+
+def write(app: Sphinx, exc: Exception | None) -> None:
+    """Write the trace and log its summary once the build is finished.
+
+    This runs after every other `build-finished` handler, so the time
+    spent in post-processing the pages is part of the trace.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    global enabled, spool
+    if not enabled:
+        return
+    phase(None)
+    if memory:
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    collected = collect()
+    if spool is not None:
+        shutil.rmtree(spool, ignore_errors=True)
+        spool = None
+    enabled = False
+    if exc:
+        return
+    options = app.config.html_context
+    output = Path(
+        options.get("profile_output")
+        or Path(app.outdir).parent / "theme-trace.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {"traceEvents": collected, "displayTimeUnit": "ms"},
+            f,
+            default=str,
+        )
+    logger.info("Profile of the theme written to %s", output)
+    summarise(collected, int(options.get("profile_top", 15)))
@@ -0,0 +1,128 @@
+"""\
+Remote Resources
+================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the HTTP session used by this sphinx theme for
+fetching remote resources at build time, like the metadata of YouTube
+videos.
+
+The session is shared by every fetch of the build process, so the
+connections to a host are pooled and reused across the concurrent
+fetches, instead of opening a new connection per request.
+
+The theme's builds are offline-first. The fetched resources are cached
+on disk by the modules using them, and the network is only used for
+the resources which aren't cached or have expired. The network is never
+used if the `offline` option or the `THEME_OFFLINE` environment variable
+is set, and once it turns out to be unreachable, it isn't tried again
+for the rest of the build. In both the cases, the stale resources are
+used as is and the missing ones are rendered without them.
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+from sphinx.util import logging
+
+from theme.extensions.utils import flag
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    import requests
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT: t.Final[float] = 10.0
+POOL_SIZE: t.Final[int] = 16
+WORKERS: t.Final[int] = 8
+USER_AGENT: t.Final[str] = "smart-sphinx-theme"
+
+unreachable: bool = False
+_session: requests.Session | None = None
+
+
+def offline(app: Sphinx) -> bool:
+    """Check if the network must not be used by the build.
+
+    :param app: The Sphinx application instance.
+    :return: `True` if the build is offline or the network turned out
+        to be unreachable.
+    """
+    return (
+        unreachable
+        or flag(app, "offline")
+        or bool(os.environ.get("THEME_OFFLINE"))
+    )
+
+
+def workers(app: Sphinx) -> int:
+    """Return the number of concurrent fetches.
+
+    :param app: The Sphinx application instance.
+    :return: Number of the fetching threads, configured by the
+        `remote_workers` option.
+    """
+    return max(1, int(option(app, "remote_workers", WORKERS)))
+
+
+def session() -> requests.Session:
+    """Return the HTTP session shared by the fetches of the process.
+
+    :return: Session with a connection pool large enough for the
+        concurrent fetches.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+        _session.headers["User-Agent"] = USER_AGENT
+    return _session
+
+
+def get(
+    app: Sphinx,
+    url: str,
+    **kwargs: t.Any,
+) -> requests.Response | None:
+    """Send a GET request, unless the build is offline.
+
+    A connection error marks the network as unreachable, so the build
+    doesn't wait for the timeouts of the remaining requests.
+
+    :param app: The Sphinx application instance.
+    :param url: The requested URL.
+    :param kwargs: Keyword arguments passed to the session's `get`.
+    :return: The response, or `None` if the build is offline or the
+        request failed.
+    """
+    global unreachable
+    if offline(app):
+        return None
+    import requests
+
+    kwargs.setdefault("timeout", float(option(app, "remote_timeout", TIMEOUT)))
+    try:
+        return session().get(url, **kwargs)
+    except (requests.ConnectionError, requests.Timeout) as exc:
+        # NOTE(xames3): The concurrent fetches may all fail at once, so
+        # only the first of them reports the network as unreachable.
+        if not unreachable:
+            unreachable = True
+            logger.info("Network is unreachable, using the cached resources")
+        logger.debug("Failed to fetch %s: %s", url, exc)
+    except requests.RequestException as exc:
+        logger.verbose("Failed to fetch %s: %s", url, exc)
+    return None
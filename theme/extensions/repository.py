@@ -4,7 +4,7 @@ GitHub Repository Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 29 October, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `repository` directive for this sphinx
 theme. The directive allows embedding GitHub repository details on the
@@ -23,28 +23,45 @@ follows::
 
 The above snippet will be processed and rendered according to the
 theme's Jinja2 template, producing a final HTML output.
+
+.. versionadded:: 18.10.2026
+
+    The stars and forks of the repository can be rendered at build time
+    from the stats cached by `theme.extensions.github`, instead of being
+    fetched by every visitor. The client-side script is then only used
+    for the repositories without any stats, or for refreshing them if
+    the `repository_refresh` option is set.
 """
 
 from __future__ import annotations
 
-import os.path as p
 import typing as t
 
 import docutils.nodes as nodes
-import jinja2
 from docutils.parsers import rst
 
+from theme.extensions import github
+from theme.extensions import templating
+from theme.extensions.utils import flag
+
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "repository"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "repository.html.jinja")
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+template = templating.template("repository.html.jinja")
+
+
+def humanize(count: int) -> str:
+    """Return a count the way the client-side script formats it.
+
+    :param count: The count.
+    :return: The count, abbreviated with a `k` from a thousand.
+    """
+    if count >= 1000:
+        return f"{count / 1000:.1f}".removesuffix(".0") + "k"
+    return str(count)
 
 
 class node(nodes.Element):
@@ -92,11 +109,18 @@ class directive(rst.Directive):
         :return: A list containing a single `node` element.
         """
         self.assert_has_content()
-        self.options["repo"] = "".join(self.content)
-        attributes: dict[str, str] = {}
-        attributes["text"] = template.render(**self.options)
-        attributes["format"] = "html"
-        return [nodes.raw(**attributes)]
+        repo = "".join(self.content).strip()
+        self.options["repo"] = repo
+        env = self.state.document.settings.env
+        refresh = flag(env.app, "repository_refresh")
+        if github.enabled(env.app):
+            stats = github.lookup(env.app, repo)
+            github.record(env, repo, stats)
+            if stats:
+                self.options["star_count"] = humanize(stats["stars"])
+                self.options["fork_count"] = humanize(stats["forks"])
+        self.options["refresh"] = refresh or "star_count" not in self.options
+        return [node("", **self.options)]
 
 
 def visit(self: HTMLTranslator, node: node) -> None:
@@ -106,12 +130,16 @@ def visit(self: HTMLTranslator, node: node) -> None:
     This method is called when the HTML translator encounters the
     `repository` node in the document tree. It retrieves the relevant
     attributes from the node (if any) and uses Jinja2 templating to
-    produce the final HTML output. Since the `repository` node does not
-    require any actions, the method currently acts as a placeholder.
+    produce the final HTML output.
 
     :param self: The HTML translator instance.
     :param node: The `repository` node being processed.
+
+    .. versionchanged:: 18.10.2026
+
+        The repository is rendered here instead of by the directive.
     """
+    self.body.append(template.render(**node.attributes))
 
 
 def depart(self: HTMLTranslator, node: node) -> None:
@@ -0,0 +1,478 @@
+"""\
+Responsive Images
+=================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the build-time image pipeline of this sphinx
+theme. Instead of serving the full resolution originals to every
+visitor, the `picture` directive publishes a set of variants of every
+image, from which the browser picks the smallest one that's good
+enough for the visitor's screen using `srcset` and `sizes`.
+
+Every image is resized to the widths configured by `image_widths`
+(never upscaled) and encoded in::
+
+    [1] Its fallback format, a progressive JPEG for photographs or an
+        optimised PNG for images with transparency.
+    [2] Every modern format configured by `image_formats`, WebP by
+        default. AVIF is used if it's configured and supported by the
+        installed Pillow.
+
+The EXIF orientation is applied to the pixels and all the metadata,
+except the colour profile, is stripped from the variants.
+
+Encoding is expensive, so every variant is cached on disk by the hash
+of the original's content, its width, format and quality. Unchanged
+images are therefore never re-encoded, not even after a clean build.
+The pipeline can be disabled by setting `responsive_images` to `False`.
+
+.. versionchanged:: 18.10.2026
+
+    Images are no longer written while the documents are being read.
+    They're queued in the build environment under content-hashed names
+    instead, and published once the documents are written, in parallel
+    and hardlinked from the cache wherever the filesystem allows.
+
+.. versionchanged:: 18.10.2026
+
+    Pillow is only imported once an image is processed, so importing
+    the theme stays cheap.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions.utils import option
+from theme.extensions.utils import values
+
+
+if t.TYPE_CHECKING:
+    from PIL import Image
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+RESPONSIVE_VERSION: t.Final[str] = "1"
+WIDTHS: t.Final[tuple[int, ...]] = (480, 960, 1440, 1920)
+FORMATS: t.Final[tuple[str, ...]] = ("webp",)
+SIZES: t.Final[str] = "(max-width: 1100px) 100vw, 1100px"
+QUALITY: t.Final[int] = 82
+ENCODERS: t.Final[dict[str, tuple[str, str, dict[str, t.Any]]]] = {
+    "jpeg": ("image/jpeg", ".jpg", {"progressive": True, "optimize": True}),
+    "png": ("image/png", ".png", {"optimize": True}),
+    "webp": ("image/webp", ".webp", {"method": 6}),
+    "avif": ("image/avif", ".avif", {"speed": 6}),
+}
+
+Variant = tuple[str, int]
+Sources = list[tuple[str, list[Variant]]]
+Task = tuple[str, str, str, int]
+Probe = tuple[int, int, str]
+
+inspected: dict[tuple[str, int, int], tuple[str, Probe | None]] = {}
+skipped: set[str] = set()
+
+
+def supported(fmt: str) -> bool:
+    """Return whether the installed Pillow can encode a format.
+
+    :param fmt: Name of the format, as in `ENCODERS`.
+    :return: `True` if the format can be encoded.
+    """
+    from PIL import Image
+
+    Image.init()
+    return fmt.upper() in Image.SAVE
+
+
+def formats(app: Sphinx) -> tuple[str, ...]:
+    """Return the modern formats configured by `image_formats`.
+
+    Unknown formats, or the ones not supported by the installed Pillow,
+    are skipped. They're reported once as information, not a warning, as
+    the pictures are still published in their original format.
+
+    :param app: The Sphinx application instance.
+    :return: Names of the formats, in order of preference.
+    """
+    available = []
+    for fmt in values(app, "image_formats", FORMATS):
+        fmt = fmt.lower()
+        if fmt in ENCODERS and supported(fmt):
+            available.append(fmt)
+        elif fmt not in skipped:
+            skipped.add(fmt)
+            logger.info("Image format %r is not supported, skipping", fmt)
+    return tuple(available)
+
+
+def load(src: str | os.PathLike[str]) -> Image.Image | None:
+    """Load an image with its EXIF orientation applied.
+
+    :param src: Path of the image.
+    :return: The loaded image, or `None` if it's not a still image that
+        Pillow can read.
+    """
+    from PIL import Image
+    from PIL import ImageOps
+
+    try:
+        with Image.open(src) as image:
+            if getattr(image, "n_frames", 1) > 1:
+                return None
+            loaded = ImageOps.exif_transpose(image)
+            loaded.load()
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    return loaded
+
+
+def probe(src: str | os.PathLike[str]) -> Probe | None:
+    """Return the dimensions and the fallback format of an image.
+
+    Only the header of the image is read, the pixels aren't decoded.
+
+    :param src: Path of the image.
+    :return: Tuple of the width and height (with the EXIF orientation
+        applied) and the fallback format, `png` for images with
+        transparency or PNG originals, otherwise `jpeg`. `None` if it's
+        not a still image that Pillow can read.
+    """
+    from PIL import ExifTags
+    from PIL import Image
+
+    try:
+        with Image.open(src) as image:
+            if getattr(image, "n_frames", 1) > 1:
+                return None
+            width, height = image.size
+            orientation = image.getexif().get(ExifTags.Base.Orientation)
+            transparent = image.has_transparency_data
+            fmt = image.format
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    if orientation in {5, 6, 7, 8}:
+        width, height = height, width
+    return width, height, "png" if transparent or fmt == "PNG" else "jpeg"
+
+
+def inspect(src: str | os.PathLike[str]) -> tuple[str, Probe | None]:
+    """Return the digest of an image's content and its probed metadata.
+
+    The pages often share their images, so the result is remembered by
+    the path, the size and the modification time of the image, and an
+    unchanged image is read only once per process.
+
+    :param src: Path of the image.
+    :return: Tuple of the SHA-256 hex digest of the image and the result
+        of `probe`.
+    """
+    info = os.stat(src)
+    key = (os.fspath(src), info.st_size, info.st_mtime_ns)
+    if key not in inspected:
+        inspected[key] = cache.filedigest(src), probe(src)
+    return inspected[key]
+
+
+def encode(image: Image.Image, fmt: str, width: int, quality: int) -> bytes:
+    """Resize and encode an image without its metadata.
+
+    :param image: The loaded image.
+    :param fmt: Name of the format, as in `ENCODERS`.
+    :param width: Width of the variant, the height is scaled to keep the
+        aspect ratio.
+    :param quality: Quality of the lossy formats.
+    :return: The encoded variant.
+    """
+    from PIL import Image
+
+    if width < image.width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+    if fmt == "jpeg" and image.mode not in {"RGB", "L"}:
+        image = image.convert("RGB")
+    elif image.mode not in {"RGB", "RGBA", "L", "LA"}:
+        image = image.convert("RGBA")
+    _, _, params = ENCODERS[fmt]
+    kwargs = dict(params)
+    if fmt != "png":
+        kwargs["quality"] = quality
+    if icc := image.info.get("icc_profile"):
+        kwargs["icc_profile"] = icc
+    buffer = io.BytesIO()
+    image.save(buffer, fmt.upper(), **kwargs)
+    return buffer.getvalue()
+
+
+def images_cache(app: Sphinx) -> cache.Cache:
+    """Return the cache for the encoded variants.
+
+    Its size (in MiB) is bounded by the `image_cache_size` option.
+
+    :param app: The Sphinx application instance.
+    :return: The cache.
+    """
+    limit = int(option(app, "image_cache_size", 1024)) * cache.MiB
+    return cache.Cache(cache.directory(app, "images"), limit)
+
+
+def queue(env: BuildEnvironment) -> dict[str, Task]:
+    """Return the images queued by the document being read.
+
+    :param env: The build environment.
+    :return: Mapping of the published names and their tasks.
+    """
+    if not hasattr(env, "theme_images"):
+        env.theme_images = {}
+    return t.cast(
+        "dict[str, Task]", env.theme_images.setdefault(env.docname, {})
+    )
+
+
+def variants(
+    app: Sphinx,
+    src: str | os.PathLike[str],
+    queued: dict[str, Task],
+) -> tuple[Sources, int, int] | None:
+    """Queue the responsive variants of an image for publishing.
+
+    Nothing is written while the documents are being read, the variants
+    are only named and queued here. They're named after the original and
+    the hash of its content as `<name>-<hash>-<width>w.<ext>`, so two
+    different images with the same name never overwrite each other.
+
+    :param app: The Sphinx application instance.
+    :param src: Path of the original image.
+    :param queued: Images queued by the document being read.
+    :return: Tuple of the sources (MIME type and variants, with the
+        fallback last), the width and the height of the original, or
+        `None` if the image can't be processed.
+
+    .. versionchanged:: 18.10.2026
+
+        The variants are queued and published once the documents are
+        written, see `publish`.
+
+    .. versionchanged:: 18.10.2026
+
+        The image is only probed and hashed once per process, see
+        `inspect`.
+    """
+    content, meta = inspect(src)
+    if meta is None:
+        return None
+    width, height, default = meta
+    widths = sorted(
+        {w for w in map(int, values(app, "image_widths", WIDTHS)) if w < width}
+        | {width}
+    )
+    stem = f"{Path(src).stem}-{content[:12]}"
+    sources: Sources = []
+    for fmt in (*formats(app), default):
+        mime, ext, _ = ENCODERS[fmt]
+        published: list[Variant] = []
+        for size in widths:
+            name = f"{stem}-{size}w{ext}"
+            queued[name] = (os.fspath(src), content, fmt, size)
+            published.append((name, size))
+        sources.append((mime, published))
+    return sources, width, height
+
+
+def original(src: str | os.PathLike[str], queued: dict[str, Task]) -> str:
+    """Queue an image for publishing as is.
+
+    :param src: Path of the image.
+    :param queued: Images queued by the document being read.
+    :return: Name of the published image, `<name>-<hash>.<ext>`.
+    """
+    path = Path(src)
+    content, _ = inspect(path)
+    name = f"{path.stem}-{content[:12]}{path.suffix}"
+    queued[name] = (os.fspath(path), content, "", 0)
+    return name
+
+
+def link(src: str | os.PathLike[str], dest: Path) -> None:
+    """Publish a file as a hardlink, falling back to a copy.
+
+    The file is published atomically, so a partially written file is
+    never left behind.
+
+    :param src: Path of the file to be published.
+    :param dest: Path of the published file.
+    """
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def render(
+    app: Sphinx,
+    store: cache.Cache,
+    dest: Path,
+    tasks: list[tuple[str, Task]],
+) -> None:
+    """Publish all the queued files of a single original.
+
+    The original is decoded at most once, and only if any of its
+    variants is missing from the cache. Cached variants are hardlinked
+    from the cache into the output directory. If the original can't be
+    decoded, it's published in place of its missing variants instead.
+
+    :param app: The Sphinx application instance.
+    :param store: The cache for the encoded variants.
+    :param dest: Directory where the files are published.
+    :param tasks: Names and tasks of the files to be published.
+    """
+    quality = int(option(app, "image_quality", QUALITY))
+    image = None
+    failed = False
+    for name, (src, content, fmt, size) in tasks:
+        path = dest / name
+        if not fmt or failed:
+            link(src, path)
+            continue
+        key = cache.digest(
+            RESPONSIVE_VERSION, content, fmt, str(size), str(quality)
+        )
+        if (entry := store.get(key)) is not None:
+            link(entry, path)
+            continue
+        if image is None and (image := load(src)) is None:
+            # NOTE(xames3): The variants are already listed by the pages
+            # which use them, so the original is published under their
+            # names instead of leaving the links broken.
+            logger.info("Failed to load image %r, publishing it as is", src)
+            failed = True
+            link(src, path)
+            continue
+        data = encode(image, fmt, size, quality)
+        store.write(key, data)
+        if (entry := store.get(key)) is not None:
+            link(entry, path)
+        else:
+            path.write_bytes(data)
+
+
+def publish(app: Sphinx) -> int:
+    """Publish the images queued by all the documents.
+
+    The images are published once per build, after the documents are
+    written, to the `_images` directory. As the names are derived from
+    the content, the images which are already published are skipped and
+    the ones shared by multiple documents are published once. The rest
+    are published in parallel using a thread pool of `image_workers`
+    threads, as Pillow releases the GIL while encoding.
+
+    :param app: The Sphinx application instance.
+    :return: Number of published files.
+
+    .. versionadded:: 18.10.2026
+    """
+    dest = Path(app.outdir, "_images")
+    pending: dict[str, list[tuple[str, Task]]] = {}
+    seen: set[str] = set()
+    for queued in getattr(app.env, "theme_images", {}).values():
+        for name, task in queued.items():
+            if name in seen or (dest / name).exists():
+                continue
+            seen.add(name)
+            pending.setdefault(task[1], []).append((name, task))
+    if not pending:
+        return 0
+    dest.mkdir(parents=True, exist_ok=True)
+    store = images_cache(app)
+    workers = int(option(app, "image_workers", 0)) or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [
+            executor.submit(render, app, store, dest, tasks)
+            for tasks in pending.values()
+        ]:
+            future.result()
+    return len(seen)
+
+
+def srcset(prefix: str, published: list[Variant]) -> str:
+    """Return the `srcset` attribute of a list of variants.
+
+    :param prefix: URL prefix of the published variants.
+    :param published: Names and widths of the variants.
+    :return: Comma separated list of candidates.
+    """
+    return ", ".join(f"{prefix}{name} {size}w" for name, size in published)
+
+
+def env_purge_doc(_: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the images queued by a document which is removed or re-read.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment.
+    :param docname: The name of the document.
+
+    .. versionadded:: 18.10.2026
+    """
+    if hasattr(env, "theme_images"):
+        env.theme_images.pop(docname, None)
+
+
+def env_merge_info(
+    _: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the images queued by the parallel reading processes.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment of the main process.
+    :param docnames: The names of the documents read by the process.
+    :param other: The build environment of the reading process.
+
+    .. versionadded:: 18.10.2026
+    """
+    if not hasattr(env, "theme_images"):
+        env.theme_images = {}
+    images = getattr(other, "theme_images", {})
+    env.theme_images.update(
+        (docname, images[docname]) for docname in docnames if docname in images
+    )
+
+
+def build_finished(app: Sphinx, exc: Exception | None) -> None:
+    """Publish the queued images and prune the cache of the encoded
+    variants to its size limit.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+
+    .. versionchanged:: 18.10.2026
+
+        The queued images are published here, instead of while the
+        documents are being read.
+    """
+    if exc or app.builder.format != "html":
+        return
+    published = publish(app)
+    evicted = images_cache(app).prune()
+    logger.verbose(
+        "Images: %d published, %d evicted from the cache", published, evicted
+    )
@@ -0,0 +1,517 @@
+"""\
+Streaming HTML Rewriter
+=======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides a streaming, tokenizer based rewrite engine for
+post-processing the HTML pages generated by this sphinx theme.
+
+Unlike the BeautifulSoup based pipeline in `theme.extensions.utils`,
+which builds a full tree and then walks it once per transformation, the
+rewriter applies every transformation in a single forward pass over the
+tokens emitted by the standard library's `html.parser`. Markup that is
+not touched by any transformation is copied through verbatim, and the
+output is written through a buffered file as soon as it's final.
+
+The only markup held in memory is the part that cannot be finalised
+yet, i.e. the list items of the left sidebar (whose attributes depend
+on what follows them) and `toctree-wrapper` divs (which are dropped if
+they turn out to be empty). Everything else streams straight through.
+
+The following transformations are applied::
+
+    [1] External links open in a new tab (`open_links_in_new_tab`).
+    [2] Header links copy their URL (`add_copy_to_headerlinks`).
+    [3] Left sidebar branches are collapsible (`make_toc_collapsible`).
+    [4] Empty toctree wrappers are removed (`remove_empty_toctree_divs`).
+    [5] Sections are tracked by the scrollspy (`add_scrollspy`).
+    [6] HTML comments are stripped (`remove_comments`).
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+from html.parser import HTMLParser
+
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+CHUNKSIZE: t.Final[int] = 64 * 1024
+VOID_ELEMENTS: t.Final[frozenset[str]] = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+Attributes = list[tuple[str, str | None]]
+
+
+def escape(value: str) -> str:
+    """Escape an attribute value for serialising it in double quotes.
+
+    :param value: Unescaped attribute value.
+    :return: Escaped attribute value.
+    """
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+
+
+def starttag(tag: str, attrs: Attributes, *, close: bool = False) -> str:
+    """Serialise a start tag from its name and attributes.
+
+    :param tag: Name of the tag.
+    :param attrs: List of attribute name and value pairs.
+    :param close: Boolean flag to render a self closing tag, defaults to
+        `False`.
+    :return: The serialised start tag.
+    """
+    rendered = "".join(
+        f" {name}" if value is None else f' {name}="{escape(value)}"'
+        for name, value in attrs
+    )
+    return f"<{tag}{rendered}{' /' if close else ''}>"
+
+
+def setattr_(attrs: Attributes, name: str, value: str) -> None:
+    """Set an attribute in place, preserving its position if it exists.
+
+    :param attrs: List of attribute name and value pairs.
+    :param name: Name of the attribute.
+    :param value: Value of the attribute.
+    """
+    for idx, (key, _) in enumerate(attrs):
+        if key == name:
+            attrs[idx] = (name, value)
+            return
+    attrs.append((name, value))
+
+
+def delattr_(attrs: Attributes, name: str) -> None:
+    """Remove an attribute in place if it exists.
+
+    :param attrs: List of attribute name and value pairs.
+    :param name: Name of the attribute.
+    """
+    attrs[:] = [(key, value) for key, value in attrs if key != name]
+
+
+def classes(attrs: Attributes) -> list[str]:
+    """Return the list of classes from the attributes.
+
+    :param attrs: List of attribute name and value pairs.
+    :return: List of classes (can be empty).
+    """
+    for key, value in attrs:
+        if key == "class":
+            return (value or "").split()
+    return []
+
+
+def getattr_(attrs: Attributes, name: str) -> str | None:
+    """Return the value of an attribute, or `None` if it's not set.
+
+    :param attrs: List of attribute name and value pairs.
+    :param name: Name of the attribute.
+    :return: Value of the attribute.
+    """
+    for key, value in attrs:
+        if key == name:
+            return value
+    return None
+
+
+def toggle(identifier: str) -> str:
+    """Return the toggle button of a collapsible branch.
+
+    :param identifier: ID of the nested list controlled by the button.
+    :return: The serialised button.
+    """
+    return (
+        '<button type="button" class="nav-toggle" '
+        f'aria-controls="{escape(identifier)}">'
+        '<span class="sr-only">Toggle section</span></button>'
+    )
+
+
+class slot:
+    """Placeholder for markup which cannot be finalised yet.
+
+    Slots are placed in the held output and filled once the rewriter
+    has seen enough of the document to render them. Unfilled slots
+    render to an empty string.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str = "") -> None:
+        self.text = text
+
+    def __str__(self) -> str:
+        """Return the markup of the slot."""
+        return self.text
+
+
+class frame:
+    """Class to represent an open element on the rewriter's stack."""
+
+    __slots__ = (
+        "attrs",
+        "branch",
+        "buttons",
+        "classes",
+        "current",
+        "empty",
+        "index",
+        "link",
+        "region",
+        "slot",
+        "start",
+        "tag",
+    )
+
+    def __init__(self, tag: str, attrs: Attributes, region: str) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = classes(attrs)
+        self.region = region
+        self.slot: slot | None = None
+        self.start = -1
+        self.buttons: list[slot] = []
+        self.branch: frame | None = None
+        self.current = False
+        self.empty = False
+        self.index = 0
+        self.link = False
+
+
+class Rewriter(HTMLParser):
+    """Single pass HTML rewriter applying all the theme transformations.
+
+    The rewriter is fed the document in chunks and writes the rewritten
+    markup to `write` as soon as it's final. Markup which depends on
+    what follows it is held back in `held` until the element enclosing
+    it is closed.
+
+    :param write: Callable used for writing the rewritten markup.
+    :param region: Sidebar region the markup belongs to, used when
+        rewriting fragments of a page, defaults to an empty string.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str], t.Any],
+        region: str = "",
+    ) -> None:
+        super().__init__(convert_charrefs=False)
+        self.write = write
+        self.initial = region
+        self.stack: list[frame] = []
+        self.held: list[str | slot] = []
+        self.holding = 0
+        self.branches = 0
+
+    @property
+    def region(self) -> str:
+        """Return the sidebar region the parser is currently in."""
+        return self.stack[-1].region if self.stack else self.initial
+
+    def emit(self, text: str | slot) -> None:
+        """Write the markup out, or hold it if it's not final yet."""
+        if self.holding:
+            self.held.append(text)
+        else:
+            self.write(str(text))
+
+    def hold(self) -> None:
+        """Start holding the markup back."""
+        self.holding += 1
+
+    def release(self) -> None:
+        """Stop holding the markup back and flush it once it's final."""
+        self.holding -= 1
+        if not self.holding and self.held:
+            self.write("".join(map(str, self.held)))
+            self.held.clear()
+
+    def handle_decl(self, decl: str) -> None:
+        self.emit(f"<!{decl}>")
+
+    def handle_pi(self, data: str) -> None:
+        self.emit(f"<?{data}>")
+
+    def unknown_decl(self, data: str) -> None:
+        self.emit(f"<![{data}]>")
+
+    def handle_comment(self, data: str) -> None:
+        """Strip HTML comments (see `remove_comments`)."""
+        # NOTE(xames3): The comments are dropped, but they still count
+        # as content of an enclosing toctree wrapper, just like they do
+        # for the BeautifulSoup implementation.
+        del data
+        self.touch()
+
+    def handle_data(self, data: str) -> None:
+        if data.strip():
+            self.touch()
+        self.emit(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self.touch()
+        self.emit(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.touch()
+        self.emit(f"&#{name};")
+
+    def touch(self) -> None:
+        """Mark the enclosing toctree wrapper as non-empty."""
+        if self.stack and self.stack[-1].empty:
+            self.stack[-1].empty = False
+
+    def handle_startendtag(self, tag: str, attrs: Attributes) -> None:
+        self.touch()
+        text = self.get_starttag_text() or starttag(tag, attrs, close=True)
+        self.emit(text)
+
+    def handle_starttag(self, tag: str, attrs: Attributes) -> None:
+        self.touch()
+        parent = self.stack[-1] if self.stack else None
+        element = frame(tag, attrs, self.region)
+        identifier = getattr_(attrs, "id")
+        if identifier == "left-sidebar":
+            element.region = "left"
+        elif identifier == "right-sidebar":
+            element.region = "right"
+        text = self.get_starttag_text() or starttag(tag, attrs)
+        if "current" in element.classes:
+            self.mark_current()
+        if tag == "a":
+            text = self.rewrite_link(element, parent, text)
+        elif tag == "li" and element.region == "left":
+            self.hold()
+            element.current = "current" in element.classes
+            element.slot = slot(text)
+            text = element.slot
+        elif (
+            tag == "ul"
+            and parent is not None
+            and parent.tag == "li"
+            and parent.region == "left"
+            and parent.buttons
+            and parent.branch is None
+        ):
+            parent.branch = element
+            self.branches += 1
+            parent.index = self.branches
+            element.slot = slot(text)
+            text = element.slot
+            element.start = len(self.held) + 1
+        elif tag == "div" and "toctree-wrapper" in element.classes:
+            self.hold()
+            element.empty = True
+            element.start = len(self.held)
+        self.emit(text)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def rewrite_link(
+        self,
+        element: frame,
+        parent: frame | None,
+        text: str,
+    ) -> str:
+        """Apply the link specific transformations to an anchor tag.
+
+        :param element: The anchor being opened.
+        :param parent: The element enclosing the anchor.
+        :param text: Original start tag of the anchor.
+        :return: The (possibly rewritten) start tag of the anchor.
+        """
+        attrs = element.attrs
+        modified = False
+        if getattr_(attrs, "class") == "reference external":
+            setattr_(attrs, "rel", "nofollow noopener")
+            setattr_(attrs, "target", "_blank")
+            modified = True
+        if "headerlink" in element.classes:
+            setattr_(
+                attrs,
+                "@click.prevent",
+                "window.navigator.clipboard.writeText($el.href);",
+            )
+            delattr_(attrs, "title")
+            setattr_(attrs, "aria-label", "Copy link")
+            if parent is not None and (
+                parent.tag in {"h2", "h3"}
+                or (parent.tag == "dt" and "sig" in parent.classes)
+            ):
+                setattr_(
+                    attrs,
+                    "x-intersect.margin.0%.0%.-70%.0%",
+                    f"activeSection = '{getattr_(attrs, 'href')}'",
+                )
+            modified = True
+        href = getattr_(attrs, "href")
+        if element.region == "right" and href is not None:
+            setattr_(attrs, ":data-current", f"activeSection === '{href}'")
+            modified = True
+        if (
+            element.region == "left"
+            and parent is not None
+            and parent.tag == "li"
+        ):
+            element.link = True
+            if "current" in element.classes:
+                parent.current = True
+        return starttag(element.tag, attrs) if modified else text
+
+    def mark_current(self) -> None:
+        """Mark every branch enclosing the current element as current."""
+        for element in self.stack:
+            if element.tag == "li" and element.branch in self.stack:
+                element.current = True
+
+    def handle_endtag(self, tag: str) -> None:
+        for idx in range(len(self.stack) - 1, -1, -1):
+            if self.stack[idx].tag == tag:
+                break
+        else:
+            self.emit(f"</{tag}>")
+            return
+        while len(self.stack) > idx:
+            element = self.stack.pop()
+            self.finalise(element, explicit=element.tag == tag)
+
+    def finalise(self, element: frame, *, explicit: bool) -> None:
+        """Finalise an element which is being closed.
+
+        :param element: The element being closed.
+        :param explicit: Boolean flag indicating if the element was
+            closed by an end tag (as opposed to implicitly closed).
+        """
+        end = f"</{element.tag}>" if explicit else ""
+        parent = self.stack[-1] if self.stack else None
+        if element.empty:
+            del self.held[element.start :]
+            self.release()
+            return
+        self.emit(end)
+        if element.link and parent is not None:
+            button = slot()
+            parent.buttons.append(button)
+            self.emit(button)
+        elif parent is not None and parent.branch is element:
+            self.close_branch(parent, element)
+        elif element.tag == "div" and element.start >= 0:
+            self.release()
+        elif element.tag == "li" and element.slot is not None:
+            self.close_item(element)
+            self.release()
+
+    def close_branch(self, item: frame, branch: frame) -> None:
+        """Fill the slots of a collapsible branch in the left sidebar.
+
+        :param item: The list item owning the branch.
+        :param branch: The nested list which is collapsible.
+        """
+        identifier = getattr_(branch.attrs, "id")
+        if not identifier:
+            identifier = f"nav-branch-{item.index}"
+            setattr_(branch.attrs, "id", identifier)
+            assert branch.slot is not None
+            branch.slot.text = starttag(branch.tag, branch.attrs)
+        for button in item.buttons:
+            button.text = toggle(identifier)
+        item.buttons.clear()
+
+    def close_item(self, item: frame) -> None:
+        """Fill the start tag of a list item in the left sidebar.
+
+        :param item: The list item being closed.
+        """
+        if item.branch is None:
+            return
+        names = item.classes
+        if "has-children" not in names:
+            names = [*names, "has-children"]
+        setattr_(item.attrs, "class", " ".join(names))
+        expanded = "true" if item.current else "false"
+        setattr_(item.attrs, "aria-expanded", expanded)
+        assert item.slot is not None
+        item.slot.text = starttag(item.tag, item.attrs)
+
+    def close(self) -> None:
+        super().close()
+        while self.stack:
+            self.finalise(self.stack.pop(), explicit=False)
+        while self.holding:
+            self.release()
+
+
+def rewrite(html: str, chunksize: int = CHUNKSIZE) -> None:
+    """Rewrite an HTML file in place using a single streaming pass.
+
+    The file is read and parsed in chunks, and the rewritten markup is
+    written to a temporary sibling file through a buffered writer. The
+    temporary file atomically replaces the original once the rewrite is
+    complete, so a failed rewrite never leaves a half written page.
+
+    :param html: Path to the HTML file to be rewritten.
+    :param chunksize: Number of characters to read and feed at once,
+        defaults to `CHUNKSIZE`.
+    """
+    tmp = f"{html}.tmp"
+    try:
+        with (
+            open(html, encoding="utf-8") as src,
+            open(tmp, "w", encoding="utf-8", buffering=chunksize) as dest,
+        ):
+            parser = Rewriter(dest.write)
+            while chunk := src.read(chunksize):
+                parser.feed(chunk)
+            parser.close()
+        os.replace(tmp, html)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def fragment(markup: str, region: str = "") -> str:
+    """Rewrite a fragment of HTML markup and return it.
+
+    This is used for rewriting the pieces of a page which are rendered
+    outside the document body, like the sidebar ToCs, while the page is
+    being written.
+
+    :param markup: HTML markup to be rewritten.
+    :param region: Sidebar region the markup belongs to, either `left`,
+        `right` or an empty string, defaults to an empty string.
+    :return: The rewritten markup.
+    """
+    parts: list[str] = []
+    parser = Rewriter(parts.append, region)
+    parser.feed(markup)
+    parser.close()
+    return "".join(parts)
@@ -4,7 +4,7 @@ Custom Roles
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 21 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module provides custom roles for this sphinx theme that provides a
 way to add features to the document.
@@ -115,19 +115,26 @@ def email(
         generated during processing (typically empty if no errors).
     :raises: None, but will report an error message if the input format
         is invalid.
+
+    .. versionchanged:: 18.10.2026
+
+        The default subject is filled in once the document is read, from
+        the title indexed by `theme.extensions.metadata`, instead of
+        looking up the titles of the document on every use.
     """
-    # NOTE(xames3): The parameters `role`, `options`, and `content` are
-    # currently unused but are included to match the expected signature
-    # for a Sphinx role function.
+    # NOTE(xames3): The parameters `role`, `inliner`, `options`, and
+    # `content` are currently unused but are included to match the
+    # expected signature for a Sphinx role function.
     role = role or ""
+    inliner = inliner or None
     options = options or {}
     content = content or []
-    titles = inliner.document.traverse(nodes.title)
     href, rest = text.split("<", 1)
     href = href.strip()
     if "|" in rest:
         href, subject = (t.strip() for t in rest.split("|", 1))
-    else:
-        subject = titles[0].children[-1].astext().strip()
-    refuri = f"mailto:{rest.rstrip('>').strip()}?subject={subject}"
-    return [nodes.reference(rawtext, href, refuri=refuri, line=lineno)], []
+        refuri = f"mailto:{rest.rstrip('>').strip()}?subject={subject}"
+        return [nodes.reference(rawtext, href, refuri=refuri, line=lineno)], []
+    address = rest.rstrip(">").strip()
+    node = nodes.reference(rawtext, href, mailto=address, line=lineno)
+    return [node], []
@@ -0,0 +1,349 @@
+"""\
+Offline Search
+==============
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module builds the index of the theme's client-side search, which
+answers the queries typed in the searchbox without any external service
+and without downloading the whole index of Sphinx's search upfront.
+
+The terms of every document are collected once, right after its doctree
+is read, and stored in the build environment along with their scores.
+A term scores higher if it's a part of the document's title or of a
+section's title. Once the build is finished, the index is written to the
+`_search` directory of the output, split into the following files::
+
+    [1] `index.js`, the manifest with the list of the shards and the
+        number of the documents.
+    [2] `<prefix>.js`, one shard per prefix of the terms (their first
+        two characters). A shard maps the rest of its terms to their
+        postings, i.e. the IDs of the documents and the scores of the
+        term in them. The postings are sorted by the IDs and encoded as
+        deltas, so the shards are mostly small, repetitive numbers and
+        compress well.
+    [3] `docs-<n>.js`, the URLs and the titles of the documents, in
+        chunks of `CHUNK` documents.
+
+The client-side script of the theme loads the manifest when the
+searchbox is first used and only the shards of the typed words after
+that, so a query is answered from a few KB of the index. The files are
+scripts instead of JSON documents, so they're loaded using `<script>`
+tags, which also work if the documentation is opened from the disk.
+
+The search is disabled by default, and can be enabled by setting the
+`search_index` option. It takes the place of Sphinx's search in the
+searchbox and on the search page, unless DocSearch is configured.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import typing as t
+from collections import Counter
+from pathlib import Path
+
+import docutils.nodes as nodes
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions import metadata
+from theme.extensions.utils import flag
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
+
+SEARCH_VERSION: t.Final[int] = 1
+PREFIX: t.Final[int] = 2
+CHUNK: t.Final[int] = 128
+POSTINGS: t.Final[int] = 100
+TITLE: t.Final[int] = 8
+SECTION: t.Final[int] = 4
+SCORE: t.Final[int] = 255
+STOPWORDS: t.Final[frozenset[str]] = frozenset(
+    {
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "with",
+    }
+)
+SKIPPED: t.Final[tuple[type[nodes.Node], ...]] = (
+    nodes.comment,
+    nodes.Invisible,
+    nodes.raw,
+    nodes.substitution_definition,
+    nodes.system_message,
+)
+TERM: re.Pattern[str] = re.compile(r"\w+")
+PLAIN: re.Pattern[str] = re.compile(r"[a-z0-9]+")
+
+
+def enabled(app: Sphinx) -> bool:
+    """Check if the search index is built.
+
+    :param app: The Sphinx application instance.
+    :return: `True` if the `search_index` option is set.
+    """
+    return flag(app, "search_index")
+
+
+def terms(text: str) -> list[str]:
+    """Split a text into the terms of the index.
+
+    :param text: The text.
+    :return: The lowercase words of the text, leaving out the stopwords
+        and the single characters.
+    """
+    return [
+        term
+        for term in TERM.findall(text.lower())
+        if len(term) >= PREFIX and term not in STOPWORDS
+    ]
+
+
+def shard(term: str) -> str:
+    """Return the name of the shard of a term.
+
+    :param term: The term.
+    :return: The prefix of the term, hex-encoded if it isn't plain
+        ASCII, so it's safe to use as a file name.
+    """
+    prefix = term[:PREFIX]
+    if PLAIN.fullmatch(prefix):
+        return prefix
+    return f"x{prefix.encode().hex()}"
+
+
+def collect(doctree: nodes.document) -> dict[str, int]:
+    """Collect the scored terms of a document in a single pass.
+
+    :param doctree: The doctree of the document.
+    :return: Mapping of the terms and their scores.
+    """
+    scores: Counter[str] = Counter()
+
+    def _walk(node: nodes.Element, weight: int) -> None:
+        for child in node.children:
+            if isinstance(child, SKIPPED):
+                continue
+            if isinstance(child, nodes.Text):
+                for term in terms(child.astext()):
+                    scores[term] += weight
+            elif isinstance(child, nodes.title) and isinstance(
+                child.parent, nodes.section
+            ):
+                top = isinstance(child.parent.parent, nodes.document)
+                _walk(child, TITLE if top else SECTION)
+            elif isinstance(child, nodes.Element):
+                _walk(child, weight)
+
+    _walk(doctree, 1)
+    return {term: min(score, SCORE) for term, score in scores.items()}
+
+
+def indexed(env: BuildEnvironment) -> dict[str, dict[str, int]]:
+    """Return the scored terms of the documents.
+
+    :param env: The build environment.
+    :return: Mapping of the documents and their scored terms.
+    """
+    if not hasattr(env, "theme_search"):
+        env.theme_search = {}
+    return t.cast("dict[str, dict[str, int]]", env.theme_search)
+
+
+def doctree_read(app: Sphinx, doctree: nodes.document) -> None:
+    """Collect the terms of the document which was read.
+
+    :param app: The Sphinx application instance.
+    :param doctree: The document tree which was read.
+    """
+    if enabled(app):
+        indexed(app.env)[app.env.docname] = collect(doctree)
+
+
+def env_get_outdated(
+    app: Sphinx,
+    env: BuildEnvironment,
+    added: set[str],
+    changed: set[str],
+    removed: set[str],
+) -> list[str]:
+    """Read the documents again which were read without the index.
+
+    :param app: The Sphinx application instance.
+    :param env: The current build environment.
+    :param added: The names of the added documents.
+    :param changed: The names of the changed documents.
+    :param removed: The names of the removed documents.
+    :return: The names of the documents to be read again.
+    """
+    if not enabled(app):
+        return []
+    return sorted(
+        env.all_docs.keys() - indexed(env).keys() - added - changed - removed
+    )
+
+
+def env_purge_doc(_: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the terms of a document which is removed or re-read.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment.
+    :param docname: The name of the document.
+    """
+    if hasattr(env, "theme_search"):
+        env.theme_search.pop(docname, None)
+
+
+def env_merge_info(
+    _: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the terms collected by the parallel reading processes.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment of the main process.
+    :param docnames: The names of the documents read by the process.
+    :param other: The build environment of the reading process.
+    """
+    found = getattr(other, "theme_search", {})
+    indexed(env).update(
+        (docname, found[docname]) for docname in docnames if docname in found
+    )
+
+
+def encode(postings: dict[int, int]) -> list[int]:
+    """Encode the postings of a term.
+
+    Only the documents with the highest scores are kept, which are then
+    sorted by their IDs and stored as the differences between the
+    consecutive IDs, each followed by the score.
+
+    :param postings: Mapping of the IDs of the documents and the scores
+        of the term in them.
+    :return: Flat list of the deltas of the IDs and the scores.
+    """
+    kept = sorted(postings.items(), key=lambda item: (-item[1], item[0]))
+    encoded: list[int] = []
+    previous = 0
+    for docid, score in sorted(kept[:POSTINGS]):
+        encoded.extend((docid - previous, score))
+        previous = docid
+    return encoded
+
+
+def script(name: str, data: t.Any) -> str:
+    """Return a file of the index.
+
+    :param name: Name of the file, without its extension.
+    :param data: The data of the file.
+    :return: Script passing the data to the client-side search.
+    """
+    encoded = json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    )
+    return f'xaSearch.load("{name}",{encoded})\n'
+
+
+def files(app: Sphinx) -> dict[str, str]:
+    """Return the files of the index.
+
+    :param app: The Sphinx application instance.
+    :return: Mapping of the names of the files, without their extension,
+        and their content.
+    """
+    env = app.env
+    found = indexed(env)
+    docnames = sorted(docname for docname in found if docname in env.all_docs)
+    shards: dict[str, dict[str, dict[int, int]]] = {}
+    for docid, docname in enumerate(docnames):
+        for term, score in found[docname].items():
+            postings = shards.setdefault(shard(term), {})
+            postings.setdefault(term[PREFIX:], {})[docid] = score
+    output = {
+        name: script(
+            name,
+            {suffix: encode(postings) for suffix, postings in entries.items()},
+        )
+        for name, entries in shards.items()
+    }
+    documents = [
+        [
+            app.builder.get_target_uri(docname),
+            metadata.lookup(env, docname).title
+            or (env.titles[docname].astext() if docname in env.titles else "")
+            or docname,
+        ]
+        for docname in docnames
+    ]
+    for start in range(0, len(documents), CHUNK):
+        name = f"docs-{start // CHUNK}"
+        output[name] = script(name, documents[start : start + CHUNK])
+    output["index"] = script(
+        "index",
+        {
+            "chunk": CHUNK,
+            "documents": len(documents),
+            "prefix": PREFIX,
+            "shards": sorted(shards),
+            "stopwords": sorted(STOPWORDS),
+            "version": cache.digest(
+                str(SEARCH_VERSION), *sorted(output.values())
+            )[:12],
+        },
+    )
+    return output
+
+
+def build_finished(app: Sphinx, exc: Exception | None) -> None:
+    """Write the index to the `_search` directory of the output.
+
+    The previous index is removed first, so no stale shards are left.
+
+    :param app: The Sphinx application instance.
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    if exc or not enabled(app) or app.builder.format != "html":
+        return
+    directory = Path(app.outdir, "_search")
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+    output = files(app)
+    for name, content in output.items():
+        (directory / f"{name}.js").write_text(content, encoding="utf-8")
+    logger.verbose(
+        "Search index written, %d file(s), %d bytes",
+        len(output),
+        sum(len(content.encode()) for content in output.values()),
+    )
@@ -0,0 +1,156 @@
+"""\
+Directive Templates
+===================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module provides the Jinja2 environment shared by the directives of
+this sphinx theme for rendering their `*.html.jinja` templates.
+
+The directives no longer read and compile their templates when they're
+imported. Instead, every directive holds a lazy handle to its template,
+which is only loaded from the theme's templates directory the first time
+it's rendered. A build which doesn't use a directive never compiles its
+template.
+
+The compiled templates are kept in a bytecode cache on disk, next to the
+other caches of the theme, so the later builds (and the forked worker
+processes) load the bytecode instead of compiling the templates again.
+The environment is auto-reloading, i.e. a template is recompiled if its
+file changes, and the bytecode is keyed by the template's source, so a
+stale bytecode is never used.
+
+The time spent importing the directive modules and loading the templates
+is logged once the build is finished, and every load is recorded as a
+span of the theme's profile, if profiling is enabled.
+"""
+
+from __future__ import annotations
+
+import os.path as p
+import time
+import typing as t
+
+import jinja2
+from jinja2.bccache import FileSystemBytecodeCache
+from sphinx.util import logging
+
+from theme.extensions import cache
+from theme.extensions import profiling
+
+
+if t.TYPE_CHECKING:
+    from jinja2.bccache import Bucket
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES: t.Final[str] = p.abspath(
+    p.join(p.dirname(__file__), "../base/templates")
+)
+
+_environment: jinja2.Environment | None = None
+imported: int = 0
+stats: dict[str, int] = {"loaded": 0, "cached": 0, "elapsed": 0}
+
+
+class bytecode(FileSystemBytecodeCache):
+    """Class to count the templates loaded from the bytecode cache."""
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the bytecode of a template, if it's cached.
+
+        :param bucket: The bucket of the template.
+        """
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            stats["cached"] += 1
+
+
+def environment() -> jinja2.Environment:
+    """Return the Jinja2 environment shared by the directives.
+
+    The values passed to the templates (like the captions and the
+    metadata of the videos) come from the documents and the remote
+    services, so they're escaped, unless they're marked as safe.
+
+    :return: Auto-reloading, autoescaping environment loading the
+        templates from the theme's templates directory.
+    """
+    global _environment
+    if _environment is None:
+        _environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(TEMPLATES),
+            autoescape=jinja2.select_autoescape(("html", "html.jinja")),
+            auto_reload=True,
+        )
+    return _environment
+
+
+class template:
+    """Class to represent a lazily loaded template of a directive.
+
+    :param name: Name of the template in the theme's templates
+        directory.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialise the handle without loading the template."""
+        self.name = name
+        self.loaded: jinja2.Template | None = None
+
+    def load(self) -> jinja2.Template:
+        """Return the template, loading it on first use.
+
+        The template is loaded again if its file has changed since.
+
+        :return: The loaded template.
+        """
+        if self.loaded is not None and self.loaded.is_up_to_date:
+            return self.loaded
+        start = time.perf_counter_ns()
+        with profiling.span(f"{self.name}.load", "template"):
+            self.loaded = environment().get_template(self.name)
+        stats["loaded"] += 1
+        stats["elapsed"] += time.perf_counter_ns() - start
+        return self.loaded
+
+    def render(self, **context: t.Any) -> str:
+        """Render the template.
+
+        :param context: Context variables passed to the template.
+        :return: The rendered template.
+        """
+        return self.load().render(**context)
+
+
+def builder_inited(app: Sphinx) -> None:
+    """Attach the on-disk bytecode cache to the shared environment.
+
+    :param app: The Sphinx application instance.
+    """
+    directory = cache.directory(app, "jinja")
+    directory.mkdir(parents=True, exist_ok=True)
+    environment().bytecode_cache = bytecode(str(directory))
+
+
+def build_finished(_: Sphinx, exc: Exception | None) -> None:
+    """Log the time spent importing the directives and loading their
+    templates.
+
+    :param _: The Sphinx application instance (unused).
+    :param exc: An exception raised during the build process, or `None`
+        if the build was successful.
+    """
+    if exc:
+        return
+    logger.verbose(
+        "Directives imported in %.1f ms, %d template(s) loaded in %.1f ms "
+        "(%d from the bytecode cache)",
+        imported / 1e6,
+        stats["loaded"],
+        stats["elapsed"] / 1e6,
+        stats["cached"],
+    )
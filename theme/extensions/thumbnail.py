@@ -4,7 +4,7 @@ YouTube Thumbnail Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 06 September, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `thumbnail` directive for this sphinx theme.
 The directive allows embedding a YouTube video thumbnail card directly
@@ -23,28 +23,37 @@ follows::
 
 The above snippet will be processed and rendered according to the
 theme's Jinja2 template, producing a final HTML output.
+
+.. versionchanged:: 18.10.2026
+
+    The title and the channel of the video default to its metadata from
+    the cache of `theme.extensions.oembed`.
+
+.. versionchanged:: 18.10.2026
+
+    The thumbnail is localized by `theme.extensions.localize` if the
+    `localize_images` option is set, instead of being hotlinked.
 """
 
 from __future__ import annotations
 
-import os.path as p
 import typing as t
 
 import docutils.nodes as nodes
 import docutils.parsers.rst as rst
-import jinja2
+
+from theme.extensions import localize
+from theme.extensions import oembed
+from theme.extensions import templating
 
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "thumbnail"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "thumbnail.html.jinja")
+template = templating.template("thumbnail.html.jinja")
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+WIDTH: t.Final[int] = 320
 
 
 class node(nodes.Element):
@@ -63,9 +72,19 @@ class directive(rst.Directive):
     This class defines the behavior of the `thumbnail` directive,
     including how it processes options and content, and how it generates
     nodes to be inserted into the document tree.
+
+    The directive supports the following options::
+
+        - `title`: Title of the video, defaults to the one on YouTube.
+        - `channel`: Name of the channel, defaults to the one on
+          YouTube.
     """
 
     has_content = True
+    option_spec = {  # noqa: RUF012
+        "title": rst.directives.unchanged,
+        "channel": rst.directives.unchanged,
+    }
 
     def run(self) -> list[nodes.Node]:
         """Parse directive options and create an `thumbnail` node.
@@ -92,20 +111,20 @@ class directive(rst.Directive):
         """
         self.assert_has_content()
         src = rst.directives.uri(self.content.pop())
-        vid = src
-        if "youtu.be/" in src:
-            vid = src.rsplit("/", 1)[-1].split("?", 1)[0]
-        elif "watch?v=" in src:
-            vid = src.split("v=", 1)[-1].split("&", 1)[0]
+        vid = oembed.video_id(src)
+        env = self.state.document.settings.env
+        metadata = oembed.lookup(env.app, vid)
+        for option, field in (("title", "title"), ("channel", "author_name")):
+            if option not in self.options and metadata.get(field):
+                self.options[option] = metadata[field]
         self.options["src"] = src
         self.options["video_id"] = vid
-        self.options["thumbnail"] = (
-            f"https://img.youtube.com/vi/{vid}/hqdefault.jpg"
+        self.options["thumbnail"] = oembed.THUMBNAIL.format(vid)
+        localized = localize.image(
+            env.app, env, self.options["thumbnail"], WIDTH
         )
-        attributes: dict[str, str] = {}
-        attributes["text"] = template.render(**self.options)
-        attributes["format"] = "html"
-        return [nodes.raw(**attributes)]
+        self.options.update(localized or {})
+        return [node("", **self.options)]
 
 
 def visit(self: HTMLTranslator, node: node) -> None:
@@ -115,12 +134,18 @@ def visit(self: HTMLTranslator, node: node) -> None:
     This method is called when the HTML translator encounters the
     `thumbnail` node in the document tree. It retrieves the relevant
     attributes from the node (if any) and uses Jinja2 templating to
-    produce the final HTML output. Since the `thumbnail` node does not
-    require any actions, the method currently acts as a placeholder.
+    produce the final HTML output.
 
     :param self: The HTML translator instance.
     :param node: The `thumbnail` node being processed.
+
+    .. versionchanged:: 18.10.2026
+
+        The card is rendered here instead of by the directive, so the
+        URLs of the localized thumbnail are relative to the page.
     """
+    attributes = {**node.attributes, **localize.urls(self, node)}
+    self.body.append(template.render(**attributes))
 
 
 def depart(self: HTMLTranslator, node: node) -> None:
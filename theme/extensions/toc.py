@@ -0,0 +1,205 @@
+"""\
+Page Table of Contents
+======================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module renders the "On this page" ToC shown in the right sidebar
+of this sphinx theme.
+
+The ToC of a document is derived from its doctree once, right after the
+doctree is read. It's trimmed the same way as before, i.e. the entry of
+the page title is dropped (it would duplicate the sections in the
+scrollspy) and the list left wrapping the sections is unwrapped. The
+result is stored in the build environment as nested tuples of anchors
+and rendered titles, so it's pickled along with the environment and
+only recomputed when the document changes.
+
+The pages then render their ToC using plain string formatting, without
+building a new document or running a docutils publisher per page.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from functools import cache
+
+import docutils.nodes as nodes
+from docutils.frontend import get_default_settings
+from sphinx.builders.html import StandaloneHTMLBuilder
+from sphinx.environment.adapters.toctree import document_toc
+from sphinx.util.docutils import new_document
+from sphinx.writers.html import HTMLWriter
+
+from theme.extensions import rewriter
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+Entry = tuple[str | None, str, tuple["Entry", ...]]
+
+
+@cache
+def settings() -> t.Any:
+    """Return the default settings of Sphinx's HTML writer."""
+    return get_default_settings(HTMLWriter)
+
+
+def title(translator: nodes.NodeVisitor, node: nodes.Element) -> str:
+    """Render the title of a ToC entry to HTML.
+
+    :param translator: HTML translator used for rendering.
+    :param node: Reference node of the entry.
+    :return: Rendered content of the reference.
+    """
+    translator.body.clear()
+    for child in node.children:
+        child.walkabout(translator)
+    return "".join(translator.body)
+
+
+def entries(
+    translator: nodes.NodeVisitor,
+    node: nodes.Element,
+) -> tuple[Entry, ...]:
+    """Derive the trimmed ToC entries from a bullet list.
+
+    The entry pointing to the page itself (the page title) keeps only
+    its children, and a list left with just that entry is unwrapped.
+    Entries left with neither a link nor children are dropped.
+
+    :param translator: HTML translator used for rendering the titles.
+    :param node: Bullet list of the document's ToC.
+    :return: Nested tuples of anchors, titles and child entries.
+    """
+    found: list[Entry] = []
+    for item in node.children:
+        if not isinstance(item, nodes.list_item):
+            continue
+        href: str | None = None
+        text = ""
+        children: tuple[Entry, ...] = ()
+        for child in item.children:
+            if isinstance(child, nodes.bullet_list):
+                children += entries(translator, child)
+                continue
+            reference = child.next_node(nodes.reference)
+            if reference is not None and reference["refuri"] != "#":
+                href = reference["refuri"]
+                text = title(translator, reference)
+        if href is not None or children:
+            found.append((href, text, children))
+    if len(found) == 1 and found[0][0] is None and found[0][2]:
+        return found[0][2]
+    return tuple(found)
+
+
+def render(toc: tuple[Entry, ...]) -> str:
+    """Render the ToC entries of a page to HTML.
+
+    The links are bound to the scrollspy of the right sidebar.
+
+    :param toc: Entries of the page's ToC.
+    :return: Rendered ToC, or an empty string if there are no entries.
+    """
+    if not toc:
+        return ""
+    items: list[str] = []
+    for href, text, children in toc:
+        link = ""
+        if href is not None:
+            attrs: rewriter.Attributes = [
+                ("class", "reference internal"),
+                ("href", href),
+                (":data-current", f"activeSection === '{href}'"),
+            ]
+            link = f"{rewriter.starttag('a', attrs)}{text}</a>"
+        items.append(f"<li>{link}{render(children)}</li>\n")
+    return f"<ul>\n{''.join(items)}</ul>\n"
+
+
+def doctree_read(app: Sphinx, _: nodes.document) -> None:
+    """Derive and store the ToC of the document which was just read.
+
+    This runs after Sphinx has collected the document's ToC, so the
+    `tocdepth` and `only` directives are honoured.
+
+    :param app: The Sphinx application instance.
+    :param _: The document tree which was read (unused).
+    """
+    if not isinstance(app.builder, StandaloneHTMLBuilder):
+        return
+    env = app.env
+    if not hasattr(env, "theme_tocs"):
+        env.theme_tocs = {}
+    toc = document_toc(env, env.docname, app.builder.tags)
+    if not isinstance(toc, nodes.bullet_list):
+        env.theme_tocs[env.docname] = ()
+        return
+    document = new_document("<toc>", settings())
+    translator = app.builder.create_translator(document, app.builder)
+    env.theme_tocs[env.docname] = entries(translator, toc)
+
+
+def env_purge_doc(_: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the ToC of a document which is removed or re-read.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment.
+    :param docname: The name of the document.
+    """
+    if hasattr(env, "theme_tocs"):
+        env.theme_tocs.pop(docname, None)
+
+
+def env_merge_info(
+    _: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the ToCs collected by the parallel reading processes.
+
+    :param _: The Sphinx application instance (unused).
+    :param env: The build environment of the main process.
+    :param docnames: The names of the documents read by the process.
+    :param other: The build environment of the reading process.
+    """
+    if not hasattr(env, "theme_tocs"):
+        env.theme_tocs = {}
+    tocs = getattr(other, "theme_tocs", {})
+    env.theme_tocs.update(
+        (docname, tocs[docname]) for docname in docnames if docname in tocs
+    )
+
+
+def html_page_context(
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, t.Any],
+    doctree: nodes.Node,
+) -> None:
+    """Render the stored ToC of the page being rendered.
+
+    Pages which are not documents (like the general index) have no
+    ToC.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being processed.
+    :param templatename: The name of the HTML template used for
+        rendering.
+    :param context: Context variables passed to the template.
+    :param doctree: The document tree for the current page.
+    """
+    # NOTE(xames3): The parameters `templatename` and `doctree` are
+    # currently unused but are included to match the expected signature
+    # for a Sphinx event handler.
+    templatename = templatename or ""
+    del doctree
+    tocs = getattr(app.env, "theme_tocs", {})
+    context["toc"] = render(tocs.get(pagename, ()))
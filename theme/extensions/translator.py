@@ -0,0 +1,317 @@
+"""\
+Theme HTML Translator
+=====================
+
+Author: Akshay Mestry <xa@mes3.dev>
+Created on: 18 October, 2026
+Last updated on: 18 October, 2026
+
+This module defines a custom HTML translator for this sphinx theme. The
+translator emits the final markup for the theme directly while the
+document is being written, instead of re-reading and rewriting every
+page from disk once the build has finished.
+
+Since the translator runs as part of Sphinx's write phase, the work is
+spread across Sphinx's `-j` workers automatically.
+
+The translator takes care of the following::
+
+    [1] External references open in a new tab with `rel` attributes.
+    [2] Header links copy their URL to the clipboard.
+    [3] Header links of `h2`, `h3` and signatures bind the scrollspy.
+    [4] Empty `toctree-wrapper` divs (hidden toctrees) are skipped.
+    [5] reStructuredText comments are not emitted at all.
+    [6] Branches of the left sidebar's ToC are collapsible.
+
+The left sidebar's ToC is rendered outside of the document body, hence
+it's handled when the page context is created (see `html_page_context`).
+It's made collapsible before it's rendered, so the rendered markup never
+has to be parsed again. The right sidebar's ToC is rendered by
+`theme.extensions.toc`.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from functools import partial
+
+import docutils.nodes as nodes
+from sphinx import addnodes
+from sphinx.environment.adapters.toctree import global_toctree_for_doc
+from sphinx.writers.html import HTMLTranslator as BaseTranslator
+
+from theme.extensions import rewriter
+from theme.extensions.utils import option
+
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
+builders: t.Sequence[str] = ("html", "dirhtml")
+copy: t.Final[str] = "window.navigator.clipboard.writeText($el.href);"
+
+
+class HTMLTranslator(BaseTranslator):
+    """Custom HTML translator for this sphinx theme.
+
+    This class extends Sphinx's `HTMLTranslator` to produce the markup
+    which was earlier produced by post-processing the pages after the
+    build. Every other node is rendered by the base translator as is.
+    """
+
+    def visit_reference(self, node: nodes.reference) -> None:
+        """Open external references in a new tab.
+
+        Only the plain external references (the ones rendered with the
+        `reference external` class) are opened in a new tab, references
+        wrapping images or having custom classes are left alone.
+        """
+        if (
+            not node.get("internal")
+            and "refuri" in node
+            and isinstance(node.parent, nodes.TextElement)
+            and not node["classes"]
+        ):
+            node["target"] = "_blank"
+            node["rel"] = "nofollow noopener"
+        super().visit_reference(node)
+
+    def depart_reference(self, node: nodes.reference) -> None:
+        """Add the toggle button after the links of collapsible branches."""
+        super().depart_reference(node)
+        if "toggle" in node:
+            self.body.append(rewriter.toggle(node["toggle"]))
+
+    def visit_list_item(self, node: nodes.list_item) -> None:
+        """Render the expanded state of collapsible branches."""
+        if "expanded" not in node:
+            super().visit_list_item(node)
+            return
+        expanded = "true" if node["expanded"] else "false"
+        self.body.append(
+            self.starttag(
+                node, "li", "", empty=False, **{"aria-expanded": expanded}
+            )
+        )
+
+    def add_permalink_ref(self, node: nodes.Element, title: str) -> None:
+        """Add a header link which copies its URL to the clipboard.
+
+        The header links of `h2` and `h3` sections and object signatures
+        are also bound to the scrollspy of the right sidebar.
+        """
+        # NOTE(xames3): The parameter `title` is currently unused but is
+        # included to match the signature of the base translator's
+        # method.
+        title = title or ""
+        if not (
+            node["ids"]
+            and self.config.html_permalinks
+            and self.builder.add_permalinks
+        ):
+            return
+        href = f"#{node['ids'][0]}"
+        attrs: rewriter.Attributes = [
+            ("class", "headerlink"),
+            ("href", href),
+            ("@click.prevent", copy),
+            ("aria-label", "Copy link"),
+        ]
+        if self.scrollspy(node):
+            attrs.append(
+                (
+                    "x-intersect.margin.0%.0%.-70%.0%",
+                    f"activeSection = '{href}'",
+                )
+            )
+        icon = self.config.html_permalinks_icon
+        self.body.append(f"{rewriter.starttag('a', attrs)}{icon}</a>")
+
+    def scrollspy(self, node: nodes.Element) -> bool:
+        """Check if the header link of a node binds the scrollspy.
+
+        :param node: Node the header link is added to.
+        :return: `True` if the node is a `h2` or `h3` section, or an
+            object signature.
+        """
+        if isinstance(node, nodes.section):
+            level = self.section_level + self.initial_header_level - 1
+            return level in {2, 3}
+        return isinstance(node, addnodes.desc_signature) and (
+            "sig" in node["classes"]
+        )
+
+    def visit_compound(self, node: nodes.compound) -> None:
+        """Skip `toctree-wrapper` divs left empty by hidden toctrees."""
+        if "toctree-wrapper" in node["classes"] and not node.children:
+            raise nodes.SkipNode
+        super().visit_compound(node)
+
+    def visit_comment(self, _: nodes.comment) -> None:
+        """Skip reStructuredText comments."""
+        raise nodes.SkipNode
+
+    def visit_raw(self, node: nodes.raw) -> None:
+        """Rewrite raw HTML the same way as the rest of the document."""
+        start = len(self.body)
+        try:
+            super().visit_raw(node)
+        except nodes.SkipNode:
+            if "html" in node.get("format", "").split():
+                markup = "".join(self.body[start:])
+                self.body[start:] = [rewriter.fragment(markup)]
+            raise
+
+
+def branches(tree: nodes.Element) -> None:
+    """Mark the branches of the left sidebar's ToC as collapsible.
+
+    Every list item with a nested list is marked as a branch, its nested
+    list gets an ID and the links preceding it get a toggle button. The
+    IDs are numbered in document order, the same way `theme.js` numbers
+    them, so they are identical on every page of the build. The only
+    per page state is whether a branch is expanded, which follows the
+    `current` classes set by Sphinx on the ancestors of the page.
+
+    :param tree: Global ToC of the page, modified in place.
+    """
+    count = 0
+    for item in tree.findall(nodes.list_item):
+        branch = next(
+            (
+                child
+                for child in item.children
+                if isinstance(child, nodes.bullet_list)
+            ),
+            None,
+        )
+        if branch is None:
+            continue
+        links = [
+            link
+            for child in item.children[: item.index(branch)]
+            if isinstance(child, nodes.paragraph)
+            for link in child.children
+            if isinstance(link, nodes.reference)
+        ]
+        if not links:
+            continue
+        count += 1
+        if not branch["ids"]:
+            branch["ids"].append(f"nav-branch-{count}")
+        for link in links:
+            link["toggle"] = branch["ids"][0]
+        if "has-children" not in item["classes"]:
+            item["classes"].append("has-children")
+        item["expanded"] = "current" in item["classes"]
+
+
+def collapsible(
+    app: Sphinx,
+    pagename: str,
+    *,
+    collapse: bool = True,
+    **kwargs: t.Any,
+) -> str:
+    """Render the global ToC of a page with collapsible branches.
+
+    This mirrors the `toctree` template function of Sphinx's HTML
+    builder, except that the branches are marked as collapsible before
+    the ToC is rendered.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being rendered.
+    :param collapse: Boolean flag to collapse the entries which are not
+        ancestors of the page, defaults to `True`.
+    :param kwargs: Other options of the `toctree` template function.
+    :return: The rendered global ToC.
+    """
+    kwargs.setdefault("includehidden", False)
+    if kwargs.get("maxdepth") == "":
+        kwargs.pop("maxdepth")
+    tree = global_toctree_for_doc(
+        app.env, pagename, app.builder, collapse=collapse, **kwargs
+    )
+    if tree is None:
+        return ""
+    branches(tree)
+    return str(app.builder.render_partial(tree)["fragment"])
+
+
+def rewritten(toctree: t.Callable[..., str | None], **kwargs: t.Any) -> str:
+    """Render a global ToC with collapsible branches by rewriting it.
+
+    :param toctree: The `toctree` template function to be rewritten.
+    :param kwargs: Options of the `toctree` template function.
+    :return: The rewritten global ToC.
+    """
+    return rewriter.fragment(toctree(**kwargs) or "", "left")
+
+
+def enabled(app: Sphinx) -> bool:
+    """Check if the pages are rewritten by the theme's translator.
+
+    :param app: The Sphinx application instance.
+    :return: `True` if the translator is in charge of the rewriting.
+    """
+    return (
+        app.builder is not None
+        and app.builder.name in builders
+        and option(app, "postprocess_engine", "translator") == "translator"
+    )
+
+
+def builder_inited(app: Sphinx) -> None:
+    """Register the translator for the HTML builders.
+
+    The translator is only registered if the `postprocess_engine` is set
+    to `translator` (the default) and no other translator is registered
+    for the builder, like the one by a user's extension.
+
+    :param app: The Sphinx application instance.
+    """
+    if enabled(app) and app.builder.name not in app.registry.translators:
+        app.set_translator(app.builder.name, HTMLTranslator)
+
+
+def html_page_context(
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, t.Any],
+    doctree: nodes.Node,
+) -> None:
+    """Make the left sidebar's ToC of the page being rendered collapsible.
+
+    The left sidebar's ToC is rendered lazily by the `toctree` template
+    function, so it's replaced by one which marks the branches of the
+    global ToC as collapsible before rendering it. If the function is
+    overridden by another extension, its output is rewritten instead.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being processed.
+    :param templatename: The name of the HTML template used for
+        rendering.
+    :param context: Context variables passed to the template.
+    :param doctree: The document tree for the current page.
+    """
+    # NOTE(xames3): The parameters `templatename` and `doctree` are
+    # currently unused but are included to match the expected signature
+    # for a Sphinx event handler.
+    templatename = templatename or ""
+    del doctree
+    if not enabled(app):
+        return
+    toctree = context.get("toctree")
+    translator = app.registry.get_translator_class(app.builder)
+    if callable(toctree):
+        if getattr(toctree, "__module__", None) == "sphinx.builders.html" and (
+            issubclass(translator, HTMLTranslator)
+        ):
+            context["toctree"] = partial(collapsible, app, pagename)
+        else:
+            # NOTE(xames3): The `toctree` function is overridden by
+            # another extension (like the one for the 404 page), or the
+            # ToC is rendered by another translator, so its output is
+            # rewritten instead.
+            context["toctree"] = partial(rewritten, toctree)
@@ -4,7 +4,7 @@ Theme Utilities
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 21 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a collection of utility functions used for
 customising this sphinx theme. These utilities focus on enhancing the
@@ -24,55 +24,139 @@ internal APIs and dynamic JavaScript bindings.
 
     Use of `website_options` in favour of `html_context`. This removes
     the need of `register_website_options` function.
+
+.. versionadded:: 18.10.2026
+
+    [1] Added support for post-processing HTML documents in parallel
+        using forked worker processes.
+    [2] Post-processing now runs in a single streaming pass, the
+        BeautifulSoup pipeline is kept as a reference.
+    [3] Post-processing is skipped when the pages are rewritten by the
+        theme's translator while they are being written.
+    [4] Post-processed pages are cached on disk by the hash of their
+        content, so unchanged pages are never post-processed twice.
+    [5] The last updated dates are looked up from a repository-wide
+        index built once per build, instead of running git per document.
+    [6] Every post-processing transform is recorded as a span of the
+        theme's profile, if profiling is enabled.
+    [7] BeautifulSoup is only imported by the reference pipeline, when
+        it's used.
+    [8] The pages written by the build are tracked as they're rendered,
+        so every written page is post-processed exactly once, and the
+        ones left as they were by the previous build are skipped.
+    [9] Added an opt-in minification of the pages as the last step of
+        the post-processing.
+
+.. deprecated:: 18.10.2026
+
+    `remove_title_from_scrollspy` in favour of `theme.extensions.toc`,
+    which derives the ToC of every document once, when it's read.
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
-import shlex
+import shutil
+import tempfile
 import typing as t
 from datetime import datetime as dt
+from functools import partial
 from pathlib import Path
-from subprocess import CalledProcessError
-from subprocess import check_output as co
 
-import bs4
-from docutils import nodes
-from sphinx.environment.adapters.toctree import TocTree
+from sphinx.errors import ConfigError
+from sphinx.util import logging
 from sphinx.util.display import status_iterator
-from sphinx.util.docutils import new_document
+from sphinx.util.parallel import ParallelTasks
+from sphinx.util.parallel import make_chunks
+from sphinx.util.parallel import parallel_available
+
+from theme.extensions import cache
+from theme.extensions import history
+from theme.extensions import profiling
+from theme.extensions import rewriter
 
 
 if t.TYPE_CHECKING:
+    import bs4
+    from docutils import nodes
     from sphinx.application import Sphinx
     from sphinx.environment import BuildEnvironment
 
+logger = logging.getLogger(__name__)
+
+POSTPROCESS_VERSION: t.Final[str] = "1"
+ENGINES: t.Final[tuple[str, ...]] = ("translator", "stream", "bs4")
+MANIFEST: t.Final[str] = "theme-postprocess.json"
 LAST_UPDATED_RE: re.Pattern[str] = re.compile(
     r"^\.\.\s+Last updated on:\s*(.+)$", re.IGNORECASE
 )
 
+written: set[str] = set()
+spool: Path | None = None
+main: int = 0
+
+
+def option(app: Sphinx, name: str, default: t.Any = None) -> t.Any:
+    """Return a theme option configured through `html_context`.
+
+    The theme relies on `html_context` for passing options around, so
+    the build related knobs live there as well. This keeps them in one
+    place alongside the options used by the templates.
+
+    :param app: The Sphinx application instance.
+    :param name: Name of the option to look up.
+    :param default: Value to return if the option is not configured,
+        defaults to `None`.
+    :return: The configured value or the default.
+
+    .. versionadded:: 18.10.2026
+    """
+    return app.config.html_context.get(name, default)
+
+
+def flag(app: Sphinx, name: str, *, default: bool = False) -> bool:
+    """Return a boolean theme option configured through `html_context`.
+
+    The options passed on the command line (`-A name=value`) are
+    strings, unless they're integers, so the usual spellings of false
+    (like `0`, `false`, `no` and `off`) are parsed as `False`.
+
+    :param app: The Sphinx application instance.
+    :param name: Name of the option to look up.
+    :param default: Value to return if the option is not configured,
+        defaults to `False`.
+    :return: The configured value as a boolean or the default.
+
+    .. versionadded:: 18.10.2026
+    """
+    value = option(app, name, default)
+    if isinstance(value, str):
+        return value.strip().lower() not in {"", "0", "false", "no", "off"}
+    return bool(value)
+
+
+def values(
+    app: Sphinx, name: str, default: tuple[t.Any, ...] = ()
+) -> list[t.Any]:
+    """Return a list theme option configured through `html_context`.
+
+    The options passed on the command line (`-A name=value`) are
+    strings, so the lists are accepted as comma separated values too.
+
+    :param app: The Sphinx application instance.
+    :param name: Name of the option to look up.
+    :param default: Values to return if the option is not configured,
+        defaults to an empty tuple.
+    :return: The configured values or the default.
 
-def findall(
-    node: nodes.Node,
-    element: type[nodes.reference | nodes.bullet_list],
-) -> t.Any:
-    """Recursively search through the given docutils node to find all
-    instances of a specified element type.
-
-    This function abstracts the traversal method, ensuring
-    compatibility across different versions of docutils. Depending on
-    the version, it will either use the `findall` method or the older
-    `traverse` method.
-
-    :param node: The starting node from which the search will be
-        performed.
-    :param element: The type of node element to find, such as references
-        or bullet lists.
-    :return: An iterable containing all matching elements found within
-        the given node.
+    .. versionadded:: 18.10.2026
     """
-    findall = "findall" if hasattr(node, "findall") else "traverse"
-    return getattr(node, findall)(element)
+    value = option(app, name, default)
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(",") if part.strip()]
+    return list(value)
 
 
 def make_toc_collapsible(tree: bs4.BeautifulSoup) -> None:
@@ -82,8 +166,12 @@ def make_toc_collapsible(tree: bs4.BeautifulSoup) -> None:
     following ``ul``. The button uses theme CSS for a down chevron via a
     pseudo element. No Alpine attributes or inline SVGs are injected.
 
+    The branches are numbered in document order, so their IDs are the
+    same on every page.
+
     :param tree: Parsed HTML tree to mutate.
     """
+    count = 0
     for link in tree.select("#left-sidebar a"):
         children = link.find_next_sibling("ul")
         if not children:
@@ -91,10 +179,9 @@ def make_toc_collapsible(tree: bs4.BeautifulSoup) -> None:
         parent = link.parent
         if not parent or parent.name != "li":
             continue
+        count += 1
         if not children.get("id"):
-            children["id"] = (  # type: ignore
-                f"nav-branch-{abs(hash(str(children))) % (10**8)}"
-            )
+            children["id"] = f"nav-branch-{count}"  # type: ignore
         current = (
             "current" in (parent.get("class") or [])
             or "current" in (link.get("class") or [])
@@ -142,53 +229,6 @@ def add_scrollspy(tree: bs4.BeautifulSoup) -> None:
             link[":data-current"] = f"activeSection === '{active_link}'"
 
 
-def remove_title_from_scrollspy(
-    app: Sphinx,
-    pagename: str,
-    templatename: str,
-    context: dict[str, t.Any],
-    doctree: nodes.Node,
-) -> None:
-    """Remove redundant title nodes from the ToC to prevent duplicate
-    entries in the scrollspy.
-
-    During Sphinx builds, titles may sometimes appear at both the top
-    level of the ToC and nested within their respective sections. This
-    function traverses the ToC tree, removing nodes where the `refuri`
-    attribute points to `#`, indicating a redundant title entry.
-
-    :param app: The Sphinx application instance.
-    :param pagename: The name of the page being processed.
-    :param templatename: The name of the HTML template used for
-        rendering.
-    :param context: Context variables passed to the template.
-    :param doctree: The document tree for the current page.
-    """
-    # NOTE(xames3): The parameters `pagename`, `templatename`, and
-    # `doctree` are currently unused but are included to match the
-    # expected signature for a Sphinx event handler.
-    pagename = pagename or ""
-    templatename = templatename or ""
-    doctree = doctree or new_document("<partial node>")
-    toc = TocTree(app.builder.env).get_toc_for(pagename, app.builder)
-    for node in findall(toc, nodes.reference):
-        if node["refuri"] == "#":
-            node.parent.parent.remove(node.parent)
-    doc = new_document("<partial node>")
-    doc.append(toc)
-    for node in findall(doc, nodes.bullet_list):
-        if (
-            len(node.children) == 1
-            and isinstance(node.next_node(), nodes.list_item)
-            and isinstance(node.next_node().next_node(), nodes.bullet_list)
-        ):
-            doc.replace(node, node.next_node().next_node())
-    if hasattr(app.builder, "_publisher"):
-        app.builder._publisher.set_source(doc)
-        app.builder._publisher.publish()
-        context["toc"] = app.builder._publisher.writer.parts["fragment"]
-
-
 def remove_empty_toctree_divs(tree: bs4.BeautifulSoup) -> None:
     """Remove empty `toctree-wrapper` divs from the HTML tree.
 
@@ -219,7 +259,9 @@ def remove_comments(tree: bs4.BeautifulSoup) -> None:
 
     :param tree: Parsed HTML tree representing the document structure.
     """
-    for comment in tree.find_all(string=lambda c: isinstance(c, bs4.Comment)):
+    from bs4 import Comment
+
+    for comment in tree.find_all(string=lambda c: isinstance(c, Comment)):
         comment.extract()
 
 
@@ -257,15 +299,14 @@ def open_links_in_new_tab(tree: bs4.BeautifulSoup) -> None:
         link["target"] = "_blank"
 
 
-def postprocess(html: str, app: Sphinx) -> None:
+def postprocess(html: str, app: Sphinx) -> tuple[bool, int]:
     """Perform post-processing on an HTML document after the Sphinx
     build.
 
-    This function reads an HTML file, parses it into a BeautifulSoup
-    tree, applies various transformations — such as adding collapsible
-    navigation, enabling scrollspy, cleaning up empty elements, and
-    removing comments — and finally writes the modified content back to
-    the file.
+    This function reads an HTML file, applies various transformations —
+    such as adding collapsible navigation, enabling scrollspy, cleaning
+    up empty elements, and removing comments — and finally writes the
+    modified content back to the file.
 
     Post-processing ensures that the generated HTML is not only
     functional but also clean, optimised, and dynamic according to the
@@ -274,36 +315,263 @@ def postprocess(html: str, app: Sphinx) -> None:
     :param html: Path to the HTML file to be post-processed.
     :param app: The Sphinx application instance, used to access the
         current build's options and environment.
+    :return: Tuple of a boolean flag, which is `True` if the result was
+        copied from the cache, and the number of bytes saved by
+        minifying the page.
+
+    .. versionchanged:: 18.10.2026
+
+        The transformations are now applied in a single streaming pass
+        by `theme.extensions.rewriter`. The BeautifulSoup pipeline is
+        kept as a reference and can be selected by setting the
+        `postprocess_engine` option to `"bs4"`.
+
+    .. versionchanged:: 18.10.2026
+
+        The post-processed pages are cached by the hash of their content
+        before post-processing, the engine and `POSTPROCESS_VERSION`. On
+        a cache hit, the cached result is copied over instead.
+
+    .. versionchanged:: 18.10.2026
+
+        The page is minified by `theme.extensions.minifier` once it's
+        rewritten, if the `minify_html` option is set. The pages which
+        are rewritten by the translator are only minified.
+    """
+    engine = option(app, "postprocess_engine", "translator")
+    minified = flag(app, "minify_html")
+    store = postprocess_cache(app)
+    key = ""
+    hit = False
+    saved = 0
+    if store is not None:
+        key = postprocess_key(app, cache.filedigest(html))
+        with profiling.span("fetch", "postprocess", page=html):
+            hit = store.fetch(key, html)
+        if hit and minified:
+            saved = int(store.read(cache.digest(key, "saved")) or 0)
+    if not hit:
+        if engine == "bs4":
+            postprocess_tree(html)
+        elif engine != "translator":
+            with profiling.span("rewrite", "postprocess", page=html):
+                rewriter.rewrite(html)
+        if minified:
+            from theme.extensions import minifier
+
+            with profiling.span("minify", "postprocess", page=html):
+                saved = minifier.minify(html)
+        if store is not None:
+            store.store(key, html)
+            if minified:
+                store.write(cache.digest(key, "saved"), str(saved).encode())
+    if minified:
+        logger.verbose(
+            "Minified %s, %d bytes saved",
+            os.path.relpath(html, app.outdir),
+            saved,
+        )
+    return hit, saved
+
+
+def postprocess_cache(app: Sphinx) -> cache.Cache | None:
+    """Return the cache for the post-processed pages.
+
+    The cache can be disabled by setting the `postprocess_cache` option
+    to `False`, and its size (in MiB) is bounded by the
+    `postprocess_cache_size` option.
+
+    :param app: The Sphinx application instance.
+    :return: The cache, or `None` if caching is disabled.
+
+    .. versionadded:: 18.10.2026
+    """
+    if not flag(app, "postprocess_cache", default=True):
+        return None
+    limit = int(option(app, "postprocess_cache_size", 256)) * cache.MiB
+    return cache.Cache(cache.directory(app, "postprocess"), limit)
+
+
+def postprocess_key(app: Sphinx, digest: str) -> str:
+    """Return the key of a post-processed page in the cache.
+
+    :param app: The Sphinx application instance.
+    :param digest: Hash of the page's content before post-processing.
+    :return: Key of the page, which changes with the `postprocess_engine`
+        and `minify_html` options and `POSTPROCESS_VERSION`.
+
+    .. versionadded:: 18.10.2026
     """
-    app = app or None  # Just to satisfy type checkers
-    with open(html, encoding="utf-8") as f:
+    return cache.digest(
+        POSTPROCESS_VERSION,
+        option(app, "postprocess_engine", "translator"),
+        *(("minified",) if flag(app, "minify_html") else ()),
+        digest,
+    )
+
+
+def postprocess_tree(html: str) -> None:
+    """Post-process an HTML document using the BeautifulSoup pipeline.
+
+    This is the reference implementation of the post-processing step.
+    It parses the HTML file into a BeautifulSoup tree, applies each of
+    the transformations one after another and writes the modified tree
+    back to the file.
+
+    :param html: Path to the HTML file to be post-processed.
+
+    .. versionadded:: 18.10.2026
+    """
+    import bs4
+
+    with (
+        profiling.span("parse", "postprocess", page=html),
+        open(html, encoding="utf-8") as f,
+    ):
         tree = bs4.BeautifulSoup(f, "html.parser")
-    open_links_in_new_tab(tree)
-    add_copy_to_headerlinks(tree)
-    make_toc_collapsible(tree)
-    remove_empty_toctree_divs(tree)
-    add_scrollspy(tree)
-    remove_comments(tree)
-    with open(html, "w", encoding="utf-8") as f:
+    for transform in (
+        open_links_in_new_tab,
+        add_copy_to_headerlinks,
+        make_toc_collapsible,
+        remove_empty_toctree_divs,
+        add_scrollspy,
+        remove_comments,
+    ):
+        with profiling.span(transform.__name__, "postprocess", page=html):
+            transform(tree)
+    with (
+        profiling.span("serialise", "postprocess", page=html),
+        open(html, "w", encoding="utf-8") as f,
+    ):
         f.write(str(tree))
 
 
 def env_before_read_docs(
     app: Sphinx, _: BuildEnvironment, docnames: list[str]
 ) -> None:
-    """Track the list of documents modified during the Sphinx build.
-
-    This function captures the list of document names that have been
-    added, updated, or deleted, and stores them in the Sphinx
-    environment for later use. This ensures that post-processing only
-    affects pages that have actually changed, optimising the build
-    process by avoiding unnecessary rework.
+    """Prepare the documents which are about to be read.
 
     :param app: The Sphinx application instance.
     :param _: The current build environment (unused).
     :param docnames: A list of document names that were modified.
+
+    .. versionchanged:: 18.10.2026
+
+        Build the index of last commit dates used by `last_updated_date`
+        before the documents are read.
+
+    .. versionchanged:: 18.10.2026
+
+        The documents to be read are no longer stored for the
+        post-processing, which covers the pages tracked by
+        `html_page_context` instead. The pages rewritten because their
+        toctree or neighbours changed weren't read again, so they were
+        left un-post-processed.
     """
-    app.env.theme_htmls = docnames
+    if docnames:
+        history.build(app)
+
+
+def postprocessed(app: Sphinx) -> bool:
+    """Check if the pages are post-processed after the build.
+
+    :param app: The Sphinx application instance.
+    :return: `True` if the `postprocess_engine` isn't `"translator"` or
+        the `minify_html` option is set.
+
+    .. versionadded:: 18.10.2026
+    """
+    return bool(
+        option(app, "postprocess_engine", "translator") != "translator"
+        or flag(app, "minify_html")
+    )
+
+
+def builder_inited(app: Sphinx) -> None:
+    """Start tracking the pages written by the build.
+
+    The pages are only tracked if they're post-processed after the
+    build (see `postprocessed`).
+
+    :param app: The Sphinx application instance.
+    :raises ConfigError: If the `postprocess_engine` isn't one of
+        `ENGINES`.
+
+    .. versionadded:: 18.10.2026
+    """
+    global spool, main
+    engine = option(app, "postprocess_engine", "translator")
+    if engine not in ENGINES:
+        choices = ", ".join(map(repr, ENGINES))
+        msg = f"Unknown postprocess_engine {engine!r}, expected {choices}"
+        raise ConfigError(msg)
+    written.clear()
+    main = os.getpid()
+    if spool is not None:
+        shutil.rmtree(spool, ignore_errors=True)
+        spool = None
+    if app.builder.name in {"html", "dirhtml"} and postprocessed(app):
+        spool = Path(tempfile.mkdtemp(prefix="theme-pages-"))
+
+
+def html_page_context(
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, t.Any],
+    doctree: nodes.Node,
+) -> None:
+    """Record the output file of a page which is about to be written.
+
+    Every page written by the builder goes through here, including the
+    pages which weren't read again (like the ones whose toctree or
+    neighbours changed) and the generated ones (like the index). The
+    pages written by the forked worker processes are appended to a
+    spool file per process, as the workers exit without returning to
+    the main process.
+
+    :param app: The Sphinx application instance.
+    :param pagename: The name of the page being processed.
+    :param templatename: The name of the HTML template used for
+        rendering.
+    :param context: Context variables passed to the template.
+    :param doctree: The document tree for the current page.
+
+    .. versionadded:: 18.10.2026
+    """
+    # NOTE(xames3): The parameters `templatename`, `context` and
+    # `doctree` are currently unused but are included to match the
+    # expected signature for a Sphinx event handler.
+    templatename = templatename or ""
+    context = context or {}
+    del doctree
+    if spool is None:
+        return
+    html = os.fspath(app.builder.get_outfilename(pagename))
+    pid = os.getpid()
+    if pid == main:
+        written.add(html)
+        return
+    with open(spool / f"{pid}.txt", "a", encoding="utf-8") as f:
+        f.write(f"{html}\n")
+
+
+def pages() -> list[str]:
+    """Return the pages written by the build and stop tracking them.
+
+    :return: Paths to the written HTML files, each listed once.
+
+    .. versionadded:: 18.10.2026
+    """
+    global spool
+    found = set(written)
+    written.clear()
+    if spool is not None:
+        for path in spool.glob("*.txt"):
+            found.update(path.read_text(encoding="utf-8").splitlines())
+        shutil.rmtree(spool, ignore_errors=True)
+        spool = None
+    return sorted(html for html in found if html and os.path.isfile(html))
 
 
 def last_updated_date(app: Sphinx, docname: str, source: list[str]) -> None:
@@ -320,6 +588,12 @@ def last_updated_date(app: Sphinx, docname: str, source: list[str]) -> None:
     :param docname: The name of the document being processed.
     :param source: The source content of the document as a list of
         strings.
+
+    .. versionchanged:: 18.10.2026
+
+        The last commit date is looked up from the index built by
+        `theme.extensions.history`, instead of running git for every
+        document.
     """
     metadata = app.env.metadata.setdefault(docname, {})
     if metadata.get("last_updated"):
@@ -337,20 +611,7 @@ def last_updated_date(app: Sphinx, docname: str, source: list[str]) -> None:
     src = Path(app.env.doc2path(docname, base=True))
     if not src.is_file():
         return
-    on = ""
-    try:
-        cmd = [
-            "git",
-            "log",
-            "--pretty=format:%cd",
-            "--date=format:%B %d, %Y",
-            "-n1",
-            "--",
-            shlex.quote(str(src)),
-        ]
-        on = co(cmd, cwd=app.confdir).decode().strip()  # noqa: S603
-    except (CalledProcessError, FileNotFoundError):
-        on = ""
+    on = history.lookup(src)
     if not on:
         timestamp = src.stat().st_mtime
         try:
@@ -362,6 +623,100 @@ def last_updated_date(app: Sphinx, docname: str, source: list[str]) -> None:
         metadata["last_updated"] = on
 
 
+def postprocess_chunk(
+    htmls: list[str], app: Sphinx
+) -> tuple[int, int, int, int]:
+    """Post-process a chunk of HTML documents inside a worker process.
+
+    :param htmls: Paths to the HTML files to be post-processed.
+    :param app: The Sphinx application instance (inherited by the
+        forked worker).
+    :return: A tuple of the worker's process ID, the number of files
+        it processed, the number of cache hits and the number of bytes
+        saved by minifying them, used for reporting progress per worker.
+
+    .. versionadded:: 18.10.2026
+    """
+    results = [postprocess(html, app) for html in htmls]
+    hits = sum(hit for hit, _ in results)
+    saved = sum(size for _, size in results)
+    return os.getpid(), len(htmls), hits, saved
+
+
+def postprocess_workers(app: Sphinx) -> int:
+    """Return the number of worker processes used for post-processing.
+
+    The count is read from the `postprocess_workers` option, which
+    accepts either a positive integer or `"auto"` (one worker per CPU).
+    If the option is not set, the count follows Sphinx's own `-j` flag.
+
+    :param app: The Sphinx application instance.
+    :return: Number of worker processes, `1` means serial processing.
+
+    .. versionadded:: 18.10.2026
+    """
+    workers = option(app, "postprocess_workers", app.parallel)
+    if workers == "auto":
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def postprocess_parallel(
+    htmls: list[str], app: Sphinx, nproc: int
+) -> tuple[int, int]:
+    """Post-process HTML documents using a pool of forked workers.
+
+    The documents are split into chunks (bounded by the
+    `postprocess_chunksize` option) which are handed over to Sphinx's
+    `ParallelTasks`. Each worker runs the exact same `postprocess` as
+    the serial path, so the output is byte-identical. Any exception
+    raised by a worker is propagated as a `SphinxParallelError`, which
+    fails the build just like the serial path would.
+
+    :param htmls: Paths to the HTML files to be post-processed.
+    :param app: The Sphinx application instance.
+    :param nproc: Number of worker processes to use.
+    :return: Tuple of the number of cache hits and the number of bytes
+        saved by minifying the pages.
+
+    .. versionadded:: 18.10.2026
+    """
+    chunksize = int(option(app, "postprocess_chunksize", 10))
+    chunks = make_chunks(htmls, nproc, maxbatch=max(1, chunksize))
+    progress = status_iterator(
+        chunks,
+        "Postprocessing... ",
+        "darkgreen",
+        len(chunks),
+        app.verbosity,
+    )
+    processed: dict[int, int] = {}
+    hits = 0
+    saved = 0
+
+    def on_chunk_finished(
+        _: list[str], result: tuple[int, int, int, int]
+    ) -> None:
+        """Step the progress bar and tally the files per worker."""
+        nonlocal hits, saved
+        pid, count, cached, minified = result
+        processed[pid] = processed.get(pid, 0) + count
+        hits += cached
+        saved += minified
+        next(progress)
+
+    tasks = ParallelTasks(nproc)
+    for chunk in chunks:
+        tasks.add_task(
+            partial(postprocess_chunk, app=app), chunk, on_chunk_finished
+        )
+    tasks.join()
+    logger.info("")
+    for pid, count in sorted(processed.items()):
+        logger.verbose("Postprocessing worker %d: %d file(s)", pid, count)
+    return hits, saved
+
+
 def build_finished(app: Sphinx, exc: Exception | None) -> None:
     """Post-processes HTML documents after the Sphinx build, applying
     final modifications to the output files.
@@ -369,8 +724,8 @@ def build_finished(app: Sphinx, exc: Exception | None) -> None:
     This function is triggered after the build process is completed. It
     checks if there are any errors, and if the builder is set to produce
     `HTML` or `dirhtml` output. It then applies final transformations
-    to the list of modified documents stored in the environment, such as
-    collapsible navigation, and comment removal.
+    to the pages written by the build, such as collapsible navigation,
+    and comment removal.
 
     :param app: Sphinx application object.
     :param exc: Any exception raised during the build process, or None
@@ -390,19 +745,125 @@ def build_finished(app: Sphinx, exc: Exception | None) -> None:
     :param app: The Sphinx application instance.
     :param exc: An exception raised during the build process, or `None`
         if the build was successful.
+
+    .. versionadded:: 18.10.2026
+
+        Documents are post-processed in parallel when more than one
+        worker is configured via `postprocess_workers` (or `-j`).
+
+    .. versionchanged:: 18.10.2026
+
+        Post-processing is skipped if the `postprocess_engine` is set to
+        `"translator"` (the default), as the pages are already rewritten
+        by `theme.extensions.translator` while they are being written.
+        Set it to `"stream"` or `"bs4"` to post-process the pages after
+        the build instead.
+
+    .. versionchanged:: 18.10.2026
+
+        The post-processing cache is pruned to its size limit once all
+        the pages are post-processed.
+
+    .. versionchanged:: 18.10.2026
+
+        The pages written by the build are post-processed, instead of
+        the documents which were read. The hashes of the written pages
+        are recorded in a manifest in the build's doctree directory, and
+        the written pages whose bytes are unchanged from the previous
+        build are restored from the post-processing cache instead.
+
+    .. versionchanged:: 18.10.2026
+
+        The pages are minified if the `minify_html` option is set, even
+        if they're rewritten by the translator, and the bytes saved are
+        reported per page (verbose) and in total.
     """
+    tracked = pages()
     if exc or app.builder.name not in {"html", "dirhtml"}:
         return
-    if app.builder is not None and app.builder.name not in ["html", "dirhtml"]:
+    if not postprocessed(app):
         return
-    htmls = [app.builder.get_outfilename(html) for html in app.env.theme_htmls]
+    engine = option(app, "postprocess_engine", "translator")
+    minified = flag(app, "minify_html")
+    outdir = Path(app.outdir)
+    manifest = Path(app.doctreedir, MANIFEST)
+    try:
+        previous = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    signature = [POSTPROCESS_VERSION, engine, minified]
+    entries: dict[str, str] = previous.get("files", {})
+    if previous.get("signature") != signature:
+        entries = {}
+    entries = {
+        relpath: digest
+        for relpath, digest in entries.items()
+        if Path(outdir, relpath).is_file()
+    }
+
+    def _relpath(html: str) -> str:
+        return Path(html).relative_to(outdir).as_posix()
+
+    # NOTE(xames3): The written pages are the ones just rendered by
+    # Sphinx, so they're recorded by their hash before post-processing.
+    # An unchanged page is restored from the cache instead, which holds
+    # its post-processed copy under the same hash.
+    store = postprocess_cache(app)
+    digests = {html: cache.filedigest(html) for html in tracked}
+    htmls = [
+        html
+        for html in tracked
+        if store is None
+        or entries.get(_relpath(html)) != digests[html]
+        or not store.fetch(postprocess_key(app, digests[html]), html)
+    ]
+    unchanged = len(tracked) - len(htmls)
     if not htmls:
+        logger.verbose("Postprocessing: %d unchanged page(s)", unchanged)
         return
-    for html in status_iterator(
-        htmls,
-        "Postprocessing... ",
-        "darkgreen",
+    nproc = postprocess_workers(app)
+    if nproc > 1 and len(htmls) > 1 and parallel_available:
+        hits, saved = postprocess_parallel(htmls, app, nproc)
+    else:
+        results = [
+            postprocess(html, app)
+            for html in status_iterator(
+                htmls,
+                "Postprocessing... ",
+                "darkgreen",
+                len(htmls),
+                app.verbosity,
+            )
+        ]
+        hits = sum(hit for hit, _ in results)
+        saved = sum(size for _, size in results)
+    entries.update((_relpath(html), digests[html]) for html in htmls)
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(
+        json.dumps(
+            {"signature": signature, "files": entries},
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    logger.verbose(
+        "Postprocessing: %d written page(s), %d unchanged",
         len(htmls),
-        app.verbosity,
-    ):
-        postprocess(html, app)
+        unchanged,
+    )
+    if minified:
+        logger.info(
+            "Minified %d page(s), %d bytes (%.1f KiB) saved",
+            len(htmls),
+            saved,
+            saved / 1024,
+        )
+    if store is not None:
+        evicted = store.prune()
+        logger.verbose(
+            "Postprocessing cache: %d hit(s), %d miss(es), %d evicted",
+            hits,
+            len(htmls) - hits,
+            evicted,
+        )
@@ -4,7 +4,7 @@ Video Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 22 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `video` directive for this sphinx theme. The
 directive allows embedding a video directly within the document.
@@ -26,24 +26,20 @@ theme's Jinja2 template, producing a final HTML output.
 
 from __future__ import annotations
 
-import os.path as p
 import typing as t
 
 import docutils.nodes as nodes
 import docutils.parsers.rst as rst
-import jinja2
+
+from theme.extensions import templating
 
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "video"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "video.html.jinja")
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+template = templating.template("video.html.jinja")
 
 
 class node(nodes.Element):
@@ -4,7 +4,7 @@ YouTube Directive
 
 Author: Akshay Mestry <xa@mes3.dev>
 Created on: 22 February, 2025
-Last updated on: 02 November, 2025
+Last updated on: 18 October, 2026
 
 This module defines a custom `youtube` directive for this sphinx theme.
 The directive allows embedding a YouTube video directly within the
@@ -23,30 +23,55 @@ follows::
 
 The above snippet will be processed and rendered according to the
 theme's Jinja2 template, producing a final HTML output.
+
+.. versionchanged:: 18.10.2026
+
+    The title of the video is looked up from the metadata cache of
+    `theme.extensions.oembed` instead of being fetched by `pytube` while
+    the document is parsed.
+
+.. versionadded:: 18.10.2026
+
+    Added a click-to-load facade, which renders a poster of the video
+    instead of the player. The player is only loaded once the poster is
+    clicked, and the connections to YouTube are warmed up on hover. It
+    can be enabled per directive using the `facade` option, or for all
+    the videos using the `youtube_facade` option.
 """
 
 from __future__ import annotations
 
-import os.path as p
 import typing as t
 import urllib.parse as urlparse
 
 import docutils.nodes as nodes
 import docutils.parsers.rst as rst
-import jinja2
-import pytube
+
+from theme.extensions import localize
+from theme.extensions import oembed
+from theme.extensions import templating
+from theme.extensions.utils import flag
 
 
 if t.TYPE_CHECKING:
     from sphinx.writers.html import HTMLTranslator
 
 name: t.Final[str] = "youtube"
-here: str = p.dirname(__file__)
-templates: str = "../base/templates"
-html = p.join(p.abspath(p.join(here, templates)), "youtube.html.jinja")
+template = templating.template("youtube.html.jinja")
+
+POSTER_WIDTH: t.Final[int] = 768
 
-with open(html) as f:
-    template = jinja2.Template(f.read())
+
+def toggle(argument: str | None) -> bool:
+    """Convert the argument of a yes or no option.
+
+    :param argument: Argument of the option, where no argument means
+        yes.
+    :return: `True` for yes and `False` for no.
+    :raises ValueError: If the argument is neither yes nor no.
+    """
+    value = (argument or "yes").strip().lower()
+    return rst.directives.choice(value, ("yes", "no")) == "yes"
 
 
 class node(nodes.Element):
@@ -73,6 +98,14 @@ class directive(rst.Directive):
         - `showtitle`: Flag to either display video title.
         - `caption`: Video caption.
         - `startfrom`: Start playing the video from certain point.
+        - `facade`: Render a poster of the video which is replaced by
+          the player on click, `yes` or `no`. Defaults to the
+          `youtube_facade` option.
+
+    .. versionadded:: 18.10.2026
+
+        The `facade` option, which loads the player only once it's
+        needed instead of with the page.
     """
 
     has_content = True
@@ -86,6 +119,7 @@ class directive(rst.Directive):
         "modestbranding": rst.directives.flag,
         "controls": rst.directives.nonnegative_int,
         "playsinline": rst.directives.flag,
+        "facade": toggle,
     }
 
     def run(self) -> list[nodes.Node]:
@@ -104,11 +138,7 @@ class directive(rst.Directive):
         self.assert_has_content()
         raw = self.content.pop()
         src = rst.directives.uri(raw)
-        vid = src
-        if "youtu.be/" in src:
-            vid = src.rsplit("/", 1)[-1].split("?", 1)[0]
-        elif "watch?v=" in src:
-            vid = src.split("v=", 1)[-1].split("&", 1)[0]
+        vid = oembed.video_id(src)
         domain = (
             "https://www.youtube-nocookie.com"
             if "privacy" in self.options
@@ -126,12 +156,30 @@ class directive(rst.Directive):
             params["controls"] = int(self.options["controls"])
         url = f"{domain}/embed/{vid}?{urlparse.urlencode(params)}"
         self.options["url"] = url
-        if "showtitle" in self.options:
-            self.options["caption"] = pytube.YouTube(src).title
-        attributes: dict[str, str] = {}
-        attributes["text"] = template.render(**self.options)
-        attributes["format"] = "html"
-        return [nodes.raw(**attributes)]
+        env = self.state.document.settings.env
+        metadata = oembed.lookup(env.app, vid)
+        if "showtitle" in self.options and metadata.get("title"):
+            self.options["caption"] = metadata["title"]
+        facade = self.options.get("facade")
+        if facade is None:
+            facade = flag(env.app, "youtube_facade")
+        if facade and "autoplay" not in self.options:
+            params["autoplay"] = 1
+            self.options["facade"] = True
+            self.options["facade_url"] = (
+                f"{domain}/embed/{vid}?{urlparse.urlencode(params)}"
+            )
+            self.options["domain"] = domain
+            self.options["watch"] = f"https://www.youtube.com/watch?v={vid}"
+            self.options["title"] = metadata.get("title", "")
+            self.options["poster"] = oembed.THUMBNAIL.format(vid)
+            localized = localize.image(
+                env.app, env, self.options["poster"], POSTER_WIDTH
+            )
+            self.options.update(localized or {})
+        else:
+            self.options["facade"] = False
+        return [node("", **self.options)]
 
 
 def visit(self: HTMLTranslator, node: node) -> None:
@@ -141,12 +189,18 @@ def visit(self: HTMLTranslator, node: node) -> None:
     This method is called when the HTML translator encounters the
     `youtube` node in the document tree. It retrieves the relevant
     attributes from the node (if any) and uses Jinja2 templating to
-    produce the final HTML output. Since the `youtube` node does not
-    require any actions, the method currently acts as a placeholder.
+    produce the final HTML output.
 
     :param self: The HTML translator instance.
     :param node: The `youtube` node being processed.
+
+    .. versionchanged:: 18.10.2026
+
+        The video is rendered here instead of by the directive, so the
+        URLs of the localized poster are relative to the page.
     """
+    attributes = {**node.attributes, **localize.urls(self, node)}
+    self.body.append(template.render(**attributes))
 
 
 def depart(self: HTMLTranslator, node: node) -> None: